@@ -1,79 +1,59 @@
-import csv
 import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from data_profile import profile_file
 
 print("=" * 60)
 print("상세 데이터 분석")
 print("=" * 60)
 
-# 파일 읽기
-data = []
-with open('assets/data/locations.csv', 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f)
-    data = list(reader)
-
-total_records = len(data)
+# 파일을 한 번만 읽어 모든 집계 (scripts/data_profile.py)
+report, _ = profile_file('assets/data/locations.csv')
+total_records = report['total_records']
+coverage = report['coordinate_coverage']
 
 # 좌표 범위 분석
 print("\n10. 좌표 범위 분석")
-latitudes = []
-longitudes = []
-for row in data:
-    try:
-        lat = float(row['latitude']) if row['latitude'] and row['latitude'].strip() else None
-        lng = float(row['longitude']) if row['longitude'] and row['longitude'].strip() else None
-        if lat and lng:
-            latitudes.append(lat)
-            longitudes.append(lng)
-    except:
-        pass
-
-if latitudes and longitudes:
-    print(f"   위도 범위: {min(latitudes):.6f} ~ {max(latitudes):.6f}")
-    print(f"   경도 범위: {min(longitudes):.6f} ~ {max(longitudes):.6f}")
-    print(f"   유효한 좌표 수: {len(latitudes):,}개")
+if coverage['with_coords']:
+    print(f"   위도 범위: {coverage['latitude_range'][0]:.6f} ~ {coverage['latitude_range'][1]:.6f}")
+    print(f"   경도 범위: {coverage['longitude_range'][0]:.6f} ~ {coverage['longitude_range'][1]:.6f}")
+    print(f"   유효한 좌표 수: {coverage['with_coords']:,}개")
+    print(f"   국내 범위 밖 좌표: {coverage['out_of_korea']:,}개")
 
 # 장소명 중복 체크
 print("\n11. 장소명 중복 분석")
-place_names = {}
-for row in data:
-    name = row['place_name']
-    if name not in place_names:
-        place_names[name] = []
-    place_names[name].append({
-        'no': row['no'],
-        'title': row['title'],
-        'address': row['address']
-    })
-
-duplicates = {k: v for k, v in place_names.items() if len(v) > 1}
-print(f"   고유 장소명 수: {len(place_names):,}개")
-print(f"   중복된 장소명 수: {len(duplicates):,}개")
-if duplicates:
-    # 가장 많이 중복된 장소명 상위 10개
-    sorted_dups = sorted(duplicates.items(), key=lambda x: len(x[1]), reverse=True)[:10]
+names = report['duplicates']['place_name']
+print(f"   고유 장소명 수: {names['distinct']:,}개{'' if names['exact'] else ' (추정)'}")
+if names['duplicate_keys'] is not None:
+    print(f"   중복된 장소명 수: {names['duplicate_keys']:,}개")
+else:
+    # 키 수 한도를 넘으면 중복 키 수는 정확히 셀 수 없어 중복 행 수만 표시
+    print(f"   중복된 장소명 수: 집계 불가 (키 수 한도 초과, 중복 행 약 {names['duplicate_rows']:,}개)")
+if names['top']:
     print(f"\n   중복 빈도 상위 10개:")
-    for name, occurrences in sorted_dups:
-        print(f"     {name}: {len(occurrences)}회")
+    for item in names['top'][:10]:
+        print(f"     {item['key']}: {item['count']}회")
         # 서로 다른 작품에 나온 경우
-        titles = set(occ['title'] for occ in occurrences)
-        if len(titles) > 1:
-            print(f"       -> {len(titles)}개 작품에 등장")
+        if item['titles'] > 1:
+            print(f"       -> {item['titles']}개 작품에 등장")
 
 # 데이터 구조 요약
 print("\n12. 데이터 구조 요약")
 structure = {
     'total_records': total_records,
-    'columns': list(data[0].keys()) if data else [],
-    'media_types': list(set(row['media_type'] for row in data)),
-    'place_types': list(set(row['place_type'] for row in data)),
+    'columns': report['columns'],
+    'media_types': report['media_types'],
+    'place_types': report['place_types'],
     'date_range': {
-        'start': min(row['last_updated'] for row in data if row['last_updated']),
-        'end': max(row['last_updated'] for row in data if row['last_updated'])
+        'start': report['date_range']['start'],
+        'end': report['date_range']['end'],
     },
     'coordinate_coverage': {
-        'total': total_records,
-        'with_coords': len(latitudes),
-        'coverage_percent': (len(latitudes) / total_records * 100) if total_records > 0 else 0
+        'total': coverage['total'],
+        'with_coords': coverage['with_coords'],
+        'coverage_percent': coverage['coverage_percent'],
     }
 }
 
@@ -87,6 +67,7 @@ with open('data_structure.json', 'w', encoding='utf-8') as f:
     json.dump(structure, f, ensure_ascii=False, indent=2)
 
 print("\n   데이터 구조가 'data_structure.json' 파일로 저장되었습니다.")
+print("   전체 품질 보고서: python scripts/data_profile.py -> data_profile.json")
 
 print("\n" + "=" * 60)
 print("상세 분석 완료")
@@ -1,14 +1,22 @@
 import csv
+import os
+import sys
 from collections import defaultdict
 
-def check_coordinate_discrepancies(file_path):
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from addresses import normalize_address
+from spatial_index import DEFAULT_RADIUS, near_duplicates
+
+def check_coordinate_discrepancies(file_path, radius=DEFAULT_RADIUS):
     print(f"Analyzing {file_path} for coordinate discrepancies...")
     address_groups = defaultdict(list)
+    rows = []
     
     try:
         with open(file_path, 'r', encoding='utf-8-sig') as f:
             reader = csv.DictReader(f)
             for row in reader:
+                rows.append(row)
                 addr = row.get('address', '').strip()
                 if addr:
                     address_groups[addr].append(row)
@@ -39,8 +47,25 @@ def check_coordinate_discrepancies(file_path):
                 for r in d['entries']:
                     print(f" - {r.get('place_name')} ({r.get('title')}): {r.get('latitude')}, {r.get('longitude')}")
 
+        # Rows a few metres apart with similar names but different address text
+        # (road vs jibun, '서울' vs '서울특별시') - missed by the exact address grouping above
+        nearby = [
+            (i, j, meters, similarity) for i, j, meters, similarity in near_duplicates(rows, radius)
+            if normalize_address(rows[i].get('address')) != normalize_address(rows[j].get('address'))
+        ]
+        if not nearby:
+            print(f"\nNo similar-name rows within {radius:g}m with different addresses.")
+        else:
+            print(f"\nFound {len(nearby)} similar-name row pairs within {radius:g}m with different addresses.")
+            for i, j, meters, similarity in nearby[:10]:
+                a, b = rows[i], rows[j]
+                print(f"\n{meters:.1f}m apart (name similarity {similarity:.2f})")
+                print(f" - {a.get('place_name')} ({a.get('title')}): {a.get('address')}")
+                print(f" - {b.get('place_name')} ({b.get('title')}): {b.get('address')}")
+
     except Exception as e:
         print(f"Error: {e}")
 
 if __name__ == "__main__":
-    check_coordinate_discrepancies("assets/data/locations.csv")
+    radius = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RADIUS
+    check_coordinate_discrepancies("assets/data/locations.csv", radius)
@@ -1,10 +1,20 @@
 import csv
 import os
+import re
 import shutil
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from addresses import road_key
+from entity_resolution import HIGH_CONFIDENCE, UnionFind, branch_name, resolve
+from match_scoring import name_similarity
+from place_ids import SAME_PLACE_NAME_SIMILARITY
 
 INPUT_FILE = "assets/data/locations.csv"
 OUTPUT_FILE = "assets/data/locations_deduped.csv"
 BACKUP_FILE = "assets/data/locations_backup.csv"
+# Floor in the detailed address ('1층', '지하 1층') - different floors in one building are different shops
+FLOOR_PATTERN = re.compile(r'(지하\s*)?(\d+)\s*층')
 
 def norm(s):
     return str(s).strip().replace(' ', '')
@@ -12,6 +22,20 @@ def norm(s):
 def norm_addr(s):
     return str(s).strip().replace(' ', '')
 
+def floor(s):
+    match = FLOOR_PATTERN.search(str(s))
+    return (bool(match.group(1)), match.group(2)) if match else None
+
+def same_place(a, b):
+    """Cluster members are removed only when road address + building number, floor and name agree"""
+    key = road_key(a.get('address'))
+    if key is None or key != road_key(b.get('address')):
+        return False
+    floors = floor(a.get('address', '')), floor(b.get('address', ''))
+    if None not in floors and floors[0] != floors[1]:
+        return False
+    return name_similarity(a.get('place_name'), b.get('place_name')) >= SAME_PLACE_NAME_SIMILARITY
+
 def deduplicate():
     if not os.path.exists(INPUT_FILE):
         print(f"File not found: {INPUT_FILE}")
@@ -31,21 +55,52 @@ def deduplicate():
 
     print(f"Total rows read: {len(rows)}")
 
-    # 1. Group by (Address, Title)
-    # Key: (address_norm, title_norm) -> List of rows
+    # 1. Group by (Place, Title)
+    # Rows with the same normalized address and title, or rows that entity_resolution puts in the
+    # same place cluster (name / address spelling variants, e.g. '목마식당' vs '목마식당 본점') and title
+    # (only high-confidence clusters, since rows are removed). Inside a cluster a row is folded into
+    # another only if same_place() agrees; other pairs are printed for manual review.
+    clusters, stats = resolve(rows, threshold=HIGH_CONFIDENCE)
+    print(f"Place clusters: {stats['clusters']} ({stats['seconds']:.2f}s)")
+
+    # Branch labels: rows of different branches ('강남점' / '홍대점') are never grouped, even through a chain
+    groups = UnionFind(len(rows), [branch_name(row.get('place_name')) for row in rows])
+    first_seen = {}
+    for i, row in enumerate(rows):
+        key = ('address', norm_addr(row.get('address', '')), norm(row.get('title', '')))
+        groups.union(first_seen.setdefault(key, i), i)
+
+    review = []
+    for number, cluster in enumerate(clusters):
+        kept = {}  # title -> representative rows of the cluster
+        for i in cluster.members:
+            representatives = kept.setdefault(norm(rows[i].get('title', '')), [])
+            for j in representatives:
+                if same_place(rows[j], rows[i]):
+                    groups.union(j, i)
+                if groups.find(j) == groups.find(i):
+                    break
+            else:
+                for j in representatives:
+                    if groups.find(j) != groups.find(i):
+                        review.append((rows[j], rows[i]))
+                representatives.append(i)
+
+    if review:
+        print(f"Same cluster but kept (check manually): {len(review)} pairs")
+        for a, b in review:
+            print(f" - {a.get('place_name')} | {a.get('address')}  <->  {b.get('place_name')} | {b.get('address')}"
+                  f"  [{a.get('title')}]")
+
+    # Key: group root -> List of rows
     grouped = {}
-    
-    for row in rows:
-        addr = row.get('address', '')
-        title = row.get('title', '')
-        place_name = row.get('place_name', '')
-        
-        key = (norm_addr(addr), norm(title))
+    for i, row in enumerate(rows):
+        key = groups.find(i)
         if key not in grouped:
             grouped[key] = []
         grouped[key].append(row)
 
-    print(f"Unique (Address, Program) groups: {len(grouped)}")
+    print(f"Unique (Place, Program) groups: {len(grouped)}")
 
     deduped_rows = []
     removed_count = 0
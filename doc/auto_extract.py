@@ -3,11 +3,11 @@ Selenium으로 다이닝코드 페이지에서 JavaScript 실행하여 데이터
 """
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-import time
-import json
 import csv
 from datetime import datetime
 
+from diningcode_harvest import scroll_and_harvest
+
 def extract_data_with_selenium():
     """Selenium으로 브라우저 제어하여 데이터 추출"""
     
@@ -29,35 +29,13 @@ def extract_data_with_selenium():
         print("1. Chrome 브라우저 시작 중...")
         driver = webdriver.Chrome(options=chrome_options)
         
-        # 페이지 열기
+        # 페이지 열기 + 로딩 신호 기반 스크롤 (고정 sleep 없이 새 데이터가 오면 바로 다음 스크롤)
         url = "https://www.diningcode.com/list.dc?query=%EA%B2%BD%EA%B8%B0%EB%8F%84+%EB%A7%9B%EC%9E%88%EB%8A%94%EB%85%80%EC%84%9D%EB%93%A4"
-        print(f"2. 페이지 로딩 중...")
-        driver.get(url)
-        
-        # 페이지 로딩 대기
-        time.sleep(5)
-        
-        print("3. 페이지 스크롤 중 (모든 데이터 로드)...")
-        # 여러 번 스크롤하여 모든 데이터 로드
-        for i in range(10):
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
-            print(f"   스크롤 {i+1}/10...")
-        
-        print("\n4. localStorage에서 데이터 추출 중...")
-        
-        # JavaScript 실행하여 데이터 추출
-        js_code = """
-        let listDataStr = localStorage.getItem('listData');
-        if (!listDataStr) return null;
-        
-        let listData = JSON.parse(listDataStr);
-        if (!listData.poi_section || !listData.poi_section.list) return null;
-        
-        return listData.poi_section.list;
-        """
+        print(f"2. 페이지 로딩 및 스크롤 중 (모든 데이터 로드)...")
+        index = scroll_and_harvest(driver, url)
         
-        restaurants = driver.execute_script(js_code)
+        print("\n3. localStorage에서 데이터 추출 완료")
+        restaurants = index.restaurants
         
         if not restaurants:
             print("❌ 데이터를 찾을 수 없습니다!")
@@ -70,27 +48,19 @@ def extract_data_with_selenium():
         today = datetime.now().strftime('%Y-%m-%d')
         
         for r in restaurants:
-            name = r.get('nm', '')
-            if r.get('branch'):
-                name += ' ' + r['branch']
-            
-            address = r.get('road_addr', '') or r.get('addr', '')
-            lat = r.get('lat', 0.0)
-            lng = r.get('lng', 0.0)
-            
             row = [
                 "0",
                 "show",
                 "맛있는녀석들",
-                name,
+                r['name'],
                 "restaurant",
                 "",
                 "",
                 "",
                 "",
-                address,
-                str(lat),
-                str(lng),
+                r['address'],
+                str(r['lat']),
+                str(r['lng']),
                 "",
                 today
             ]
@@ -106,7 +76,7 @@ def extract_data_with_selenium():
         
     finally:
         if driver:
-            print("\n5. 브라우저 종료 중...")
+            print("\n4. 브라우저 종료 중...")
             driver.quit()
 
 
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+다이닝코드 저장 페이지 일괄 추출
+extract_manifest.csv 에 나열된 (HTML 파일, 방송, 지역) 항목을 프로세스 풀로 병렬 추출하고
+방송/지역별 CSV 를 한 번에 저장 (listData JSON 이 있으면 카드 파싱 없이 좌표까지 추출)
+"""
+
+import argparse
+import csv
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from diningcode_extract import DEFAULT_BACKEND, available_backends, extract_restaurants, save_to_csv
+from extract_cache import CACHE_DIR, ExtractCache, file_hash
+
+MANIFEST_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'extract_manifest.csv')
+
+
+def load_manifest(manifest_file):
+    """매니페스트 CSV 로드 (상대 경로는 매니페스트 위치 기준)"""
+
+    base_dir = os.path.dirname(os.path.abspath(manifest_file))
+    entries = []
+
+    with open(manifest_file, 'r', encoding='utf-8-sig', newline='') as f:
+        for row in csv.DictReader(f):
+            if not row.get('html_file'):
+                continue
+            entries.append({
+                'html_file': os.path.join(base_dir, row['html_file']),
+                'show': row['show'],
+                'region': row['region'],
+                'output_file': row['output_file'],
+            })
+
+    return entries
+
+
+def extract_entry(entry, backend=DEFAULT_BACKEND, stream=False):
+    """워커 프로세스에서 매니페스트 한 항목 추출"""
+
+    restaurants = extract_restaurants(entry['html_file'], backend, stream)
+    return entry, restaurants
+
+
+def run_batch(entries, output_dir, workers=None, backend=DEFAULT_BACKEND, stream=False, cache=None):
+    """모든 항목을 병렬 추출하고 결과 CSV 저장 (cache 가 있으면 변경된 페이지만 파싱)"""
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    start = time.time()
+    saved = 0
+    failed = []
+
+    def save_entry(entry, restaurants, source):
+        nonlocal saved
+        label = f"{entry['show']} {entry['region']}"
+
+        if not restaurants:
+            print(f"❌ {label}: no restaurants extracted")
+            failed.append(entry)
+            return
+
+        output_file = os.path.join(output_dir, entry['output_file'])
+        save_to_csv(restaurants, output_file, entry['show'], verbose=False)
+        saved += 1
+        print(f"✓ {label}: {len(restaurants)} restaurants -> {output_file}{source}")
+
+    # 캐시 적중 항목은 바로 저장, 나머지만 워커로 전달
+    pending = []
+    for entry in entries:
+        key = file_hash(entry['html_file']) if cache else None
+        restaurants = cache.get(key) if cache else None
+        if restaurants is not None:
+            save_entry(entry, restaurants, ' (cached)')
+        else:
+            pending.append((entry, key))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(extract_entry, entry, backend, stream): key for entry, key in pending}
+
+        for future in as_completed(futures):
+            entry, restaurants = future.result()
+            if cache and restaurants:
+                cache.put(futures[future], restaurants)
+            save_entry(entry, restaurants, '')
+
+    elapsed = time.time() - start
+
+    print(f"\n=== Summary ===")
+    print(f"Entries: {len(entries)}, saved: {saved}, failed: {len(failed)}")
+    if cache:
+        print(cache.summary())
+    print(f"Elapsed: {elapsed:.2f}s")
+
+    return failed
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='다이닝코드 저장 페이지 일괄 추출')
+    parser.add_argument('--manifest', default=MANIFEST_FILE, help='추출 매니페스트 CSV')
+    parser.add_argument('--output-dir', default='.', help='CSV 저장 폴더')
+    parser.add_argument('--workers', type=int, default=None, help='프로세스 수 (기본: CPU 코어 수)')
+    parser.add_argument('--show', help='특정 방송만 추출')
+    parser.add_argument('--backend', default=DEFAULT_BACKEND, choices=available_backends(), help='HTML 파서 백엔드')
+    parser.add_argument('--stream', action='store_true', help='PoiBlock 카드 조각만 스트리밍 파싱')
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help='추출 결과 캐시 폴더')
+    parser.add_argument('--no-cache', action='store_true', help='캐시를 사용하지 않고 모두 다시 파싱')
+    args = parser.parse_args()
+
+    print("="*60)
+    print("Batch Extracting DiningCode Restaurant Data")
+    print("="*60)
+
+    entries = load_manifest(args.manifest)
+    if args.show:
+        entries = [e for e in entries if e['show'] == args.show]
+
+    print(f"Manifest entries: {len(entries)}\n")
+
+    cache = None if args.no_cache else ExtractCache(args.cache_dir)
+
+    run_batch(entries, args.output_dir, args.workers, args.backend, args.stream, cache)
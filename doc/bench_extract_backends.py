@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTML 파서 백엔드 벤치마크
+doc/ 의 저장된 다이닝코드 페이지마다 백엔드별 파싱 시간과 초당 레코드 수를 측정하고
+html.parser 결과와 레코드가 동일한지 확인
+"""
+
+import argparse
+import glob
+import io
+import os
+import time
+
+from diningcode_extract import available_backends, parse_cards, stream_cards
+
+DOC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def find_saved_pages(doc_dir):
+    """doc/ 아래 저장된 다이닝코드 페이지 목록"""
+
+    pages = glob.glob(os.path.join(doc_dir, '*다이닝코드*.html'))
+    pages += glob.glob(os.path.join(doc_dir, '*다이닝코드_files', 'list.html'))
+    return sorted(pages)
+
+
+def bench_page(html_content, backend, repeat, stream=False):
+    """한 페이지를 repeat 회 파싱하여 최소 시간과 레코드 반환"""
+
+    best = None
+    records = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if stream:
+            records = stream_cards(io.StringIO(html_content), backend)
+        else:
+            records = parse_cards(html_content, backend)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best, records
+
+
+def run_benchmark(pages, backends, repeat=3, stream=False):
+    """모든 페이지 x 백엔드 조합 측정"""
+
+    totals = {backend: {'seconds': 0.0, 'records': 0, 'mismatch': 0} for backend in backends}
+
+    print(f"{'page':<50} {'backend':<12} {'ms':>9} {'cards':>6} {'rec/s':>10}")
+    print("-" * 92)
+
+    for page in pages:
+        with open(page, 'r', encoding='utf-8') as f:
+            html_content = f.read()
+
+        label = os.path.relpath(page, DOC_DIR)[:50]
+        baseline = None
+
+        for backend in backends:
+            elapsed, records = bench_page(html_content, backend, repeat, stream)
+
+            if baseline is None:
+                baseline = records
+            elif records != baseline:
+                totals[backend]['mismatch'] += 1
+
+            totals[backend]['seconds'] += elapsed
+            totals[backend]['records'] += len(records)
+
+            rate = len(records) / elapsed if elapsed else 0
+            print(f"{label:<50} {backend:<12} {elapsed * 1000:>9.2f} {len(records):>6} {rate:>10.0f}")
+
+    mode = 'stream' if stream else 'full page'
+    print(f"\n=== Summary ({len(pages)} pages, {mode}, best of {repeat}) ===")
+    for backend in backends:
+        t = totals[backend]
+        per_page = t['seconds'] / len(pages) * 1000 if pages else 0
+        rate = t['records'] / t['seconds'] if t['seconds'] else 0
+        print(f"  {backend:<12} {per_page:>9.2f} ms/page  {rate:>10.0f} rec/s  mismatches: {t['mismatch']}")
+
+    return totals
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='다이닝코드 HTML 파서 백엔드 벤치마크')
+    parser.add_argument('--doc-dir', default=DOC_DIR, help='저장 페이지 폴더')
+    parser.add_argument('--repeat', type=int, default=3, help='페이지당 반복 횟수')
+    parser.add_argument('--backend', action='append', choices=available_backends(), help='측정할 백엔드 (반복 지정 가능)')
+    parser.add_argument('--stream', action='store_true', help='PoiBlock 카드 조각 스트리밍 파싱으로 측정')
+    args = parser.parse_args()
+
+    pages = find_saved_pages(args.doc_dir)
+    if not pages:
+        print(f"No saved DiningCode pages found in {args.doc_dir}")
+    else:
+        run_benchmark(pages, args.backend or available_backends(), args.repeat, args.stream)
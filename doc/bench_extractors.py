@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+다이닝코드 추출기 골든 회귀 + 처리량 벤치마크 (오프라인)
+
+1. bench_corpus/ 의 고정 저장 페이지를 각 추출기/파서 백엔드로 추출하여 골든 CSV 와 비교
+2. 추출기별 pages/sec, cards/sec, 최대 RSS 출력 (추출기마다 별도 프로세스에서 측정)
+3. 수천 개 카드의 합성 페이지로 페이지 크기에 따른 확장성 측정
+
+사용법:
+  python bench_extractors.py                  # 골든 비교 + 처리량
+  python bench_extractors.py --scale 100 1000 5000
+  python bench_extractors.py --update-golden  # 현재 기준 추출기 결과로 골든 CSV 갱신
+  python bench_extractors.py --freeze-corpus  # 합성 코퍼스 페이지 재생성
+"""
+
+import argparse
+import contextlib
+import csv
+import glob
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
+from diningcode_extract import available_backends, parse_cards, parse_list_data, poi_to_restaurant, stream_cards
+
+DOC_DIR = os.path.dirname(os.path.abspath(__file__))
+CORPUS_DIR = os.path.join(DOC_DIR, 'bench_corpus')
+
+CARD_FIELDS = ['name', 'area', 'category', 'score', 'user_score', 'review_cnt']
+GOLDEN_FIELDS = CARD_FIELDS + ['address', 'lat', 'lng']
+
+
+# ---------------------------------------------------------------------------
+# 합성 페이지
+# ---------------------------------------------------------------------------
+
+SYNTH_NAMES = ['목마식당', '할매국밥', '바다횟집', '골목칼국수', '시장순대', '원조족발', '옛날짜장', '숯불갈비', '한우곰탕', '두부마을']
+SYNTH_BRANCHES = ['', '', '본점', '2호점', '역삼점']
+SYNTH_AREAS = ['을지로', '성수동', '해운대', '전주 한옥마을', '제주시', '수원역', '강릉']
+SYNTH_CATEGORIES = ['국밥', '칼국수', '회', '족발', '중식', '갈비', '곰탕', '두부요리']
+
+
+def synth_restaurants(n_cards, seed=0):
+    """결정적인 합성 poi 리스트 (listData poi_section.list 형식)"""
+
+    rng = random.Random(seed)
+    pois = []
+    for i in range(n_cards):
+        pois.append({
+            'nm': f"{rng.choice(SYNTH_NAMES)}{i + 1}",
+            'branch': rng.choice(SYNTH_BRANCHES),
+            'road_addr': f"서울 중구 을지로{rng.randint(1, 300)}길 {rng.randint(1, 99)}",
+            'lat': round(37.4 + rng.random() * 0.3, 6),
+            'lng': round(126.8 + rng.random() * 0.4, 6),
+            'category': ', '.join(rng.sample(SYNTH_CATEGORIES, 2)),
+            'score': rng.randint(60, 99),
+            'user_score': round(rng.uniform(3.0, 5.0), 1),
+            'review_cnt': rng.randint(0, 500),
+            'area': [rng.choice(SYNTH_AREAS)],
+        })
+    return pois
+
+
+def synth_card(idx, poi):
+    """poi 하나를 다이닝코드 PoiBlock 카드 마크업으로 변환"""
+
+    name = poi_to_restaurant(poi)['name']
+    categories = ''.join(f'<span class="Category">{c}</span>' for c in poi['category'].split(', '))
+    return (
+        f'<a class="PoiBlock" href="/profile.php?rid=R{idx:05d}">'
+        f'<div class="InfoHeader"><h2><span class="number-prefix">{idx}. </span>'
+        f'<span class="Info__Title__Place">{name} <span>{poi["area"][0]}</span></span></h2></div>'
+        f'<div class="CategoryContainer">{categories}</div>'
+        f'<p class="Score"><span>{poi["score"]}</span>점</p>'
+        f'<p class="UserScore"><span class="score-text">{poi["user_score"]}</span>'
+        f'<span class="count-text">({poi["review_cnt"]}명)</span></p></a>\n'
+    )
+
+
+def synth_page(n_cards, with_list_data=True, seed=0, filler_kb=64):
+    """저장 페이지와 같은 구조의 합성 HTML (스크립트/헤더/푸터 포함)"""
+
+    pois = synth_restaurants(n_cards, seed)
+    filler = '/* vendor bundle */ var _x = "' + 'a' * 1024 + '";\n'
+
+    parts = ['<!DOCTYPE html><html><head><meta charset="utf-8"><title>합성 맛집 - 다이닝코드</title>']
+    parts.append('<script>' + filler * filler_kb + '</script>')
+    if with_list_data:
+        data = {'poi_section': {'total_cnt': n_cards, 'list': pois}}
+        literal = json.dumps(data, ensure_ascii=True).replace('"', '\\"')
+        parts.append(f"<script>localStorage.setItem('listData', '{literal}');</script>")
+    parts.append('</head><body><header><nav><a href="/">다이닝코드</a></nav></header><main>')
+    parts.extend(synth_card(i, poi) for i, poi in enumerate(pois, 1))
+    parts.append('</main><footer><a href="/terms">약관</a></footer></body></html>')
+    return ''.join(parts)
+
+
+def freeze_corpus(corpus_dir):
+    """고정 코퍼스 페이지 생성 (카드만 있는 페이지 / listData 포함 페이지)"""
+
+    os.makedirs(corpus_dir, exist_ok=True)
+    pages = {
+        'cards_only.html': synth_page(40, with_list_data=False, seed=1, filler_kb=16),
+        'list_data.html': synth_page(60, with_list_data=True, seed=2, filler_kb=16),
+    }
+    for filename, html in pages.items():
+        with open(os.path.join(corpus_dir, filename), 'w', encoding='utf-8') as f:
+            f.write(html)
+        print(f"✓ wrote {filename}")
+
+
+# ---------------------------------------------------------------------------
+# 추출기 목록 (이름 -> 파일 경로를 받아 레코드 리스트 또는 None 반환)
+# ---------------------------------------------------------------------------
+
+def _read(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def _legacy_cards(path):
+    import extract_from_cards
+    return extract_from_cards.extract_from_html_cards(path)
+
+
+def _legacy_saved_html(path):
+    import extract_from_saved_html
+    pois = extract_from_saved_html.extract_from_html(path)
+    return [poi_to_restaurant(poi) for poi in pois] if pois else None
+
+
+def _legacy_html_elements(path):
+    # 카드 탐색 진단용 스크립트라 레코드를 반환하지 않음 (시간만 측정)
+    import parse_html_elements
+    parse_html_elements.extract_from_html_elements(path)
+    return None
+
+
+def extractor_registry():
+    """측정 대상 추출기"""
+
+    registry = {}
+    for backend in available_backends():
+        registry[f"cards:{backend}"] = lambda path, b=backend: parse_cards(_read(path), b)
+        registry[f"stream:{backend}"] = lambda path, b=backend: stream_cards(io.StringIO(_read(path)), b)
+    registry['listdata'] = lambda path: parse_list_data(_read(path))
+    registry['extract_from_cards.py'] = _legacy_cards
+    registry['extract_from_saved_html.py'] = _legacy_saved_html
+    registry['parse_html_elements.py'] = _legacy_html_elements
+    return registry
+
+
+def _max_rss_mb():
+    """현재 프로세스 최대 RSS (MB)"""
+
+    if not RESOURCE_AVAILABLE:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS 는 바이트, Linux 는 KB 단위
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+
+def run_extractor(name, paths, repeat=1):
+    """별도 프로세스에서 실행: 추출기 하나로 모든 페이지 추출 후 시간/레코드/RSS 반환"""
+
+    extract = extractor_registry()[name]
+    outputs = {}
+    seconds = 0.0
+
+    for path in paths:
+        best = None
+        for _ in range(repeat):
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                records = extract(path)
+                elapsed = time.perf_counter() - start
+            if best is None or elapsed < best:
+                best = elapsed
+        seconds += best
+        outputs[path] = records
+
+    return {'seconds': seconds, 'outputs': outputs, 'max_rss_mb': _max_rss_mb()}
+
+
+def measure(name, paths, repeat=1):
+    """새 프로세스에서 측정하여 다른 추출기의 메모리 사용량이 섞이지 않게 함"""
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        return executor.submit(run_extractor, name, paths, repeat).result()
+
+
+# ---------------------------------------------------------------------------
+# 골든 비교
+# ---------------------------------------------------------------------------
+
+def golden_path(page):
+    return os.path.splitext(page)[0] + '.golden.csv'
+
+
+def load_golden(page):
+    path = golden_path(page)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        return list(csv.DictReader(f))
+
+
+def write_golden(page, records):
+    with open(golden_path(page), 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=GOLDEN_FIELDS)
+        writer.writeheader()
+        for record in records:
+            writer.writerow({field: record.get(field, '') for field in GOLDEN_FIELDS})
+
+
+def compare_to_golden(records, golden):
+    """추출기가 내는 필드만 문자열로 비교 (불일치 설명 또는 None 반환)"""
+
+    if len(records) != len(golden):
+        return f"{len(records)} records, golden has {len(golden)}"
+
+    fields = [f for f in GOLDEN_FIELDS if records and f in records[0]]
+    for idx, (record, expected) in enumerate(zip(records, golden), 1):
+        for field in fields:
+            if str(record.get(field, '')) != expected.get(field, ''):
+                return f"row {idx} {field}: {record.get(field)!r} != {expected.get(field)!r}"
+    return None
+
+
+def update_golden(pages):
+    """기준 추출기(listData 우선, 없으면 html.parser 카드)로 골든 CSV 갱신"""
+
+    for page in pages:
+        html = _read(page)
+        records = parse_list_data(html)
+        if records is None:
+            records = parse_cards(html)
+        write_golden(page, records)
+        print(f"✓ {os.path.basename(golden_path(page))}: {len(records)} records")
+
+
+def run_regression(pages, names, repeat):
+    """코퍼스 골든 비교 + 처리량 표 출력, 실패 건수 반환"""
+
+    failures = 0
+    print(f"{'extractor':<28} {'pages/s':>9} {'cards/s':>10} {'rss MB':>8}  golden")
+    print("-" * 80)
+
+    for name in names:
+        result = measure(name, pages, repeat)
+        records_total = 0
+        verdicts = []
+
+        for page in pages:
+            records = result['outputs'][page]
+            label = os.path.basename(page)
+            if records is None:
+                verdicts.append(f"{label}: n/a")
+                continue
+            records_total += len(records)
+            golden = load_golden(page)
+            problem = compare_to_golden(records, golden) if golden is not None else 'no golden'
+            if problem:
+                failures += 1
+                verdicts.append(f"{label}: FAIL ({problem})")
+            else:
+                verdicts.append(f"{label}: ok")
+
+        seconds = result['seconds'] or float('inf')
+        rss = f"{result['max_rss_mb']:.1f}" if result['max_rss_mb'] is not None else 'n/a'
+        print(f"{name:<28} {len(pages) / seconds:>9.1f} {records_total / seconds:>10.0f} {rss:>8}  {'; '.join(verdicts)}")
+
+    return failures
+
+
+def run_scaling(sizes, names):
+    """합성 대형 페이지로 카드 수에 따른 추출 시간 측정"""
+
+    print(f"\n{'extractor':<28} " + ' '.join(f"{n:>10}" for n in sizes) + "   (ms/page, rss MB)")
+    print("-" * (30 + 11 * len(sizes) + 20))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = []
+        for n in sizes:
+            path = os.path.join(tmp_dir, f"synth_{n}.html")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(synth_page(n, with_list_data=True, seed=n))
+            paths.append(path)
+
+        for name in names:
+            cells = []
+            rss = None
+            for path in paths:
+                result = measure(name, [path])
+                cells.append(f"{result['seconds'] * 1000:>10.1f}")
+                rss = result['max_rss_mb']
+            rss_text = f"{rss:.1f}" if rss is not None else 'n/a'
+            print(f"{name:<28} " + ' '.join(cells) + f"   {rss_text}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='다이닝코드 추출기 골든 회귀 + 처리량 벤치마크')
+    parser.add_argument('--corpus-dir', default=CORPUS_DIR, help='고정 코퍼스 폴더 (*.html + *.golden.csv)')
+    parser.add_argument('--extractor', action='append', help='측정할 추출기 (반복 지정 가능)')
+    parser.add_argument('--repeat', type=int, default=3, help='페이지당 반복 횟수')
+    parser.add_argument('--scale', type=int, nargs='*', help='합성 페이지 카드 수 (예: 100 1000 5000)')
+    parser.add_argument('--update-golden', action='store_true', help='골든 CSV 갱신')
+    parser.add_argument('--freeze-corpus', action='store_true', help='합성 코퍼스 페이지 재생성')
+    args = parser.parse_args()
+
+    if args.freeze_corpus:
+        freeze_corpus(args.corpus_dir)
+
+    pages = sorted(glob.glob(os.path.join(args.corpus_dir, '*.html')))
+
+    if args.update_golden:
+        update_golden(pages)
+
+    names = args.extractor or list(extractor_registry())
+
+    print("="*60)
+    print(f"Extractor regression: {len(pages)} corpus pages")
+    print("="*60)
+    failures = run_regression(pages, names, args.repeat)
+
+    if args.scale:
+        run_scaling(args.scale, names)
+
+    if failures:
+        print(f"\n❌ {failures} golden mismatches")
+        sys.exit(1)
+    print("\n✓ All extractors match golden output")
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+헤드리스 브라우저 풀 다중 검색 수집
+브라우저를 풀 크기만큼 한 번만 띄워 두고 (방송, 지역) 검색 URL 들을 나눠 처리
+각 브라우저의 수집 결과는 공용 중복 제거 단계를 거쳐 방송별 CSV 로 저장
+
+로컬 테스트:
+  python browser_pool.py --serve --timeout 2   # extract_manifest.csv 의 저장 페이지를 로컬 서버로 제공하여 수집
+"""
+
+import argparse
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote_plus, urlparse
+
+from batch_extract import MANIFEST_FILE, load_manifest
+from diningcode_extract import save_to_csv
+from diningcode_harvest import LOAD_TIMEOUT, scroll_and_harvest
+from scrape_with_selenium import setup_driver
+
+DININGCODE_LIST_URL = 'https://www.diningcode.com/list.dc'
+
+
+def build_query_url(show, region, base_url=DININGCODE_LIST_URL):
+    """다이닝코드 검색 URL (예: list.dc?query=서울+맛있는녀석들)"""
+
+    return f"{base_url}?query={quote_plus(f'{region} {show}')}"
+
+
+class SharedDedup:
+    """여러 브라우저에서 들어오는 레코드를 방송별 (이름+지점, 주소) 키로 중복 제거"""
+
+    def __init__(self):
+        self.records = {}
+        self._keys = {}
+        self._lock = threading.Lock()
+
+    def add(self, show, records):
+        """새 레코드만 추가하고 추가된 개수 반환"""
+
+        added = 0
+        with self._lock:
+            keys = self._keys.setdefault(show, set())
+            bucket = self.records.setdefault(show, [])
+            for record in records:
+                key = (record['name'], record['address'])
+                if key in keys:
+                    continue
+                keys.add(key)
+                bucket.append(record)
+                added += 1
+        return added
+
+
+class BrowserPool:
+    """브라우저 인스턴스를 재사용하는 풀 (시작 비용은 풀 생성 시 한 번만)"""
+
+    def __init__(self, size, driver_factory=setup_driver):
+        # 브라우저 시작이 가장 느리므로 병렬로 띄움
+        # 하나라도 실패하면 이미 뜬 브라우저를 모두 닫고 예외를 다시 발생 (headless Chrome 프로세스가 남지 않도록)
+        self.drivers = []
+        error = None
+        with ThreadPoolExecutor(max_workers=size) as executor:
+            futures = [executor.submit(driver_factory) for _ in range(size)]
+            for future in futures:
+                try:
+                    self.drivers.append(future.result())
+                except BaseException as e:
+                    error = error or e
+        if error is not None:
+            self.close()
+            raise error
+
+        self._idle = queue.Queue()
+        for driver in self.drivers:
+            self._idle.put(driver)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        for driver in self.drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                print(f"Error closing browser: {e}")
+
+    def run(self, func, items):
+        """items 를 빈 브라우저에 하나씩 배정하여 func(driver, item) 실행, (item, 결과) yield"""
+
+        def task(item):
+            driver = self._idle.get()
+            try:
+                return func(driver, item)
+            finally:
+                self._idle.put(driver)
+
+        with ThreadPoolExecutor(max_workers=len(self.drivers)) as executor:
+            futures = {executor.submit(task, item): item for item in items}
+            for future in as_completed(futures):
+                item = futures[future]
+                try:
+                    yield item, future.result()
+                except Exception as e:
+                    print(f"❌ {item['show']} {item['region']}: {e}")
+                    yield item, None
+
+
+def harvest_queries(queries, pool_size=4, timeout=LOAD_TIMEOUT, driver_factory=setup_driver):
+    """(show, region, url) 목록을 브라우저 풀로 수집하여 SharedDedup 반환"""
+
+    dedup = SharedDedup()
+
+    def harvest(driver, query):
+        return scroll_and_harvest(driver, query['url'], timeout=timeout).restaurants
+
+    start = time.time()
+    with BrowserPool(pool_size, driver_factory) as pool:
+        print(f"브라우저 {pool_size}개 시작 완료 ({time.time() - start:.1f}초)\n")
+
+        for query, records in pool.run(harvest, queries):
+            if records is None:
+                continue
+            added = dedup.add(query['show'], records)
+            print(f"✓ {query['show']} {query['region']}: {len(records)}개 수집, 신규 {added}개")
+
+    print(f"\n전체 소요 시간: {time.time() - start:.1f}초")
+    return dedup
+
+
+def serve_manifest_pages(entries, port=0):
+    """매니페스트의 저장 페이지를 list.dc?query=<지역> <방송> 로 제공하는 로컬 서버 (백그라운드 스레드)"""
+
+    pages = {f"{e['region']} {e['show']}": e['html_file'] for e in entries}
+
+    class Handler(SimpleHTTPRequestHandler):
+        def do_GET(self):
+            query = parse_qs(urlparse(self.path).query).get('query', [''])[0]
+            html_file = pages.get(query)
+            if not html_file or not os.path.exists(html_file):
+                self.send_error(404)
+                return
+            with open(html_file, 'rb') as f:
+                body = f.read()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='헤드리스 브라우저 풀로 다이닝코드 다중 검색 수집')
+    parser.add_argument('--manifest', default=MANIFEST_FILE, help='(방송, 지역) 목록으로 쓸 매니페스트 CSV')
+    parser.add_argument('--show', help='특정 방송만 수집')
+    parser.add_argument('--size', type=int, default=4, help='브라우저 풀 크기')
+    parser.add_argument('--timeout', type=float, default=LOAD_TIMEOUT, help='스크롤 후 새 데이터 대기 시간 (초)')
+    parser.add_argument('--output-dir', default='.', help='CSV 저장 폴더')
+    parser.add_argument('--serve', action='store_true', help='실제 사이트 대신 매니페스트의 저장 페이지를 로컬 서버로 제공')
+    args = parser.parse_args()
+
+    entries = load_manifest(args.manifest)
+    if args.show:
+        entries = [e for e in entries if e['show'] == args.show]
+
+    base_url = DININGCODE_LIST_URL
+    server = None
+    if args.serve:
+        server = serve_manifest_pages(entries)
+        base_url = f"http://127.0.0.1:{server.server_address[1]}/list.dc"
+        print(f"로컬 서버: {base_url}")
+
+    queries = [
+        {'show': e['show'], 'region': e['region'], 'url': build_query_url(e['show'], e['region'], base_url)}
+        for e in entries
+    ]
+
+    print("="*60)
+    print(f"Browser pool harvest: {len(queries)} queries, {args.size} browsers")
+    print("="*60)
+
+    try:
+        dedup = harvest_queries(queries, args.size, args.timeout)
+    finally:
+        if server:
+            server.shutdown()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    for show, records in dedup.records.items():
+        save_to_csv(records, os.path.join(args.output_dir, f"{show}.csv"), show, verbose=False)
+        print(f"✓ {show}: {len(records)} restaurants saved")
@@ -0,0 +1,568 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+다이닝코드 저장 페이지 공용 추출 엔진
+doc/extract_<방송>_<지역>.py 로 복제되어 있던 extract_from_html_cards / save_to_csv 를 하나로 통합
+"""
+
+from bs4 import BeautifulSoup
+import csv
+from datetime import datetime
+import json
+import re
+import os
+
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# 추출 로직(필드 매핑, JSON 디코딩)이 바뀌면 올려서 extract_cache 를 무효화
+EXTRACTOR_VERSION = 1
+
+FIELDNAMES = ['id', 'sector', 'title', 'name', 'type', 'chef', 'address', 'lat', 'lng', 'date', 'area', 'user_score', 'review_cnt']
+
+# 파서 백엔드: html.parser (기본, 순수 파이썬) / lxml / selectolax (lexbor, CSS 셀렉터 기반)
+DEFAULT_BACKEND = 'html.parser'
+
+
+def _parse_cards_bs4(html_content, features):
+    """BeautifulSoup (html.parser / lxml) 로 PoiBlock 카드 파싱"""
+
+    soup = BeautifulSoup(html_content, features)
+
+    # 식당 카드 찾기
+    poi_blocks = soup.find_all('a', class_='PoiBlock')
+
+    restaurants = []
+
+    for idx, block in enumerate(poi_blocks, 1):
+        try:
+            # 식당명
+            title_elem = block.find('h2')
+            if title_elem:
+                # number-prefix 제거
+                prefix = title_elem.find('span', class_='number-prefix')
+                if prefix:
+                    prefix.extract()
+
+                # Info__Title__Place에서 이름 추출
+                place_span = title_elem.find('span', class_='Info__Title__Place')
+                if place_span:
+                    # 지역명 분리
+                    area_span = place_span.find('span')
+                    area = area_span.text.strip() if area_span else ''
+
+                    # area_span 제거 후 이름 추출
+                    if area_span:
+                        area_span.extract()
+
+                    name = place_span.text.strip()
+                else:
+                    name = title_elem.text.strip()
+                    area = ''
+            else:
+                name = ''
+                area = ''
+
+            # 카테고리
+            category_container = block.find('div', class_='CategoryContainer')
+            categories = []
+            if category_container:
+                cat_spans = category_container.find_all('span', class_='Category')
+                for cat in cat_spans:
+                    categories.append(cat.text.strip())
+            category = ', '.join(categories) if categories else ''
+
+            # 평점
+            score_elem = block.find('p', class_='Score')
+            score = score_elem.find('span').text.strip() if score_elem and score_elem.find('span') else ''
+
+            # 사용자 평점
+            user_score_elem = block.find('p', class_='UserScore')
+            user_score = ''
+            review_cnt = ''
+            if user_score_elem:
+                score_text = user_score_elem.find('span', class_='score-text')
+                count_text = user_score_elem.find('span', class_='count-text')
+
+                if score_text:
+                    user_score = score_text.text.strip()
+
+                if count_text:
+                    # "(4명)" 형식에서 숫자만 추출
+                    count_match = re.search(r'(\d+)', count_text.text)
+                    if count_match:
+                        review_cnt = count_match.group(1)
+
+            restaurants.append({
+                'name': name,
+                'area': area,
+                'category': category,
+                'score': score,
+                'user_score': user_score,
+                'review_cnt': review_cnt
+            })
+
+        except Exception as e:
+            print(f"Error parsing restaurant {idx}: {e}")
+            continue
+
+    return restaurants
+
+
+def _find_descendant(node, selector):
+    """node 자신을 제외한 첫 번째 하위 요소 (BeautifulSoup find 와 동일한 범위)"""
+
+    for match in node.css(selector):
+        if match.mem_id != node.mem_id:
+            return match
+    return None
+
+
+def _parse_cards_selectolax(html_content):
+    """selectolax CSS 셀렉터로 PoiBlock 카드 파싱 (BeautifulSoup 경로와 필드 매핑 동일)"""
+
+    tree = LexborHTMLParser(html_content)
+
+    restaurants = []
+
+    for idx, block in enumerate(tree.css('a.PoiBlock'), 1):
+        try:
+            # 식당명
+            title_elem = _find_descendant(block, 'h2')
+            if title_elem is not None:
+                # number-prefix 제거
+                prefix = _find_descendant(title_elem, 'span.number-prefix')
+                if prefix is not None:
+                    prefix.decompose()
+
+                # Info__Title__Place에서 이름 추출
+                place_span = _find_descendant(title_elem, 'span.Info__Title__Place')
+                if place_span is not None:
+                    # 지역명 분리
+                    area_span = _find_descendant(place_span, 'span')
+                    area = area_span.text().strip() if area_span is not None else ''
+
+                    # area_span 제거 후 이름 추출
+                    if area_span is not None:
+                        area_span.decompose()
+
+                    name = place_span.text().strip()
+                else:
+                    name = title_elem.text().strip()
+                    area = ''
+            else:
+                name = ''
+                area = ''
+
+            # 카테고리
+            category_container = _find_descendant(block, 'div.CategoryContainer')
+            categories = []
+            if category_container is not None:
+                categories = [cat.text().strip() for cat in category_container.css('span.Category')]
+            category = ', '.join(categories) if categories else ''
+
+            # 평점
+            score_elem = _find_descendant(block, 'p.Score')
+            score_span = _find_descendant(score_elem, 'span') if score_elem is not None else None
+            score = score_span.text().strip() if score_span is not None else ''
+
+            # 사용자 평점
+            user_score_elem = _find_descendant(block, 'p.UserScore')
+            user_score = ''
+            review_cnt = ''
+            if user_score_elem is not None:
+                score_text = _find_descendant(user_score_elem, 'span.score-text')
+                count_text = _find_descendant(user_score_elem, 'span.count-text')
+
+                if score_text is not None:
+                    user_score = score_text.text().strip()
+
+                if count_text is not None:
+                    # "(4명)" 형식에서 숫자만 추출
+                    count_match = re.search(r'(\d+)', count_text.text())
+                    if count_match:
+                        review_cnt = count_match.group(1)
+
+            restaurants.append({
+                'name': name,
+                'area': area,
+                'category': category,
+                'score': score,
+                'user_score': user_score,
+                'review_cnt': review_cnt
+            })
+
+        except Exception as e:
+            print(f"Error parsing restaurant {idx}: {e}")
+            continue
+
+    return restaurants
+
+
+def available_backends():
+    """현재 환경에서 사용 가능한 파서 백엔드 목록"""
+
+    backends = ['html.parser']
+    if LXML_AVAILABLE:
+        backends.append('lxml')
+    if SELECTOLAX_AVAILABLE:
+        backends.append('selectolax')
+    return backends
+
+
+def parse_cards(html_content, backend=DEFAULT_BACKEND):
+    """HTML 문자열에서 PoiBlock 카드 목록을 식당 dict 리스트로 변환"""
+
+    if backend not in ('html.parser', 'lxml', 'selectolax'):
+        raise ValueError(f"Unknown parser backend: {backend}")
+    if backend not in available_backends():
+        raise ValueError(f"Parser backend not installed: {backend}")
+
+    if backend == 'selectolax':
+        return _parse_cards_selectolax(html_content)
+    return _parse_cards_bs4(html_content, backend)
+
+
+# 스트리밍 스캐너: <a class="... PoiBlock ..."> 시작 태그와 카드 내부의 <a> / </a> 토큰
+POI_BLOCK_START = re.compile(r"""<a\s[^>]*class\s*=\s*["'][^"']*\bPoiBlock\b[^"']*["'][^>]*>""", re.I)
+ANCHOR_TOKEN = re.compile(r'<(/?)a[\s>]', re.I)
+
+STREAM_CHUNK_SIZE = 64 * 1024
+STREAM_CARDS_PER_PARSE = 32
+
+
+def iter_card_fragments(f, chunk_size=STREAM_CHUNK_SIZE):
+    """파일을 청크 단위로 읽으며 PoiBlock 카드 마크업 조각만 yield
+
+    페이지 전체 DOM 을 만들지 않으므로 메모리는 청크 크기 + 카드 하나 크기로 제한된다.
+    """
+
+    buffer = ''
+    eof = False
+
+    while True:
+        match = POI_BLOCK_START.search(buffer)
+
+        if match is None:
+            if eof:
+                return
+            # 시작 태그가 청크 경계에 걸칠 수 있으므로 마지막 '<' 이후는 남김
+            cut = buffer.rfind('<')
+            buffer = buffer[cut:] if cut != -1 else ''
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer += chunk
+            continue
+
+        buffer = buffer[match.start():]
+        pos = match.end() - match.start()
+        depth = 1
+
+        while depth:
+            token = ANCHOR_TOKEN.search(buffer, pos)
+            if token is None:
+                if eof:
+                    # 닫히지 않은 카드는 남은 전체를 조각으로 사용
+                    yield buffer
+                    return
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer += chunk
+                continue
+
+            depth += -1 if token.group(1) else 1
+            pos = token.end()
+
+        end = buffer.find('>', pos - 1)
+        end = len(buffer) if end == -1 else end + 1
+        yield buffer[:end]
+        buffer = buffer[end:]
+
+
+def stream_cards(f, backend=DEFAULT_BACKEND, cards_per_parse=STREAM_CARDS_PER_PARSE):
+    """카드 조각을 모아 일정 개수씩만 파싱 (파싱 비용이 페이지 크기가 아닌 카드 수에 비례)"""
+
+    restaurants = []
+    batch = []
+
+    for fragment in iter_card_fragments(f):
+        batch.append(fragment)
+        if len(batch) >= cards_per_parse:
+            restaurants.extend(parse_cards(''.join(batch), backend))
+            batch = []
+
+    if batch:
+        restaurants.extend(parse_cards(''.join(batch), backend))
+
+    return restaurants
+
+
+# 페이지에 포함된 localStorage.setItem('listData', '<JS 문자열>') 블롭
+LIST_DATA_PATTERN = re.compile(r"""localStorage\.setItem\(\s*(['"])listData\1\s*,\s*(['"])""")
+JS_ESCAPE = re.compile(r'\\(u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\r\n|[\s\S])')
+JS_SIMPLE_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+
+
+def _unescape_js_string(literal):
+    """JS 문자열 리터럴 본문의 이스케이프를 해제 (\\uXXXX 서로게이트 쌍 포함)"""
+
+    def replace(match):
+        esc = match.group(1)
+        if esc[0] in 'ux' and len(esc) > 1:
+            return chr(int(esc[1:], 16))
+        if esc in ('\n', '\r\n', '\r'):
+            # 줄 이어쓰기
+            return ''
+        return JS_SIMPLE_ESCAPES.get(esc, esc)
+
+    text = JS_ESCAPE.sub(replace, literal)
+    # \uD83D\uDE00 처럼 쪼개진 서로게이트 쌍을 하나의 문자로 합침
+    return text.encode('utf-16', 'surrogatepass').decode('utf-16')
+
+
+def _js_string_end(text, start, quote):
+    """start 부터 이스케이프되지 않은 닫는 따옴표 위치 (정규식 역추적 없이 선형 탐색)"""
+
+    pos = start
+    while True:
+        pos = text.find(quote, pos)
+        if pos == -1:
+            return -1
+        backslashes = 0
+        while text[pos - 1 - backslashes] == '\\':
+            backslashes += 1
+        if backslashes % 2 == 0:
+            return pos
+        pos += 1
+
+
+def _decode_list_data(literal):
+    """listData JS 문자열 본문 -> dict (poi_section.list 가 없으면 None)"""
+
+    try:
+        data = json.loads(_unescape_js_string(literal))
+    except (ValueError, UnicodeError) as e:
+        print(f"Error parsing listData JSON: {e}")
+        return None
+
+    if not isinstance(data, dict) or 'list' not in (data.get('poi_section') or {}):
+        return None
+    return data
+
+
+def find_list_data(html_content):
+    """HTML 에 포함된 listData JSON 을 DOM 생성 없이 디코딩 (없으면 None)"""
+
+    match = LIST_DATA_PATTERN.search(html_content)
+    if not match:
+        return None
+
+    end = _js_string_end(html_content, match.end(), match.group(2))
+    if end == -1:
+        return None
+
+    return _decode_list_data(html_content[match.end():end])
+
+
+def find_list_data_stream(f, chunk_size=STREAM_CHUNK_SIZE):
+    """파일을 청크 단위로 읽으며 listData 블롭만 모아 디코딩 (없으면 None)
+
+    페이지 전체를 메모리에 올리지 않으므로 메모리는 청크 크기 + 블롭 크기로 제한된다.
+    """
+
+    buffer = ''
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            return None
+        buffer += chunk
+        match = LIST_DATA_PATTERN.search(buffer)
+        if match:
+            break
+        # 호출 패턴이 청크 경계에 걸칠 수 있으므로 마지막 'localStorage' 이후는 남김
+        cut = buffer.rfind('localStorage')
+        buffer = buffer[cut:] if cut != -1 else buffer[-len('localStorage'):]
+
+    quote = match.group(2)
+    text = buffer[match.end():]
+    pos = 0
+    while True:
+        end = _js_string_end(text, pos, quote)
+        if end != -1:
+            return _decode_list_data(text[:end])
+        chunk = f.read(chunk_size)
+        if not chunk:
+            return None
+        # 청크 경계의 백슬래시를 다시 세도록 직전 위치부터 이어서 탐색
+        pos = max(len(text) - 1, 0)
+        text += chunk
+
+
+def poi_to_restaurant(poi):
+    """listData 의 poi 항목을 카드 추출과 같은 형태의 식당 dict 로 변환 (주소/좌표 포함)"""
+
+    name = poi.get('nm', '')
+    branch = poi.get('branch', '')
+    if branch:
+        name = f"{name} {branch}"
+
+    area_list = poi.get('area') or []
+    if isinstance(area_list, str):
+        area_list = [area_list]
+
+    return {
+        'name': name,
+        'area': area_list[0] if area_list else '',
+        'category': poi.get('category', ''),
+        'score': poi.get('score', ''),
+        'user_score': poi.get('user_score', ''),
+        'review_cnt': poi.get('review_cnt', ''),
+        'address': poi.get('road_addr', '') or poi.get('addr', ''),
+        'lat': poi.get('lat', ''),
+        'lng': poi.get('lng', ''),
+    }
+
+
+def parse_list_data(html_content):
+    """listData 블롭에서 식당 리스트 추출 (블롭이 없으면 None)"""
+
+    data = find_list_data(html_content)
+    if data is None:
+        return None
+    return [poi_to_restaurant(poi) for poi in data['poi_section']['list']]
+
+
+def extract_restaurants(html_file, backend=DEFAULT_BACKEND, stream=False):
+    """listData JSON 우선 추출, 블롭이 없을 때만 PoiBlock 카드 파싱으로 대체
+
+    JSON 경로는 좌표(lat/lng)와 도로명 주소까지 포함하므로 해당 행은 지오코딩이 필요 없다.
+    """
+
+    print(f"Reading HTML file: {html_file}")
+
+    if not os.path.exists(html_file):
+        print(f"Error: File not found: {html_file}")
+        return []
+
+    try:
+        with open(html_file, 'r', encoding='utf-8') as f:
+            if stream:
+                # 페이지 전체를 읽지 않고 listData 블롭을 찾은 뒤, 없으면 처음부터 카드 조각만 스트리밍
+                data = find_list_data_stream(f)
+                if data is not None:
+                    restaurants = [poi_to_restaurant(poi) for poi in data['poi_section']['list']]
+                    print(f"Found {len(restaurants)} restaurants in listData")
+                    return restaurants
+                f.seek(0)
+                restaurants = stream_cards(f, backend)
+            else:
+                html_content = f.read()
+                restaurants = parse_list_data(html_content)
+                if restaurants is not None:
+                    print(f"Found {len(restaurants)} restaurants in listData")
+                    return restaurants
+                restaurants = parse_cards(html_content, backend)
+    except Exception as e:
+        print(f"Error reading file: {e}")
+        return []
+
+    print(f"Found {len(restaurants)} restaurant cards")
+
+    return restaurants
+
+
+def extract_from_html_cards(html_file, backend=DEFAULT_BACKEND, stream=False):
+    """HTML 카드 요소에서 직접 식당 데이터 추출
+
+    stream=True 이면 전체 페이지 대신 PoiBlock 카드 조각만 스트리밍 파싱
+    """
+
+    print(f"Reading HTML file: {html_file}")
+
+    if not os.path.exists(html_file):
+        print(f"Error: File not found: {html_file}")
+        return []
+
+    try:
+        with open(html_file, 'r', encoding='utf-8') as f:
+            if stream:
+                restaurants = stream_cards(f, backend)
+            else:
+                restaurants = parse_cards(f.read(), backend)
+    except Exception as e:
+        print(f"Error reading file: {e}")
+        return []
+
+    print(f"Found {len(restaurants)} restaurant cards")
+
+    return restaurants
+
+
+def to_csv_rows(restaurants, sector, current_date=None, start=1):
+    """식당 dict 리스트를 locations 계열 CSV 행으로 변환 (id 는 start 부터)"""
+
+    if current_date is None:
+        current_date = datetime.now().strftime('%Y-%m-%d')
+
+    csv_data = []
+    for idx, restaurant in enumerate(restaurants, start):
+        csv_data.append({
+            'id': idx,
+            'sector': sector,
+            'title': sector,
+            'name': restaurant['name'],
+            'type': restaurant['category'],
+            'chef': '',
+            'address': restaurant.get('address', ''),
+            'lat': restaurant.get('lat', ''),
+            'lng': restaurant.get('lng', ''),
+            'date': current_date,
+            'area': restaurant['area'],
+            'user_score': restaurant['user_score'],
+            'review_cnt': restaurant['review_cnt']
+        })
+    return csv_data
+
+
+def save_to_csv(restaurants, output_file, sector, verbose=True):
+    """식당 데이터를 CSV 파일로 저장"""
+
+    if not restaurants:
+        print("\nNo restaurants to save")
+        return
+
+    if verbose:
+        print(f"\nSaving {len(restaurants)} restaurants to {output_file}")
+
+    csv_data = to_csv_rows(restaurants, sector)
+
+    with open(output_file, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(csv_data)
+
+    if not verbose:
+        return
+
+    print(f"✓ Successfully saved {len(csv_data)} restaurants to {output_file}")
+
+    # 요약 출력
+    print(f"\n=== Summary ===")
+    print(f"Total restaurants: {len(csv_data)}")
+    print(f"\nFirst 5 restaurants:")
+    for i, rest in enumerate(csv_data[:5], 1):
+        print(f"  {i}. {rest['name']} - {rest['type']} ({rest['area']})")
+
+    if len(csv_data) > 5:
+        print(f"\nLast 5 restaurants:")
+        for i, rest in enumerate(csv_data[-5:], len(csv_data)-4):
+            print(f"  {i}. {rest['name']} - {rest['type']} ({rest['area']})")
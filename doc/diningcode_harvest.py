@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+다이닝코드 무한 스크롤 listData 수집 공용 모듈
+스크롤마다 localStorage 의 listData 에서 새로 추가된 항목만 읽고
+(이름+지점, 주소) 키 인덱스로 중복을 O(1) 에 걸러냄
+고정 sleep 대신 listData 크기 / 카드 수 변화를 기다렸다가 바로 다음 스크롤로 진행
+"""
+
+import time
+
+try:
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.support.ui import WebDriverWait
+    SELENIUM_AVAILABLE = True
+except ImportError:
+    SELENIUM_AVAILABLE = False
+
+# 로딩 신호 대기 설정
+LOAD_TIMEOUT = 10
+POLL_INTERVAL = 0.1
+
+# 브라우저에서 실행: listData 전체 길이와 start 이후의 새 항목만 반환
+# (리스트가 start 보다 짧아졌거나 start - 1 번째 항목의 키가 마지막으로 읽은 항목 (arguments[1]) 과 다르면
+#  다른 목록으로 바뀐 것이므로 처음부터 다시 읽음, 키는 restaurant_key 와 같은 [이름 + 지점, 주소])
+READ_NEW_ITEMS_JS = """
+const raw = localStorage.getItem('listData');
+if (!raw) return null;
+const section = JSON.parse(raw).poi_section || {};
+const list = section.list || [];
+let start = arguments[0] <= list.length ? arguments[0] : 0;
+const last = arguments[1];
+if (start > 0 && last) {
+  const poi = list[start - 1] || {};
+  const name = poi.branch ? `${poi.nm || ''} ${poi.branch}` : (poi.nm || '');
+  const address = poi.road_addr || poi.addr || '';
+  if (name !== last[0] || address !== last[1]) start = 0;
+}
+return {total: list.length, total_cnt: section.total_cnt || null, start: start, items: list.slice(start)};
+"""
+
+# 브라우저에서 실행: 로딩 진행 신호 (JSON 파싱 없이 listData 문자열 길이와 카드 수만 확인)
+LOAD_STATE_JS = """
+const raw = localStorage.getItem('listData');
+return [raw ? raw.length : 0, document.querySelectorAll('a.PoiBlock').length];
+"""
+
+SCROLL_TO_BOTTOM_JS = "window.scrollTo(0, document.body.scrollHeight);"
+
+
+def restaurant_key(poi):
+    """중복 판정 키: (이름 + 지점, 주소)"""
+
+    name = poi.get('nm') or ''
+    branch = poi.get('branch') or ''
+    if branch:
+        name = f"{name} {branch}"
+
+    address = poi.get('road_addr') or poi.get('addr') or ''
+    return name, address
+
+
+def poi_to_record(poi):
+    """listData poi 항목을 수집 레코드로 변환"""
+
+    name, address = restaurant_key(poi)
+    return {
+        'name': name,
+        'address': address,
+        'category': poi.get('category', ''),
+        'phone': poi.get('phone', ''),
+        'lat': poi.get('lat', 0.0),
+        'lng': poi.get('lng', 0.0),
+        'score': poi.get('score', 0),
+        'user_score': poi.get('user_score', 0.0),
+        'review_cnt': poi.get('review_cnt', 0),
+        'area': ', '.join(poi.get('area', [])),
+    }
+
+
+class ListDataIndex:
+    """listData 를 증분 소비하며 키 인덱스로 중복 제거한 레코드를 모음"""
+
+    def __init__(self):
+        self.restaurants = []
+        self.consumed = 0
+        self.last_key = None
+        self.total_cnt = None
+        self._keys = set()
+
+    def __len__(self):
+        return len(self.restaurants)
+
+    def add(self, poi):
+        """새 식당이면 추가하고 True 반환"""
+
+        key = restaurant_key(poi)
+        if key in self._keys:
+            return False
+        self._keys.add(key)
+        self.restaurants.append(poi_to_record(poi))
+        return True
+
+    def consume(self, snapshot):
+        """READ_NEW_ITEMS_JS 결과를 반영하고 새로 추가된 식당 수 반환"""
+
+        if not snapshot:
+            return 0
+
+        added = 0
+        for poi in snapshot['items']:
+            if self.add(poi):
+                added += 1
+        self.consumed = snapshot['start'] + len(snapshot['items'])
+        # 다음 읽기에서 같은 목록인지 확인할 마지막 항목의 키
+        if snapshot['items']:
+            self.last_key = restaurant_key(snapshot['items'][-1])
+        elif snapshot['start'] == 0:
+            self.last_key = None
+        if snapshot.get('total_cnt'):
+            self.total_cnt = snapshot['total_cnt']
+        return added
+
+    def is_complete(self, target_count=None):
+        """목표 개수 또는 검색 결과 전체(total_cnt)를 모두 수집했는지"""
+
+        limits = [n for n in (target_count, self.total_cnt) if n]
+        return bool(limits) and len(self) >= min(limits)
+
+    def poll(self, driver):
+        """브라우저에서 아직 읽지 않은 listData 항목만 가져와 반영"""
+
+        last_key = list(self.last_key) if self.last_key else None
+        return self.consume(driver.execute_script(READ_NEW_ITEMS_JS, self.consumed, last_key))
+
+
+def wait_for_change(driver, previous_state, timeout=LOAD_TIMEOUT):
+    """로딩 신호가 previous_state 에서 바뀔 때까지 대기 (시간 초과 시 None)"""
+
+    def changed(d):
+        state = d.execute_script(LOAD_STATE_JS)
+        return state if state != previous_state else False
+
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(changed)
+    except TimeoutException:
+        return None
+
+
+def scroll_and_harvest(driver, url, target_count=None, timeout=LOAD_TIMEOUT, index=None):
+    """페이지를 열고 새 데이터 로딩 신호가 올 때마다 바로 스크롤하며 listData 수집
+
+    종료 조건:
+      - target_count 또는 listData 의 total_cnt 만큼 수집
+      - 스크롤 후 timeout 동안 listData / 카드 수가 전혀 늘지 않음 (목록 끝)
+    """
+
+    if not SELENIUM_AVAILABLE:
+        raise RuntimeError("selenium is not installed (pip install selenium)")
+
+    index = index if index is not None else ListDataIndex()
+    start = time.time()
+    scrolls = 0
+
+    print(f"페이지 로딩 중: {url}")
+    # 같은 도메인에서 이전 검색의 listData 가 남아 있으면 로딩 신호로 오인하므로 제거
+    driver.execute_script("try { localStorage.removeItem('listData'); } catch (e) {}")
+    driver.get(url)
+
+    # 초기 로딩: listData 가 생길 때까지만 대기
+    state = wait_for_change(driver, [0, 0], timeout)
+    if state is None:
+        print("listData 가 로드되지 않았습니다.")
+        return index
+
+    while True:
+        added = index.poll(driver)
+        print(f"현재 수집: {len(index)}개 (+{added}, total_cnt: {index.total_cnt})")
+
+        if index.is_complete(target_count):
+            print(f"\n✅ 수집 완료! {len(index)}개")
+            break
+
+        state = driver.execute_script(LOAD_STATE_JS)
+        driver.execute_script(SCROLL_TO_BOTTOM_JS)
+        scrolls += 1
+
+        if wait_for_change(driver, state, timeout) is None:
+            # 마지막으로 한 번 더 읽어 대기 중 도착한 항목 반영
+            index.poll(driver)
+            print(f"\n{timeout}초 동안 새 데이터가 로드되지 않아 종료합니다.")
+            break
+
+    print(f"스크롤 {scrolls}회, {time.time() - start:.1f}초 소요")
+    return index
@@ -9,9 +9,10 @@ import requests
 from bs4 import BeautifulSoup
 import json
 import csv
-import re
 from datetime import datetime
 
+from diningcode_extract import find_list_data
+
 def extract_all_restaurants():
     """페이지 소스에서 모든 식당 데이터 추출"""
     
@@ -33,34 +34,18 @@ def extract_all_restaurants():
         html_content = response.text
         print(f"✓ 페이지 다운로드 완료 ({len(html_content)} bytes)")
         
-        # 방법 1: localStorage 데이터 추출
+        # 방법 1: localStorage 데이터 추출 (DOM 생성 없이 JSON 블롭 직접 디코딩)
         print("\n방법 1: localStorage 데이터 검색 중...")
-        pattern = r"localStorage\.setItem\('listData',\s*'(.+?)'\);"
-        match = re.search(pattern, html_content, re.DOTALL)
+        data = find_list_data(html_content)
         
-        if match:
-            json_str = match.group(1)
-            print(f"  ✓ localStorage 데이터 발견 (길이: {len(json_str)})")
+        if data:
+            restaurants = data['poi_section']['list']
+            total_cnt = data['poi_section'].get('total_cnt', 0)
             
-            # JSON 디코딩
-            try:
-                # 이스케이프 처리
-                json_str = json_str.replace(r'\"', '"')
-                json_str = json_str.encode('utf-8').decode('unicode_escape')
-                
-                data = json.loads(json_str)
-                
-                if 'poi_section' in data and 'list' in data['poi_section']:
-                    restaurants = data['poi_section']['list']
-                    total_cnt = data['poi_section'].get('total_cnt', 0)
-                    
-                    print(f"  ✓ 전체 개수: {total_cnt}")
-                    print(f"  ✓ 추출된 개수: {len(restaurants)}")
-                    
-                    return restaurants
-                    
-            except Exception as e:
-                print(f"  ❌ JSON 파싱 오류: {e}")
+            print(f"  ✓ 전체 개수: {total_cnt}")
+            print(f"  ✓ 추출된 개수: {len(restaurants)}")
+            
+            return restaurants
         
         # 방법 2: script 태그에서 데이터 검색
         print("\n방법 2: script 태그 검색 중...")
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+저장 페이지 추출 결과 캐시
+HTML 파일 내용 해시 + 추출기 버전을 키로 추출된 식당 레코드를 디스크에 저장하여
+변경되지 않은 페이지는 다시 파싱하지 않음
+"""
+
+import hashlib
+import json
+import os
+
+from diningcode_extract import EXTRACTOR_VERSION
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.extract_cache')
+
+
+def file_hash(path):
+    """파일 내용의 SHA-256 (파일이 없으면 None)"""
+
+    if not os.path.exists(path):
+        return None
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ExtractCache:
+    """(내용 해시, 추출기 버전) -> 식당 레코드 리스트"""
+
+    def __init__(self, cache_dir=CACHE_DIR, version=EXTRACTOR_VERSION):
+        self.cache_dir = os.path.join(cache_dir, f"v{version}")
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key):
+        """캐시된 레코드 반환 (없으면 None), 적중/미스 집계"""
+
+        path = self._path(key) if key else None
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    records = json.load(f)
+                self.hits += 1
+                return records
+            except (OSError, ValueError) as e:
+                print(f"Warning: ignoring broken cache entry {path}: {e}")
+
+        self.misses += 1
+        return None
+
+    def put(self, key, records):
+        """레코드 저장 (임시 파일에 쓴 뒤 교체하여 중단 시에도 깨진 항목이 남지 않음)"""
+
+        if not key:
+            return
+
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(records, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def summary(self):
+        total = self.hits + self.misses
+        rate = self.hits / total * 100 if total else 0
+        return f"Cache hits: {self.hits}, misses: {self.misses} ({rate:.0f}% hit rate)"
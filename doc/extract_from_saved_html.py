@@ -4,11 +4,11 @@
 Extract restaurant data from saved HTML file
 """
 
-import json
 import csv
-import re
 from datetime import datetime
 
+from diningcode_extract import find_list_data
+
 def extract_from_html(html_file):
     """Extract restaurant data from saved HTML file"""
     
@@ -21,45 +21,21 @@ def extract_from_html(html_file):
         print(f"Error reading file: {e}")
         return []
     
-    # Find the localStorage.setItem line
-    pattern = r"localStorage\.setItem\('listData',\s*'(.+?)'\);"
-    match = re.search(pattern, html_content, re.DOTALL)
+    # Find and decode the localStorage.setItem('listData', ...) blob
+    data = find_list_data(html_content)
     
-    if not match:
+    if not data:
         print("Could not find listData in HTML")
         return []
     
-    json_str = match.group(1)
-    print(f"Found JSON string (length: {len(json_str)})")
+    # Extract restaurant list
+    restaurants = data['poi_section']['list']
+    total_count = data['poi_section'].get('total_cnt', 0)
     
-    # Decode unicode escapes
-    try:
-        # Replace escaped quotes
-        json_str = json_str.replace(r'\"', '"')
-        
-        # Decode unicode escapes like \uacbd\uae30\ub3c4
-        json_str = json_str.encode('utf-8').decode('unicode_escape')
-        
-        # Parse JSON
-        data = json.loads(json_str)
-        
-        # Extract restaurant list
-        if 'poi_section' in data and 'list' in data['poi_section']:
-            restaurants = data['poi_section']['list']
-            total_count = data['poi_section'].get('total_cnt', 0)
-            
-            print(f"Total restaurants in data: {total_count}")
-            print(f"Restaurants extracted: {len(restaurants)}")
-            
-            return restaurants
-        else:
-            print("Could not find poi_section.list in data")
-            return []
-            
-    except Exception as e:
-        print(f"Error parsing JSON: {e}")
-        print(f"First 500 chars of JSON string: {json_str[:500]}")
-        return []
+    print(f"Total restaurants in data: {total_count}")
+    print(f"Restaurants extracted: {len(restaurants)}")
+    
+    return restaurants
 
 def save_to_csv(restaurants, output_file='tasty_boys.csv'):
     """Save restaurant data to CSV file"""
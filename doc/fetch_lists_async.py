@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+브라우저 없이 다이닝코드 검색 목록을 비동기로 수집
+여러 (방송, 지역) 검색의 모든 페이지(from/size)를 하나의 커넥션 풀로 동시에 요청하고
+응답마다 listData JSON 을 바로 디코딩하여 방송별 CSV 에 스트리밍 저장
+
+- 전체 동시 요청 수 제한 + 호스트별 동시 요청 수 / 최소 요청 간격 (서버 부하 방지)
+- --record DIR: 받은 응답을 저장, --replay DIR: 저장된 응답을 로컬 서버로 제공하여 오프라인 테스트
+"""
+
+import argparse
+import asyncio
+import csv
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote_plus, urlparse
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+from batch_extract import MANIFEST_FILE, load_manifest
+from diningcode_extract import FIELDNAMES, find_list_data, poi_to_restaurant, to_csv_rows
+
+DININGCODE_LIST_URL = 'https://www.diningcode.com/list.dc'
+PAGE_SIZE = 20
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Referer': 'https://www.diningcode.com/',
+}
+
+
+class HostLimiter:
+    """호스트별 동시 요청 수와 요청 시작 간 최소 간격을 지키는 예절 제한"""
+
+    def __init__(self, per_host=2, min_interval=0.2):
+        self.per_host = per_host
+        self.min_interval = min_interval
+        self._semaphores = {}
+        self._locks = {}
+        self._last_start = {}
+
+    async def acquire(self, host):
+        semaphore = self._semaphores.setdefault(host, asyncio.Semaphore(self.per_host))
+        await semaphore.acquire()
+
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            wait = self._last_start.get(host, 0) + self.min_interval - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_start[host] = time.monotonic()
+
+    def release(self, host):
+        self._semaphores[host].release()
+
+
+class CsvSink:
+    """방송별 CSV 파일에 레코드를 도착 순서대로 바로 기록 (방송 내 중복 제거)"""
+
+    def __init__(self, output_dir):
+        self.output_dir = output_dir
+        self.counts = {}
+        self._files = {}
+        self._writers = {}
+        self._keys = {}
+        os.makedirs(output_dir, exist_ok=True)
+
+    def write(self, show, restaurants):
+        if show not in self._writers:
+            f = open(os.path.join(self.output_dir, f"{show}.csv"), 'w', encoding='utf-8-sig', newline='')
+            self._files[show] = f
+            self._writers[show] = csv.DictWriter(f, fieldnames=FIELDNAMES)
+            self._writers[show].writeheader()
+            self._keys[show] = set()
+            self.counts[show] = 0
+
+        keys = self._keys[show]
+        fresh = []
+        for restaurant in restaurants:
+            key = (restaurant['name'], restaurant['address'])
+            if key not in keys:
+                keys.add(key)
+                fresh.append(restaurant)
+
+        self._writers[show].writerows(to_csv_rows(fresh, show, start=self.counts[show] + 1))
+        self._files[show].flush()
+        self.counts[show] += len(fresh)
+        return len(fresh)
+
+    def close(self):
+        for f in self._files.values():
+            f.close()
+
+
+def recorded_filename(query, from_index):
+    return f"{quote_plus(query)}_{from_index}.html"
+
+
+class ListFetcher:
+    """aiohttp 커넥션 풀 하나로 검색 목록 페이지들을 동시 요청"""
+
+    def __init__(self, session, base_url=DININGCODE_LIST_URL, concurrency=8, limiter=None, record_dir=None):
+        self.session = session
+        self.base_url = base_url
+        self.host = urlparse(base_url).netloc
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.limiter = limiter or HostLimiter()
+        self.record_dir = record_dir
+        self.requests = 0
+        self.errors = 0
+
+    async def fetch_page(self, query, from_index, size=PAGE_SIZE):
+        """한 페이지 요청 후 listData 디코딩 (실패 시 None)"""
+
+        params = {'query': query, 'from': from_index, 'size': size}
+
+        async with self.semaphore:
+            await self.limiter.acquire(self.host)
+            try:
+                async with self.session.get(self.base_url, params=params, headers=HEADERS) as response:
+                    response.raise_for_status()
+                    html_content = await response.text(encoding='utf-8')
+            except Exception as e:
+                self.errors += 1
+                print(f"  ✗ {query} (from: {from_index}): {e}")
+                return None
+            finally:
+                self.limiter.release(self.host)
+                self.requests += 1
+
+        if self.record_dir:
+            with open(os.path.join(self.record_dir, recorded_filename(query, from_index)), 'w', encoding='utf-8') as f:
+                f.write(html_content)
+
+        return find_list_data(html_content)
+
+    async def fetch_query(self, show, region, sink, size=PAGE_SIZE):
+        """첫 페이지로 total_cnt 를 확인한 뒤 나머지 페이지를 동시에 요청하여 sink 로 전달"""
+
+        query = f"{region} {show}"
+        data = await self.fetch_page(query, 0, size)
+        if data is None:
+            return 0
+
+        section = data['poi_section']
+        written = sink.write(show, [poi_to_restaurant(poi) for poi in section['list']])
+        total_cnt = section.get('total_cnt') or len(section['list'])
+
+        pages = [self.fetch_page(query, from_index, size) for from_index in range(size, total_cnt, size)]
+        for page in asyncio.as_completed(pages):
+            data = await page
+            if data is not None:
+                written += sink.write(show, [poi_to_restaurant(poi) for poi in data['poi_section']['list']])
+
+        print(f"✓ {query}: {written}/{total_cnt}")
+        return written
+
+
+async def fetch_all(queries, sink, base_url=DININGCODE_LIST_URL, concurrency=8, per_host=2, min_interval=0.2, record_dir=None):
+    """모든 검색을 동시에 수집"""
+
+    if not AIOHTTP_AVAILABLE:
+        raise RuntimeError("aiohttp is not installed (pip install aiohttp)")
+
+    if record_dir:
+        os.makedirs(record_dir, exist_ok=True)
+
+    connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=per_host)
+    timeout = aiohttp.ClientTimeout(total=30)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        fetcher = ListFetcher(session, base_url, concurrency, HostLimiter(per_host, min_interval), record_dir)
+        await asyncio.gather(*(fetcher.fetch_query(q['show'], q['region'], sink) for q in queries))
+    return fetcher
+
+
+def serve_recorded(record_dir, port=0):
+    """--record 로 저장한 응답을 list.dc?query=...&from=... 로 제공하는 로컬 대역 서버"""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            params = parse_qs(urlparse(self.path).query)
+            query = params.get('query', [''])[0]
+            from_index = params.get('from', ['0'])[0]
+            path = os.path.join(record_dir, recorded_filename(query, from_index))
+            if not os.path.exists(path):
+                self.send_error(404)
+                return
+            with open(path, 'rb') as f:
+                body = f.read()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='다이닝코드 검색 목록 비동기 수집 (브라우저 없음)')
+    parser.add_argument('--manifest', default=MANIFEST_FILE, help='(방송, 지역) 목록으로 쓸 매니페스트 CSV')
+    parser.add_argument('--show', help='특정 방송만 수집')
+    parser.add_argument('--output-dir', default='.', help='CSV 저장 폴더')
+    parser.add_argument('--concurrency', type=int, default=8, help='전체 동시 요청 수')
+    parser.add_argument('--per-host', type=int, default=2, help='호스트별 동시 요청 수')
+    parser.add_argument('--min-interval', type=float, default=0.2, help='호스트별 요청 시작 최소 간격 (초)')
+    parser.add_argument('--record', help='받은 응답을 저장할 폴더')
+    parser.add_argument('--replay', help='저장된 응답을 로컬 서버로 제공하여 수집 (오프라인 테스트)')
+    args = parser.parse_args()
+
+    entries = load_manifest(args.manifest)
+    if args.show:
+        entries = [e for e in entries if e['show'] == args.show]
+    queries = [{'show': e['show'], 'region': e['region']} for e in entries]
+
+    base_url = DININGCODE_LIST_URL
+    server = None
+    if args.replay:
+        server = serve_recorded(args.replay)
+        base_url = f"http://127.0.0.1:{server.server_address[1]}/list.dc"
+        print(f"로컬 대역 서버: {base_url}")
+
+    print("="*60)
+    print(f"Async list fetch: {len(queries)} queries")
+    print("="*60)
+
+    sink = CsvSink(args.output_dir)
+    start = time.time()
+    try:
+        fetcher = asyncio.run(fetch_all(queries, sink, base_url, args.concurrency, args.per_host, args.min_interval, args.record))
+    finally:
+        sink.close()
+        if server:
+            server.shutdown()
+
+    elapsed = time.time() - start
+    print(f"\n=== Summary ===")
+    for show, count in sink.counts.items():
+        print(f"  {show}: {count} restaurants")
+    print(f"Requests: {fetcher.requests}, errors: {fetcher.errors}, elapsed: {elapsed:.1f}s")
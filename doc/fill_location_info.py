@@ -1,70 +1,36 @@
 
 import pandas as pd
 import os
-import requests
-import time
+import sys
 import json
-try:
-    from pyproj import Proj, transform, Transformer
-    PYPROJ_AVAILABLE = True
-except ImportError:
-    PYPROJ_AVAILABLE = False
-    print("Warning: pyproj not found. Coordinates might not be converted correctly if source is TM128.")
+
+# 공용 네이버 API 클라이언트 (scripts/naver_client.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+from coords import PYPROJ_AVAILABLE, naver_to_wgs84
+from match_scoring import best_match
+from naver_client import NaverAPIError, NaverClient, QuotaExhausted
 
 # Naver API Keys (Legacy Search Keys)
 CLIENT_ID = "bUpmGhUz3eqK9pXC5NGR"
 CLIENT_SECRET = "wwlhTbb_g4"
+NAVER = NaverClient(CLIENT_ID, CLIENT_SECRET)
 
-def get_location_info(query):
-    url = "https://openapi.naver.com/v1/search/local.json"
-    headers = {
-        "X-Naver-Client-Id": CLIENT_ID,
-        "X-Naver-Client-Secret": CLIENT_SECRET
-    }
-    params = {"query": query, "display": 1}
-    
+def get_location_info(query, place_name=None):
+    # Rank all 5 results by name/category (scripts/match_scoring.py); low-confidence picks are flagged for review
     try:
-        resp = requests.get(url, headers=headers, params=params)
-        if resp.status_code == 200:
-            data = resp.json()
-            if data['items']:
-                item = data['items'][0]
-                return item
-    except Exception as e:
+        items = NAVER.search_local(query, display=5)
+    except QuotaExhausted:
+        raise
+    except NaverAPIError as e:
         print(f"Error fetching data for {query}: {e}")
-    return None
+        return None
+    match = best_match(items, place_name or query, place_type='restaurant')
+    return match.item if match else None
 
 def convert_katech_to_wgs84(mapx, mapy):
-    if not PYPROJ_AVAILABLE or not mapx or not mapy:
-        return None, None
-    
-    try:
-        # Naver KATECH (TM128) assumption
-        # Proj string for KATECH (often approximated)
-        # Using standard KATECH/TM128 definition
-        # mapx, mapy from Naver are usually integers (multiplied by 10 or similar? No, usually generic KATECH)
-        # However, older Naver API returned integers. Let's inspect raw values.
-        # If they are integers like 309999, 552000, they are TM128.
-        # Note: Using explicit proj strings is safer.
-        
-        # Define projections
-        # TM128 System (KATECH)
-        proj_katech = Proj('+proj=tmerc +lat_0=38 +lon_0=128 +k=0.9999 +x_0=400000 +y_0=600000 +ellps=bessel +units=m +no_defs +towgs84=-115.80,474.99,674.11,1.16,-2.31,-1.63,6.43')
-        # WGS84
-        proj_wgs84 = Proj(proj='latlong', datum='WGS84')
-        
-        transformer = Transformer.from_proj(proj_katech, proj_wgs84)
-        
-        # Naver Search API usually returns coordinates as integer strings?
-        # Let's ensure they are floats
-        mx = float(mapx)
-        my = float(mapy)
-        
-        lon, lat = transformer.transform(mx, my)
-        return lat, lon
-    except Exception as e:
-        print(f"Conversion error: {e}")
-        return None, None
+    # Current Naver Search API returns WGS84 * 1e7, older responses were KATECH (TM128).
+    # scripts/coords.py tells them apart and reuses one cached transformer.
+    return naver_to_wgs84(mapx, mapy)
 
 def fill_csv():
     file_path = r"d:\00_projects\02_TasteMap\doc\data\matzip.csv"
@@ -81,7 +47,7 @@ def fill_csv():
             df[col] = "" # Should already exist from previous steps
 
     if not PYPROJ_AVAILABLE:
-        print("CRITICAL: pyproj is missing. Coordinate conversion will be skipped/mocked.")
+        print("Warning: pyproj is missing. Legacy TM128 coordinates will be skipped.")
 
     updated_count = 0
     
@@ -116,7 +82,12 @@ def fill_csv():
             
             print(f"Processing ({index+1}/{len(df)}): {query}")
             
-            info = get_location_info(query)
+            # Daily quota used up: save what we have and stop (remaining rows are picked up next run)
+            try:
+                info = get_location_info(query, place_name)
+            except QuotaExhausted as e:
+                print(f"{e} - saving progress and stopping.")
+                break
             
             if info:
                 # Naver API returns html tags in title/address sometimes.
@@ -131,7 +102,7 @@ def fill_csv():
                 
                 # Convert coords
                 lat, lon = None, None
-                if mapx and mapy and PYPROJ_AVAILABLE:
+                if mapx and mapy:
                     lat, lon = convert_katech_to_wgs84(mapx, mapy)
                 
                 # Update DataFrame
@@ -142,9 +113,6 @@ def fill_csv():
                 
                 updated_count += 1
             
-            # Rate limiting (conservative)
-            time.sleep(0.1)
-            
             # Save incrementally every 100 rows
             if updated_count % 100 == 0:
                 print(f"Saving progress... ({updated_count} updated)")
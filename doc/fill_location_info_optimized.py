@@ -1,55 +1,39 @@
 
+import numpy as np
 import pandas as pd
 import os
-import requests
+import sys
 import time
 import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
-try:
-    from pyproj import Proj, transform, Transformer
-    PYPROJ_AVAILABLE = True
-except ImportError:
-    PYPROJ_AVAILABLE = False
-    print("Warning: pyproj not found. Coordinates might not be converted correctly if source is TM128.")
+
+# 공용 네이버 API 클라이언트 (scripts/naver_client.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+from naver_client import NaverAPIError, NaverClient
+import rate_limit
+from adaptive_concurrency import AdaptiveConcurrency, is_throttled, run_adaptive
+from coords import naver_to_wgs84_many
+from match_scoring import best_match
+from quota import QuotaExhausted, wait_for_reset
 
 # Naver API Keys (Legacy Search Keys)
 CLIENT_ID = "bUpmGhUz3eqK9pXC5NGR"
 CLIENT_SECRET = "wwlhTbb_g4"
+# 최대 동시 요청 수만큼 커넥션을 유지하는 공용 클라이언트
+NAVER = NaverClient(CLIENT_ID, CLIENT_SECRET, pool_size=50, timeout=5)
 
-def get_location_info(query):
-    url = "https://openapi.naver.com/v1/search/local.json"
-    headers = {
-        "X-Naver-Client-Id": CLIENT_ID,
-        "X-Naver-Client-Secret": CLIENT_SECRET
-    }
-    params = {"query": query, "display": 1}
-    
+def get_location_info(query, place_name=None):
+    # 상위 5개 중 상호명 / 카테고리가 가장 잘 맞는 결과 Match (scripts/match_scoring.py), 없으면 None
     try:
-        resp = requests.get(url, headers=headers, params=params, timeout=5)
-        if resp.status_code == 200:
-            data = resp.json()
-            if data['items']:
-                item = data['items'][0]
-                return item
-    except Exception as e:
+        items = NAVER.search_local(query, display=5)
+    except NaverAPIError as e:
+        # 429 / 5xx / 타임아웃은 '결과 없음' 으로 삼키지 않고 동시성 제어기로 넘겨 재시도,
+        # 한도 소진은 run_adaptive 의 stop_on 으로 넘겨 남은 행을 다음 실행으로
+        if is_throttled(e) or isinstance(e, QuotaExhausted):
+            raise
         # print(f"Error fetching data for {query}: {e}")
-        pass
-    return None
-
-
+        return None
+    return best_match(items, place_name or query, place_type='restaurant')
 
-# Global Transformer (Not needed anymore, but keep structure simple)
-TRANSFORMER = None
-PYPROJ_AVAILABLE = False # Force false to skip legacy checks
-
-def convert_katech_to_wgs84_proj(mapx, mapy):
-    # Actually Naver Search API returns WGS84 * 1e7
-    try:
-        mx = float(mapx) / 10000000.0
-        my = float(mapy) / 10000000.0
-        return my, mx # Lat, Lon
-    except Exception:
-        return None, None
 
 def process_row(row, index):
     # Check if address is missing or empty
@@ -66,35 +50,46 @@ def process_row(row, index):
             area_guess = parts[0]
             query = f"{area_guess} {place_name}"
             
-    info = get_location_info(query)
+    match = get_location_info(query, place_name)
     
     result = {'index': index}
     
-    if info:
+    if match:
+        info = match.item
         clean_address = info.get('address', '').replace('<b>', '').replace('</b>', '')
         road_address = info.get('roadAddress', '').replace('<b>', '').replace('</b>', '')
         phone = info.get('telephone', '')
-        mapx = info.get('mapx')
-        mapy = info.get('mapy')
-        
         final_addr = road_address if road_address else clean_address
         
-        # Use simple coordinate conversion (since transformer is global now)
-        lat, lon = None, None
-        if mapx and mapy:
-            lat, lon = convert_katech_to_wgs84_proj(mapx, mapy)
-            
+        # Raw mapx/mapy; converted column-wise in apply_results
         result['address'] = final_addr
         result['phone'] = phone
-        result['latitude'] = lat
-        result['longitude'] = lon
+        result['mapx'] = info.get('mapx')
+        result['mapy'] = info.get('mapy')
+        # 낮은 신뢰도 매칭은 다시 검색하지 않고 점수를 남겨 검토 대상으로
+        result['match_score'] = match.score
         result['found'] = True
     else:
         result['found'] = False
         
     return result
 
-def fill_csv():
+def apply_results(df, results):
+    # 찾은 행을 한 번에 반영 (mapx/mapy 는 열 단위로 한 번에 WGS84 변환, scripts/coords.py)
+    if not results:
+        return
+    index = np.array([r['index'] for r in results])
+    df.loc[index, 'address'] = [r['address'] for r in results]
+    df.loc[index, 'phone'] = [r['phone'] for r in results]
+    df.loc[index, 'match_score'] = [r['match_score'] for r in results]
+
+    lat, lon = naver_to_wgs84_many([r['mapx'] for r in results], [r['mapy'] for r in results])
+    valid = ~(np.isnan(lat) | np.isnan(lon))
+    df.loc[index[valid], 'latitude'] = lat[valid]
+    df.loc[index[valid], 'longitude'] = lon[valid]
+    results.clear()
+
+def fill_csv(wait_for_quota=False):
     file_path = r"d:\00_projects\02_TasteMap\doc\data\matzip.csv"
     
     if not os.path.exists(file_path):
@@ -106,12 +101,12 @@ def fill_csv():
     for col in ['address', 'latitude', 'longitude', 'phone']:
         if col not in df.columns:
             df[col] = ""
-
-    if not PYPROJ_AVAILABLE:
-        print("CRITICAL: pyproj is missing.")
+    if 'match_score' not in df.columns:
+        df['match_score'] = np.nan
+    # 비어 있어 숫자 열로 읽힌 주소/전화 열에도 문자열을 넣을 수 있도록
+    df[['address', 'phone']] = df[['address', 'phone']].astype(object)
 
     rows_to_process = []
-    import numpy as np
     for index, row in df.iterrows():
         # Condition: Address missing OR coords missing OR coords are inf
         addr_missing = pd.isna(row['address']) or str(row['address']).strip() == ""
@@ -133,27 +128,44 @@ def fill_csv():
     print(f"Targeting {len(rows_to_process)} empty rows.")
     
     updated_count = 0
-    with ThreadPoolExecutor(max_workers=50) as executor:
-        futures = {executor.submit(process_row, row, index): index for index, row in rows_to_process}
+    failed_count = 0
+    # 고정 50 스레드 대신 응답 상태에 따라 동시 요청 수를 조절 (최대 50)
+    controller = AdaptiveConcurrency(max_limit=50)
+    work = lambda item: process_row(item[1], item[0])
+    # 일일 한도 (quota.py) 를 다 쓰면 남은 행을 모아 저장 후 종료, --wait-for-quota 면 다음 날 이어서 진행
+    remaining = []
+    found = []
+    for i, (item, res, error) in enumerate(run_adaptive(rows_to_process, work, controller, stop_on=QuotaExhausted,
+                                                          network_calls=NAVER.thread_calls)):
+        if isinstance(error, QuotaExhausted):
+            remaining.append(item)
+        elif error:
+            failed_count += 1
+        elif res and res['found']:
+            found.append(res)
+            updated_count += 1
         
-        for i, future in enumerate(as_completed(futures)):
-            res = future.result()
-            if res and res['found']:
-                idx = res['index']
-                df.at[idx, 'address'] = res['address']
-                df.at[idx, 'phone'] = res['phone']
-                if res['latitude']: df.at[idx, 'latitude'] = res['latitude']
-                if res['longitude']: df.at[idx, 'longitude'] = res['longitude']
-                updated_count += 1
-            
-            if (i + 1) % 100 == 0:
-                print(f"Progress: {i + 1}/{len(rows_to_process)} completed. (Found: {updated_count})")
-                if (i + 1) % 500 == 0:
-                    print("Saving checkpoint...")
-                    df.to_csv(file_path, index=False)
+        if (i + 1) % 100 == 0:
+            print(f"Progress: {i + 1}/{len(rows_to_process)} completed. (Found: {updated_count}, limit: {controller.current})")
+            if (i + 1) % 500 == 0:
+                print("Saving checkpoint...")
+                apply_results(df, found)
+                df.to_csv(file_path, index=False)
 
+    apply_results(df, found)
     df.to_csv(file_path, index=False)
-    print(f"Done. Updated {updated_count} rows.")
+    print(f"Done. Updated {updated_count} rows. (Failed after retries: {failed_count})")
+    print(controller.summary())
+    for line in rate_limit.summary():
+        print(f"Rate limit: {line}")
+
+    if remaining:
+        print(f"Daily quota exhausted: {len(remaining)} rows left for the next run.")
+        for scheduler in NAVER.schedulers.values():
+            print(scheduler.summary())
+        if wait_for_quota:
+            wait_for_reset()
+            fill_csv(wait_for_quota)
 
 if __name__ == "__main__":
-    fill_csv()
+    fill_csv(wait_for_quota='--wait-for-quota' in sys.argv)
@@ -1,33 +1,32 @@
 
 import pandas as pd
 import os
-import requests
+import sys
 import json
 import numpy as np
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed
+
+# 공용 네이버 API 클라이언트 (scripts/naver_client.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+from coords import naver_to_wgs84
+from match_scoring import LOW_CONFIDENCE, best_match, rank_candidates
+from naver_client import NaverAPIError, NaverClient, QuotaExhausted
+from query_cascade import first_success
 
 # Naver API Keys (Legacy Search Keys)
 CLIENT_ID = "bUpmGhUz3eqK9pXC5NGR"
 CLIENT_SECRET = "wwlhTbb_g4"
+# 작업 스레드 수만큼 커넥션을 유지하는 공용 클라이언트
+NAVER = NaverClient(CLIENT_ID, CLIENT_SECRET, pool_size=50, timeout=5)
 
 def get_location_info(query):
-    url = "https://openapi.naver.com/v1/search/local.json"
-    headers = {
-        "X-Naver-Client-Id": CLIENT_ID,
-        "X-Naver-Client-Secret": CLIENT_SECRET
-    }
-    params = {"query": query, "display": 1}
-    
     try:
-        resp = requests.get(url, headers=headers, params=params, timeout=5)
-        if resp.status_code == 200:
-            data = resp.json()
-            if data['items']:
-                item = data['items'][0]
-                return item
-    except Exception:
+        return NAVER.search_local(query, display=5)
+    except QuotaExhausted:
+        raise
+    except NaverAPIError:
         pass
-    return None
+    return []
 
 def process_row_second_pass(row, index):
     # Check if address is missing or invalid coords
@@ -50,14 +49,17 @@ def process_row_second_pass(row, index):
     # Strategy 2: Title + place_name
     queries = [place_name, f"{title} {place_name}"]
     
+    # 두 검색어를 동시에 조회하고 상호명이 맞는 후보가 있는 앞 순위 결과 우선 (scripts/match_scoring.py)
+    def accept(items):
+        ranked = rank_candidates(items, place_name, place_type='restaurant')
+        return ranked and ranked[0].score >= LOW_CONFIDENCE
+    
     info = None
     used_query = ""
-    
-    for q in queries:
-        info = get_location_info(q)
-        if info:
-            used_query = q
-            break
+    hit = first_success(queries, get_location_info, accept=accept)
+    if hit:
+        _, used_query, items = hit
+        info = best_match(items, place_name, place_type='restaurant').item
             
     result = {'index': index, 'found': False}
     
@@ -70,14 +72,8 @@ def process_row_second_pass(row, index):
         
         final_addr = road_address if road_address else clean_address
         
-        lat, lon = None, None
-        try:
-             # Naver Search API returns WGS84 * 1e7
-            if mapx and mapy:
-                lon = float(mapx) / 10000000.0
-                lat = float(mapy) / 10000000.0
-        except:
-            pass
+        # Naver Search API returns WGS84 * 1e7 (scripts/coords.py)
+        lat, lon = naver_to_wgs84(mapx, mapy)
             
         result['address'] = final_addr
         result['phone'] = phone
@@ -113,11 +109,22 @@ def fill_csv_second_pass():
     print(f"Task: Second Pass. Targeting {len(rows_to_process)} rows.")
     
     updated_count = 0
+    quota_error = None
     with ThreadPoolExecutor(max_workers=50) as executor:
         futures = {executor.submit(process_row_second_pass, row, index): index for index, row in rows_to_process}
         
         for i, future in enumerate(as_completed(futures)):
-            res = future.result()
+            # Daily quota used up: cancel the rows not started yet, keep finished results (next run retries the rest)
+            try:
+                res = future.result()
+            except CancelledError:
+                continue
+            except QuotaExhausted as e:
+                if quota_error is None:
+                    quota_error = e
+                    for pending in futures:
+                        pending.cancel()
+                continue
             if res and res['found']:
                 idx = res['index']
                 df.at[idx, 'address'] = res['address']
@@ -130,6 +137,8 @@ def fill_csv_second_pass():
                 print(f"Progress: {i + 1}/{len(rows_to_process)} completed. (Found: {updated_count})")
                 
     df.to_csv(file_path, index=False)
+    if quota_error:
+        print(f"{quota_error} - stopped early, run again for the remaining rows.")
     print(f"Second Pass Done. Updated {updated_count} rows.")
 
 if __name__ == "__main__":
@@ -1,12 +1,9 @@
 from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-import time
 import csv
 from datetime import datetime
-import json
+
+from diningcode_harvest import scroll_and_harvest
 
 def setup_driver():
     """Chrome 드라이버 설정"""
@@ -23,99 +20,14 @@ def setup_driver():
 
 
 def scroll_and_collect_all(driver, url, target_count=122):
-    """스크롤하며 모든 식당 데이터 수집"""
-    
-    print(f"페이지 로딩 중: {url}")
-    driver.get(url)
-    
-    # 초기 로딩 대기
-    time.sleep(5)
-    
-    all_restaurants = []
-    last_count = 0
-    no_change_count = 0
-    scroll_pause_time = 2
+    """스크롤하며 모든 식당 데이터 수집 (새 데이터 로딩 신호가 오면 바로 다음 스크롤)"""
     
     print(f"\n목표: {target_count}개 식당 수집")
     print("스크롤하며 데이터 수집 시작...\n")
     
-    while len(all_restaurants) < target_count:
-        # 현재 페이지의 JavaScript 실행하여 listData 가져오기
-        try:
-            list_data_json = driver.execute_script("""
-                return localStorage.getItem('listData');
-            """)
-            
-            if list_data_json:
-                list_data = json.loads(list_data_json)
-                
-                if 'poi_section' in list_data and 'list' in list_data['poi_section']:
-                    current_restaurants = list_data['poi_section']['list']
-                    
-                    # 중복 제거하며 추가
-                    for restaurant in current_restaurants:
-                        name = restaurant.get('nm', '')
-                        branch = restaurant.get('branch', '')
-                        if branch:
-                            name = f"{name} {branch}"
-                        
-                        address = restaurant.get('road_addr', '') or restaurant.get('addr', '')
-                        
-                        # 중복 체크 (이름 + 주소)
-                        is_duplicate = False
-                        for existing in all_restaurants:
-                            if existing['name'] == name and existing['address'] == address:
-                                is_duplicate = True
-                                break
-                        
-                        if not is_duplicate:
-                            restaurant_data = {
-                                'name': name,
-                                'address': address,
-                                'category': restaurant.get('category', ''),
-                                'phone': restaurant.get('phone', ''),
-                                'lat': restaurant.get('lat', 0.0),
-                                'lng': restaurant.get('lng', 0.0),
-                                'score': restaurant.get('score', 0),
-                                'user_score': restaurant.get('user_score', 0.0),
-                                'review_cnt': restaurant.get('review_cnt', 0),
-                                'area': ', '.join(restaurant.get('area', [])),
-                            }
-                            all_restaurants.append(restaurant_data)
-                    
-                    current_count = len(all_restaurants)
-                    print(f"현재 수집: {current_count}개 / {target_count}개")
-                    
-                    # 변화가 없으면 카운트 증가
-                    if current_count == last_count:
-                        no_change_count += 1
-                    else:
-                        no_change_count = 0
-                        last_count = current_count
-                    
-                    # 5번 연속 변화 없으면 종료
-                    if no_change_count >= 5:
-                        print("\n더 이상 새로운 데이터가 로드되지 않습니다.")
-                        break
-        
-        except Exception as e:
-            print(f"데이터 추출 오류: {e}")
-        
-        # 페이지 끝까지 스크롤
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(scroll_pause_time)
-        
-        # 추가 스크롤 (더 많은 데이터 로드를 위해)
-        for _ in range(3):
-            driver.execute_script("window.scrollBy(0, 500);")
-            time.sleep(0.5)
-        
-        # 목표 달성 시 종료
-        if len(all_restaurants) >= target_count:
-            print(f"\n✅ 목표 달성! {len(all_restaurants)}개 수집 완료")
-            break
+    index = scroll_and_harvest(driver, url, target_count=target_count)
     
-    return all_restaurants
+    return index.restaurants
 
 
 def save_to_csv(restaurants, filename):
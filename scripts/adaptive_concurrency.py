@@ -0,0 +1,189 @@
+"""
+대량 조회용 적응형 동시성 제어 (AIMD)
+고정된 max_workers 대신 동시 요청 수 한도를 응답 상태에 맞춰 조절
+
+- 성공 + 지연 시간 정상: 한도 증가 (처음 제한에 걸리기 전까지는 성공마다 +1, 이후에는 한도만큼 성공할 때마다 +1)
+- 429 / 5xx / 타임아웃 등 네트워크 오류: 한도 절반 (한 번의 왕복 시간 안에 몰린 오류는 한 번만 반영),
+  해당 항목은 버리지 않고 잠시 뒤 재시도
+- 지연 시간이 최근 LATENCY_WINDOW 건의 최저 지연의 LATENCY_TOLERANCE 배를 넘으면: 한도를 조금 줄임
+  (서버 / 토큰 버킷 대기열이 쌓이는 중)
+- 캐시 적중 (network_calls 로 보아 실제 요청이 없었던 항목) 은 지연 시간 신호에서 제외
+  (수십 µs 의 캐시 응답이 기준 지연을 0 근처로 끌어내려 모든 실제 호출이 느린 것으로 보이지 않도록)
+
+사용법:
+    for item, result, error in run_adaptive(items, work, network_calls=client.thread_calls):
+        ...
+"""
+import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from naver_client import NaverAPIError
+from quota import QuotaExhausted
+
+DEFAULT_INITIAL = 4
+DEFAULT_MAX = 50
+LATENCY_TOLERANCE = 2.0
+LATENCY_WINDOW = 100  # 기준 (최저) 지연을 구하는 최근 성공 건수
+MAX_RETRIES = 5
+RETRY_BACKOFF = 0.5  # 초, 재시도마다 2배
+
+
+def is_throttled(error):
+    """동시성을 줄이고 재시도해야 하는 오류인지 (429, 5xx, 타임아웃 / 네트워크 오류)"""
+    if not isinstance(error, NaverAPIError) or isinstance(error, QuotaExhausted):
+        return False
+    return error.status is None or error.status == 429 or error.status >= 500
+
+
+class AdaptiveConcurrency:
+    """AIMD 동시성 한도 (스레드 간 공유)"""
+
+    def __init__(self, initial=DEFAULT_INITIAL, min_limit=1, max_limit=DEFAULT_MAX,
+                 latency_tolerance=LATENCY_TOLERANCE, latency_window=LATENCY_WINDOW):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = float(max(min_limit, min(initial, max_limit)))
+        self.peak = self.limit
+        self.latency_tolerance = latency_tolerance
+        self.min_latency = None
+        self.avg_latency = None
+        self.latencies = deque(maxlen=latency_window)
+        self.slow_start = True
+        self.successes = 0
+        self.cached = 0
+        self.throttles = 0
+        self.slowdowns = 0
+        self.errors = 0
+        self.retries = 0
+        self.backoffs = 0
+        self.started = time.monotonic()
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def current(self):
+        """지금 허용되는 동시 요청 수"""
+        return int(self.limit)
+
+    def _decrease(self, factor):
+        # 같은 왕복 시간 안에 끝난 요청들의 오류는 한 번만 반영
+        now = time.monotonic()
+        if now - self._last_decrease < (self.avg_latency or 0):
+            return
+        self._last_decrease = now
+        self.backoffs += 1
+        self.slow_start = False
+        self.limit = max(self.min_limit, self.limit * factor)
+
+    def on_success(self, latency):
+        with self._lock:
+            self.successes += 1
+            # 전체 기간 최저값이 아니라 최근 구간의 최저값 (한 번 튄 값이 기준을 계속 붙잡지 않도록)
+            self.latencies.append(latency)
+            self.min_latency = min(self.latencies)
+            self.avg_latency = latency if self.avg_latency is None else self.avg_latency * 0.8 + latency * 0.2
+
+            if self.avg_latency > self.min_latency * self.latency_tolerance:
+                self.slowdowns += 1
+                self._decrease(0.9)
+            else:
+                self.limit = min(self.max_limit, self.limit + (1 if self.slow_start else 1 / self.limit))
+                self.peak = max(self.peak, self.limit)
+
+    def on_cached(self):
+        """실제 요청 없이 끝난 성공 (캐시 적중): 지연 시간 / 한도에 반영하지 않음"""
+        with self._lock:
+            self.successes += 1
+            self.cached += 1
+
+    def on_throttle(self):
+        with self._lock:
+            self.throttles += 1
+            self._decrease(0.5)
+
+    def on_error(self):
+        with self._lock:
+            self.errors += 1
+
+    def summary(self):
+        elapsed = time.monotonic() - self.started
+        total = self.successes + self.throttles + self.errors
+        rate = total / elapsed if elapsed else 0
+        ok_rate = self.successes / elapsed if elapsed else 0
+        return (f"Adaptive concurrency: {total} requests in {elapsed:.1f}s ({rate:.1f} req/s, "
+                f"{ok_rate:.1f} successful/s, cached {self.cached}), throttling events {self.throttles} (retries {self.retries}), "
+                f"latency slowdowns {self.slowdowns}, backoffs {self.backoffs}, "
+                f"final limit {self.current} (peak {int(self.peak)})")
+
+
+def run_adaptive(items, work, controller=None, max_retries=MAX_RETRIES, backoff=RETRY_BACKOFF, stop_on=(),
+                 network_calls=None):
+    """items 를 work(item) 로 처리하며 완료 순서대로 (item, 결과, 오류) 를 반환하는 제너레이터
+
+    동시 실행 수는 controller 의 한도를 따르고, 제한 오류 (is_throttled) 는 max_retries 번까지
+    지수 백오프 후 다시 큐에 넣음 (재시도가 끝나도 실패하면 오류와 함께 반환)
+    stop_on 예외 (예: QuotaExhausted) 가 나오면 새 작업을 더 시작하지 않고, 진행 중인 작업을 마친 뒤
+    남은 항목을 모두 그 오류와 함께 반환
+    network_calls 는 현재 스레드의 실제 요청 수를 돌려주는 함수 (예: NaverClient.thread_calls),
+    work 전후로 값이 같으면 캐시 적중으로 보고 지연 시간 신호에서 제외
+    """
+    controller = controller or AdaptiveConcurrency()
+    queue = deque((item, 0, 0.0) for item in items)
+
+    def timed(item):
+        calls = network_calls() if network_calls else None
+        start = time.monotonic()
+        result = work(item)
+        latency = time.monotonic() - start
+        cached = network_calls is not None and network_calls() == calls
+        return result, latency, cached
+
+    stopped = None
+    with ThreadPoolExecutor(max_workers=controller.max_limit) as executor:
+        pending = {}
+        while (queue and not stopped) or pending:
+            # 한도 안에서 재시도 시각이 된 항목부터 제출
+            now = time.monotonic()
+            deferred = []
+            while queue and not stopped and len(pending) < controller.current:
+                item, attempts, not_before = queue.popleft()
+                if not_before > now:
+                    deferred.append((item, attempts, not_before))
+                    continue
+                pending[executor.submit(timed, item)] = (item, attempts)
+            queue.extendleft(reversed(deferred))
+
+            if not pending:
+                time.sleep(max(0.0, min(entry[2] for entry in queue) - now))
+                continue
+
+            done, _ = wait(pending, timeout=backoff, return_when=FIRST_COMPLETED)
+            for future in done:
+                item, attempts = pending.pop(future)
+                try:
+                    result, latency, cached = future.result()
+                except Exception as e:
+                    if isinstance(e, stop_on):
+                        stopped = e
+                    elif is_throttled(e):
+                        controller.on_throttle()
+                        if attempts < max_retries:
+                            controller.retries += 1
+                            queue.append((item, attempts + 1, time.monotonic() + backoff * 2 ** attempts))
+                            continue
+                    else:
+                        controller.on_error()
+                    yield item, None, e
+                    continue
+
+                if cached:
+                    controller.on_cached()
+                else:
+                    controller.on_success(latency)
+                yield item, result, None
+
+    if stopped:
+        for item, _, _ in queue:
+            yield item, None, stopped
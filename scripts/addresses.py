@@ -0,0 +1,91 @@
+"""
+주소 / 상호명 정규화 공용 함수
+같은 장소의 주소 표기 차이 (서울특별시/서울, 강원도/강원특별자치도, 층·호수 등 상세 주소, 괄호 참고 항목)를
+하나의 키로 모아 중복 지오코딩 / 중복 판정에 사용
+"""
+import functools
+import re
+import unicodedata
+
+# 시/도 표기 -> 짧은 표준 표기
+PROVINCE_ALIASES = {
+    '서울특별시': '서울', '서울시': '서울', '서울': '서울',
+    '부산광역시': '부산', '부산시': '부산', '부산': '부산',
+    '대구광역시': '대구', '대구시': '대구', '대구': '대구',
+    '인천광역시': '인천', '인천시': '인천', '인천': '인천',
+    '광주광역시': '광주', '광주': '광주',
+    '대전광역시': '대전', '대전시': '대전', '대전': '대전',
+    '울산광역시': '울산', '울산시': '울산', '울산': '울산',
+    '세종특별자치시': '세종', '세종시': '세종', '세종': '세종',
+    '경기도': '경기', '경기': '경기',
+    '강원도': '강원', '강원특별자치도': '강원', '강원': '강원',
+    '충청북도': '충북', '충북': '충북',
+    '충청남도': '충남', '충남': '충남',
+    '전라북도': '전북', '전북특별자치도': '전북', '전북': '전북',
+    '전라남도': '전남', '전남': '전남',
+    '경상북도': '경북', '경북': '경북',
+    '경상남도': '경남', '경남': '경남',
+    '제주특별자치도': '제주', '제주도': '제주', '제주': '제주',
+}
+
+# 도로명 주소: ...로/길 + 건물번호 (이후 층/호수/상호 등은 버림)
+ROAD_PATTERN = re.compile(r'(\S+(?:로|길))\s*(\d+(?:-\d+)?)(?![\d가-힣])')
+# 지번 주소: ...동/리/가 + (산) 번지
+JIBUN_PATTERN = re.compile(r'(\S+(?:동|리|가))\s+(산\s?)?(\d+(?:-\d+)?)(?![\d가-힣])')
+PARENTHESES = re.compile(r'\([^)]*\)|\[[^\]]*\]')
+NAME_NOISE = re.compile(r'[^0-9a-z가-힣]')
+
+
+@functools.lru_cache(maxsize=65536)
+def normalize_address(address):
+    """비교용 정규화 주소 (비어 있거나 '정보없음' 이면 '')
+
+    '서울특별시 마포구 연남로 25, 2층 (연남동)' -> '서울 마포구 연남로 25'
+    같은 주소를 여러 번 비교하는 중복 판정 / 후보 점수화를 위해 결과를 캐시
+    """
+    if not address:
+        return ''
+
+    text = unicodedata.normalize('NFC', str(address)).strip()
+    if text in ('', '정보없음', 'nan'):
+        return ''
+
+    text = PARENTHESES.sub(' ', text).replace(',', ' ')
+    parts = text.split()
+    if parts and parts[0] in PROVINCE_ALIASES:
+        parts[0] = PROVINCE_ALIASES[parts[0]]
+    text = ' '.join(parts)
+
+    match = ROAD_PATTERN.search(text) or JIBUN_PATTERN.search(text)
+    if match:
+        text = text[:match.end()]
+    return text
+
+
+def road_key(address):
+    """도로명 + 건물번호 키 (예: ('연남로', '25')), 도로명 주소가 아니면 None"""
+    match = ROAD_PATTERN.search(normalize_address(address))
+    return (match.group(1), match.group(2)) if match else None
+
+
+def is_partial_address(address):
+    """도로명 건물번호나 지번이 없는 주소인지 (예: '서울 강남구', '강릉 경포')"""
+    text = normalize_address(address)
+    return not (ROAD_PATTERN.search(text) or JIBUN_PATTERN.search(text))
+
+
+def region_tokens(address):
+    """정규화 주소의 시/도, 시/군/구 (앞 두 단어)"""
+    return tuple(normalize_address(address).split()[:2])
+
+
+def normalize_name(name):
+    """비교용 상호명 (괄호 내용, 공백, 기호 제거 + 소문자)
+
+    '옛날 초당순두부 (본점)' -> '옛날초당순두부'
+    """
+    if not name:
+        return ''
+    text = unicodedata.normalize('NFC', str(name)).lower()
+    text = PARENTHESES.sub('', text)
+    return NAME_NOISE.sub('', text)
@@ -1,60 +1,102 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-michelin_tier_mapping.csv의 (no, place-name)과 locations.csv의 (no, place_name)이
-일치하는 행에 tier를 적용하여 locations.csv에 michelin_tier 컬럼을 추가합니다.
+michelin_tier_mapping.csv의 tier를 locations.csv의 같은 장소 (place_id) 행에 적용하여
+locations.csv에 michelin_tier 컬럼을 추가합니다.
+
+no 는 재색인 때마다 바뀌므로 place_id (place_ids.py) 로 연결합니다.
+매핑에 place_id 가 없으면 (no, place-name), 그다음 가이드 행 중 상호명이 하나뿐인 행으로 찾아
+매핑 파일에 place_id 를 기록합니다 (다음부터는 place_id 로 바로 연결, 바뀐 ID 가 없으면 매핑 파일은 그대로).
+tier 는 가이드 행 (media_type == 'guide') 에만 적용합니다. 같은 장소의 방송 / 흑백요리사 행에 붙이면
+앱의 미쉐린 검색 필터에 방송 행이 미쉐린 항목으로 나오므로, 다른 행은 건드리지 않습니다.
 """
 import csv
 from pathlib import Path
 
+from addresses import normalize_name
+from place_ids import PlaceRegistry, assign_place_ids
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 MAPPING_PATH = PROJECT_ROOT / "doc" / "michelin_tier_mapping.csv"
 LOCATIONS_PATH = PROJECT_ROOT / "assets" / "data" / "locations.csv"
 
 
 def main():
-    # 1. mapping 로드: (no, place_name) -> tier (영문/한글 헤더 모두 처리)
-    tier_by_key = {}
-    with open(MAPPING_PATH, "r", encoding="utf-8-sig") as f:
+    # 1. locations 읽기 + place_id 부여 (등록부 기준이므로 다시 실행해도 같은 ID)
+    with open(LOCATIONS_PATH, "r", encoding="utf-8-sig") as f:
         reader = csv.DictReader(f)
-        for row in reader:
-            no = (row.get("no") or row.get("연번") or "").strip()
-            place_name = (row.get("place-name") or row.get("장소명") or "").strip()
-            tier = (row.get("tier") or row.get("미쉐린등급") or "").strip()
-            if no and place_name:
-                tier_by_key[(no, place_name)] = tier
+        fieldnames = list(reader.fieldnames)
+        rows = list(reader)
+
+    registry = PlaceRegistry()
+    place_ids, _ = assign_place_ids(rows, registry)
+    for row, place_id in zip(rows, place_ids):
+        row["place_id"] = place_id
+    for column in ("michelin_tier", "place_id"):
+        if column not in fieldnames:
+            fieldnames.append(column)
 
-    print(f"매핑 로드: {len(tier_by_key)}건")
+    place_id_by_key = {(row.get("no", "").strip(), row.get("place_name", "").strip()): row["place_id"] for row in rows}
+    guide_ids_by_name = {}
+    for row in rows:
+        if row.get("media_type", "").strip() == "guide":
+            guide_ids_by_name.setdefault(normalize_name(row.get("place_name")), set()).add(row["place_id"])
 
-    # 2. locations 읽기
-    with open(LOCATIONS_PATH, "r", encoding="utf-8") as f:
+    # 2. mapping 로드: place_id -> tier (영문/한글 헤더 모두 처리)
+    with open(MAPPING_PATH, "r", encoding="utf-8-sig") as f:
         reader = csv.DictReader(f)
-        fieldnames = list(reader.fieldnames)
-        rows = list(reader)
+        mapping_fields = list(reader.fieldnames)
+        mapping = list(reader)
 
-    if "michelin_tier" not in fieldnames:
-        fieldnames.append("michelin_tier")
+    tier_by_place = {}
+    unresolved = []
+    mapping_changed = "place_id" not in mapping_fields
+    for row in mapping:
+        no = (row.get("no") or row.get("연번") or "").strip()
+        place_name = (row.get("place-name") or row.get("장소명") or "").strip()
+        tier = (row.get("tier") or row.get("미쉐린등급") or "").strip()
+        place_id = registry.resolve((row.get("place_id") or "").strip()) or place_id_by_key.get((no, place_name))
+        if not place_id:
+            candidates = guide_ids_by_name.get(normalize_name(place_name), set())
+            place_id = next(iter(candidates)) if len(candidates) == 1 else ""
+        if row.get("place_id", "") != place_id:
+            row["place_id"] = place_id
+            mapping_changed = True
+        if place_id:
+            tier_by_place[place_id] = tier
+        elif place_name:
+            unresolved.append(place_name)
+
+    print(f"매핑 로드: {len(tier_by_place)}건 (장소를 찾지 못함: {len(unresolved)}건 {unresolved[:5]})")
 
     matched = 0
     for row in rows:
-        no = row.get("no", "").strip()
-        place_name = row.get("place_name", "").strip()
-        key = (no, place_name)
-        tier = tier_by_key.get(key, "")
+        if row.get("media_type", "").strip() != "guide":
+            continue
+        tier = tier_by_place.get(row["place_id"], "")
         row["michelin_tier"] = tier
         if tier:
             matched += 1
 
     print(f"일치하여 tier 적용: {matched}건")
 
-    # 3. 저장
-    with open(LOCATIONS_PATH, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+    # 3. 저장 (매핑은 place_id 가 바뀌었을 때만 다시 씀, 원본처럼 BOM 없이)
+    with open(LOCATIONS_PATH, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator="\n")
         writer.writeheader()
         writer.writerows(rows)
-
     print(f"저장 완료: {LOCATIONS_PATH}")
 
+    if mapping_changed:
+        if "place_id" not in mapping_fields:
+            mapping_fields.append("place_id")
+        with open(MAPPING_PATH, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=mapping_fields, lineterminator="\n")
+            writer.writeheader()
+            writer.writerows(mapping)
+        print(f"매핑에 place_id 기록: {MAPPING_PATH}")
+    registry.save()
+
 
 if __name__ == "__main__":
     main()
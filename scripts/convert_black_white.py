@@ -1,10 +1,11 @@
 import csv
-import requests
-import time
 import os
 from dotenv import load_dotenv
 from datetime import datetime
 
+from geocode_batch import batch_geocode
+from naver_client import NaverAPIError, QuotaExhausted, get_client
+
 # .env 파일 로드
 load_dotenv()
 
@@ -14,39 +15,22 @@ NAVER_CLIENT_SECRET = os.getenv('NAVER_MAP_CLIENT_SECRET') or os.getenv('NAVER_S
 
 def geocode_address(address):
     """Naver Cloud Platform Geocoding API를 사용하여 주소를 위도/경도로 변환"""
-    url = "https://maps.apigw.ntruss.com/map-geocode/v2/geocode"
-    
-    headers = {
-        "x-ncp-apigw-api-key-id": NAVER_CLIENT_ID,
-        "x-ncp-apigw-api-key": NAVER_CLIENT_SECRET,
-        "Accept": "application/json"
-    }
-    
-    params = {
-        "query": address
-    }
-    
     try:
-        response = requests.get(url, headers=headers, params=params)
-        
-        if response.status_code != 200:
-            print(f"  [X] API 오류 ({response.status_code}): {address}")
-            return '0.0', '0.0', False
-        
-        data = response.json()
-        
-        if data.get('status') == 'OK' and data.get('addresses'):
-            result = data['addresses'][0]
-            lat = result.get('y', '0.0')
-            lng = result.get('x', '0.0')
-            return lat, lng, True
+        result = get_client().geocode(address)
+    except QuotaExhausted:
+        raise
+    except NaverAPIError as e:
+        if e.status:
+            print(f"  [X] API 오류 ({e.status}): {address}")
         else:
-            print(f"  [!] Geocoding 실패: {address}")
-            return '0.0', '0.0', False
-            
-    except Exception as e:
-        print(f"  [X] 예외 발생: {address} - {str(e)}")
+            print(f"  [X] 예외 발생: {address} - {str(e)}")
         return '0.0', '0.0', False
+    
+    if result:
+        return result.get('y', '0.0'), result.get('x', '0.0'), True
+    
+    print(f"  [!] Geocoding 실패: {address}")
+    return '0.0', '0.0', False
 
 def convert_black_white_data(season_num, input_file, start_id):
     """흑백요리사 데이터를 앱 형식으로 변환"""
@@ -54,54 +38,57 @@ def convert_black_white_data(season_num, input_file, start_id):
     
     with open(input_file, 'r', encoding='utf-8') as f:
         reader = csv.reader(f)
+        rows = [(idx, row) for idx, row in enumerate(reader) if len(row) >= 14]
+    
+    # 같은 주소는 한 번만 조회하도록 주소 단위로 일괄 Geocoding
+    quota_left = set()
+    coords = batch_geocode([row[9].strip() for _, row in rows], [row[3].strip() for _, row in rows],
+                           quota_left=quota_left)
+    
+    for i, ((idx, row), coord) in enumerate(zip(rows, coords)):
+        # 컬럼: 0=연번, 1=show, 2=제목, 3=장소명, 4=타입, 5=쉐프명, 6-8=빈값, 9=주소, 10-11=좌표, 12=전화, 13=날짜
+        restaurant_name = row[3].strip()
+        chef_name = row[5].strip()
+        address = row[9].strip()
+        phone = row[12].strip() if row[12] else "정보없음"
+        
+        # 장소 설명 생성 (쉐프 이름 포함)
+        description = f"흑백요리사 시즌{season_num} 참가. 쉐프: {chef_name}"
+        
+        print(f"\n[{idx+1}] {restaurant_name}")
+        print(f"  주소: {address}")
+        print(f"  쉐프: {chef_name}")
+        
+        if coord:
+            lat, lng = coord
+            print(f"  [OK] 좌표: ({lat}, {lng})")
+        elif i in quota_left:
+            # 실패 (0.0) 가 아니라 빈 좌표로 두고 다음 실행에서 조회
+            lat, lng = '', ''
+            print(f"  [WAIT] 일일 한도 소진 - 좌표 비움, 다음 실행에서 조회")
+        else:
+            lat, lng = '0.0', '0.0'
+            print(f"  [!] 좌표 실패 - 0.0으로 설정")
+        
+        # CSV 행 생성
+        output_row = [
+            str(start_id + idx),                    # 연번
+            "show",                                  # 미디어타입
+            f"흑백요리사 시즌{season_num}",          # 제목
+            restaurant_name,                         # 장소명
+            "restaurant",                            # 장소타입
+            description,                             # 장소설명 (쉐프 포함)
+            "정보없음",                              # 영업시간
+            "정보없음",                              # 브레이크타임
+            "정보없음",                              # 휴무일
+            address,                                 # 주소
+            lat,                                     # 위도
+            lng,                                     # 경도
+            phone,                                   # 전화번호
+            datetime.now().strftime("%Y-%m-%d")     # 최종작성일
+        ]
         
-        for idx, row in enumerate(reader):
-            if len(row) < 14:
-                continue
-            
-            # 컬럼: 0=연번, 1=show, 2=제목, 3=장소명, 4=타입, 5=쉐프명, 6-8=빈값, 9=주소, 10-11=좌표, 12=전화, 13=날짜
-            restaurant_name = row[3].strip()
-            chef_name = row[5].strip()
-            address = row[9].strip()
-            phone = row[12].strip() if row[12] else "정보없음"
-            
-            # 장소 설명 생성 (쉐프 이름 포함)
-            description = f"흑백요리사 시즌{season_num} 참가. 쉐프: {chef_name}"
-            
-            # Geocoding
-            print(f"\n[{idx+1}] {restaurant_name}")
-            print(f"  주소: {address}")
-            print(f"  쉐프: {chef_name}")
-            
-            lat, lng, success = geocode_address(address)
-            
-            if success:
-                print(f"  [OK] 좌표: ({lat}, {lng})")
-            else:
-                print(f"  [!] 좌표 실패 - 0.0으로 설정")
-            
-            # CSV 행 생성
-            output_row = [
-                str(start_id + idx),                    # 연번
-                "show",                                  # 미디어타입
-                f"흑백요리사 시즌{season_num}",          # 제목
-                restaurant_name,                         # 장소명
-                "restaurant",                            # 장소타입
-                description,                             # 장소설명 (쉐프 포함)
-                "정보없음",                              # 영업시간
-                "정보없음",                              # 브레이크타임
-                "정보없음",                              # 휴무일
-                address,                                 # 주소
-                lat,                                     # 위도
-                lng,                                     # 경도
-                phone,                                   # 전화번호
-                datetime.now().strftime("%Y-%m-%d")     # 최종작성일
-            ]
-            
-            output_rows.append(output_row)
-            
-            # API 제한 방지
-            time.sleep(0.2)
+        output_rows.append(output_row)
     
     return output_rows
 
@@ -0,0 +1,233 @@
+"""
+좌표 변환 공용 함수
+- 네이버 검색 API mapx/mapy: WGS84 경위도 x 1e7 정수 (예: 1269780000, 375660000)
+- 예전 네이버 검색 API mapx/mapy: KATECH (TM128, 미터 단위 정수, 예: 309999, 552000)
+- 역변환: WGS84 -> 1e7 정수 / TM128
+
+pyproj Transformer 는 처음 필요할 때 한 번만 만들고, *_many 함수는 열 전체를 numpy 배열로 한 번에 변환
+(행마다 Proj / Transformer 를 새로 만드는 기존 방식 대비 수백 배 빠름, python coords.py --bench 로 확인)
+
+numpy 가 없으면 *_many 는 리스트로 한 건씩 변환, pyproj 가 없으면 TM128 변환은 None 반환
+"""
+import functools
+import math
+import sys
+import time
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from pyproj import Transformer
+    PYPROJ_AVAILABLE = True
+except ImportError:
+    PYPROJ_AVAILABLE = False
+
+# KATECH (TM128) 좌표계
+TM128_PROJ = ('+proj=tmerc +lat_0=38 +lon_0=128 +k=0.9999 +x_0=400000 +y_0=600000 +ellps=bessel '
+              '+units=m +no_defs +towgs84=-115.80,474.99,674.11,1.16,-2.31,-1.63,6.43')
+WGS84_PROJ = '+proj=longlat +datum=WGS84 +no_defs'
+
+NAVER_SCALE = 1e7
+# 이보다 큰 mapx 는 1e7 배율 WGS84 (경도 124~132 -> 1.24e9~1.32e9), 작으면 TM128 미터 좌표
+NAVER_SCALED_MIN = 1e8
+
+
+@functools.lru_cache(maxsize=None)
+def get_transformer(source=TM128_PROJ, target=WGS84_PROJ):
+    """(source, target) 별로 한 번만 만드는 Transformer (x=경도/동향, y=위도/북향 순서)"""
+    if not PYPROJ_AVAILABLE:
+        raise RuntimeError("pyproj is not installed (pip install pyproj)")
+    return Transformer.from_crs(source, target, always_xy=True)
+
+
+def to_float(value):
+    """숫자 / 숫자 문자열 -> float, 비어 있거나 잘못된 값은 nan"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _float_array(values):
+    """열 (리스트 / Series / 배열) -> float 배열 (잘못된 값은 nan)"""
+    try:
+        return np.array(values, dtype=float)
+    except (TypeError, ValueError):
+        return np.fromiter((to_float(v) for v in values), dtype=float)
+
+
+def _optional(lat, lng):
+    """nan 이 섞인 결과는 (None, None)"""
+    if math.isnan(lat) or math.isnan(lng):
+        return None, None
+    return lat, lng
+
+
+# ---------------------------------------------------------------------------
+# 한 건씩
+# ---------------------------------------------------------------------------
+
+def tm128_to_wgs84(x, y):
+    """TM128 (x, y) -> (lat, lng), 변환할 수 없으면 (None, None)"""
+    x, y = to_float(x), to_float(y)
+    if not PYPROJ_AVAILABLE or math.isnan(x) or math.isnan(y):
+        return None, None
+    lng, lat = get_transformer().transform(x, y)
+    return _optional(lat, lng)
+
+
+def wgs84_to_tm128(lat, lng):
+    """(lat, lng) -> TM128 (x, y), 변환할 수 없으면 (None, None)"""
+    lat, lng = to_float(lat), to_float(lng)
+    if not PYPROJ_AVAILABLE or math.isnan(lat) or math.isnan(lng):
+        return None, None
+    x, y = get_transformer(WGS84_PROJ, TM128_PROJ).transform(lng, lat)
+    return x, y
+
+
+def naver_to_wgs84(mapx, mapy):
+    """네이버 검색 결과 mapx/mapy -> (lat, lng), 없거나 잘못된 값이면 (None, None)
+
+    1e7 배율 WGS84 정수와 예전 TM128 좌표를 값의 크기로 구분
+    """
+    x, y = to_float(mapx), to_float(mapy)
+    if math.isnan(x) or math.isnan(y):
+        return None, None
+    if abs(x) < NAVER_SCALED_MIN:
+        return tm128_to_wgs84(x, y)
+    return y / NAVER_SCALE, x / NAVER_SCALE
+
+
+def wgs84_to_naver(lat, lng):
+    """(lat, lng) -> 네이버 1e7 배율 (mapx, mapy) 정수"""
+    return round(to_float(lng) * NAVER_SCALE), round(to_float(lat) * NAVER_SCALE)
+
+
+def item_to_wgs84(item):
+    """검색 결과 item 의 좌표 (lat, lng) 또는 (None, None)"""
+    return naver_to_wgs84(item.get('mapx'), item.get('mapy'))
+
+
+# ---------------------------------------------------------------------------
+# 열 단위 (벡터화)
+# ---------------------------------------------------------------------------
+
+def tm128_to_wgs84_many(xs, ys):
+    """TM128 좌표 열 -> (lat 배열, lng 배열), 변환할 수 없는 값은 nan"""
+    if not NUMPY_AVAILABLE:
+        pairs = [tm128_to_wgs84(x, y) for x, y in zip(xs, ys)]
+        return [p[0] for p in pairs], [p[1] for p in pairs]
+    if not PYPROJ_AVAILABLE:
+        nan = np.full(len(xs), np.nan)
+        return nan, nan.copy()
+    lng, lat = get_transformer().transform(_float_array(xs), _float_array(ys))
+    lat, lng = np.asarray(lat), np.asarray(lng)
+    bad = ~(np.isfinite(lat) & np.isfinite(lng))
+    lat[bad] = np.nan
+    lng[bad] = np.nan
+    return lat, lng
+
+
+def wgs84_to_tm128_many(lats, lngs):
+    """(lat, lng) 열 -> TM128 (x 배열, y 배열)"""
+    if not NUMPY_AVAILABLE:
+        pairs = [wgs84_to_tm128(lat, lng) for lat, lng in zip(lats, lngs)]
+        return [p[0] for p in pairs], [p[1] for p in pairs]
+    x, y = get_transformer(WGS84_PROJ, TM128_PROJ).transform(_float_array(lngs), _float_array(lats))
+    return np.asarray(x), np.asarray(y)
+
+
+def naver_to_wgs84_many(mapxs, mapys):
+    """mapx/mapy 열 -> (lat 배열, lng 배열), 1e7 배율과 TM128 이 섞여 있어도 각각 변환, 잘못된 값은 nan"""
+    if not NUMPY_AVAILABLE:
+        pairs = [naver_to_wgs84(x, y) for x, y in zip(mapxs, mapys)]
+        return [p[0] for p in pairs], [p[1] for p in pairs]
+    x, y = _float_array(mapxs), _float_array(mapys)
+    missing = np.isnan(x) | np.isnan(y)
+    x[missing] = np.nan
+    y[missing] = np.nan
+    lat, lng = y / NAVER_SCALE, x / NAVER_SCALE
+
+    legacy = np.abs(x) < NAVER_SCALED_MIN
+    if legacy.any():
+        lat[legacy], lng[legacy] = tm128_to_wgs84_many(x[legacy], y[legacy])
+    return lat, lng
+
+
+def wgs84_to_naver_many(lats, lngs):
+    """(lat, lng) 열 -> 1e7 배율 (mapx, mapy) int64 배열"""
+    if not NUMPY_AVAILABLE:
+        pairs = [wgs84_to_naver(lat, lng) for lat, lng in zip(lats, lngs)]
+        return [p[0] for p in pairs], [p[1] for p in pairs]
+    return (np.rint(_float_array(lngs) * NAVER_SCALE).astype(np.int64),
+            np.rint(_float_array(lats) * NAVER_SCALE).astype(np.int64))
+
+
+# ---------------------------------------------------------------------------
+# 벤치마크: python coords.py --bench [점 개수]
+# ---------------------------------------------------------------------------
+
+def _legacy_tm128(mapx, mapy):
+    """기존 enhance_addresses.convert_katech_to_wgs84 방식 (호출마다 Proj / Transformer 생성)"""
+    from pyproj import Proj
+    proj_katech = Proj(TM128_PROJ)
+    proj_wgs84 = Proj(proj='latlong', datum='WGS84')
+    transformer = Transformer.from_proj(proj_katech, proj_wgs84)
+    lon, lat = transformer.transform(float(mapx), float(mapy))
+    return str(lat), str(lon)
+
+
+def _timed(label, n, func, *args):
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<44} {elapsed * 1e6 / n:10.2f} µs/row  ({elapsed:.3f}s / {n:,})")
+    return elapsed
+
+
+def benchmark(n=100000, legacy_sample=500):
+    if not (NUMPY_AVAILABLE and PYPROJ_AVAILABLE):
+        print("numpy / pyproj 가 필요합니다 (pip install numpy pyproj)")
+        return
+
+    rng = np.random.default_rng(0)
+    lats = rng.uniform(33.2, 38.5, n)
+    lngs = rng.uniform(124.8, 131.8, n)
+    mapx, mapy = wgs84_to_naver_many(lats, lngs)
+    mapx_str, mapy_str = [str(v) for v in mapx], [str(v) for v in mapy]
+    tm_x, tm_y = wgs84_to_tm128_many(lats, lngs)
+    get_transformer()
+
+    print(f"[좌표 변환 벤치마크] {n:,}개 점")
+    print("TM128 -> WGS84")
+    sample = min(n, legacy_sample)
+    _timed("행마다 Proj/Transformer 생성 (기존)", sample,
+           lambda: [_legacy_tm128(x, y) for x, y in zip(tm_x[:sample], tm_y[:sample])])
+    _timed("캐시된 Transformer, 한 건씩", n, lambda: [tm128_to_wgs84(x, y) for x, y in zip(tm_x, tm_y)])
+    _timed("캐시된 Transformer, 열 단위 (벡터화)", n, tm128_to_wgs84_many, tm_x, tm_y)
+
+    print("네이버 1e7 mapx/mapy -> WGS84")
+    _timed("한 건씩 float() / 1e7 (문자열)", n, lambda: [naver_to_wgs84(x, y) for x, y in zip(mapx_str, mapy_str)])
+    _timed("열 단위 (문자열)", n, naver_to_wgs84_many, mapx_str, mapy_str)
+    _timed("열 단위 (정수 배열)", n, naver_to_wgs84_many, mapx, mapy)
+    print("WGS84 -> 네이버 1e7 / TM128")
+    _timed("열 단위 -> 1e7", n, wgs84_to_naver_many, lats, lngs)
+    _timed("열 단위 -> TM128", n, wgs84_to_tm128_many, lats, lngs)
+
+    # 왕복 오차
+    back_lat, back_lng = tm128_to_wgs84_many(tm_x, tm_y)
+    err = max(np.abs(back_lat - lats).max(), np.abs(back_lng - lngs).max())
+    print(f"TM128 왕복 최대 오차: {err:.2e}도")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--bench':
+        benchmark(int(sys.argv[2]) if len(sys.argv) > 2 else 100000)
+    elif len(sys.argv) == 3:
+        print(naver_to_wgs84(sys.argv[1], sys.argv[2]))
+    else:
+        print(__doc__)
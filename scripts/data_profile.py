@@ -0,0 +1,404 @@
+"""
+locations.csv 데이터 품질 프로파일 (한 번 읽기)
+analyze_data.py / analyze_detailed.py / analyze_filters.py / check_*.py 가 각각 파일 전체를 메모리에 올리고
+항목마다 다시 훑던 집계를, 파일을 한 줄씩 한 번만 읽으며 모두 갱신하여 JSON 보고서로 저장
+
+  - 분포: media_type, place_type, title, michelin_tier, food_category, media_type + place_type, 시/도
+  - 열별 누락률 ('', '정보없음', 'nan'), 헤더와 열 수가 다른 행
+  - 날짜 범위 (last_updated), 좌표 범위 / 커버리지 / 국내 범위 밖 좌표
+  - 중복 키: 전체 열 (no 제외), 상호명 + 주소 + 작품, 상호명
+  - 좌표 충돌: 같은 주소인데 좌표가 다른 행
+
+메모리는 행 수와 무관하게 일정: 키별 정확한 집계는 KEY_LIMIT 개까지만 보관하고,
+그 뒤로는 HyperLogLog 로 고유 키 수를 추정 (보고서에 exact: false 로 표시)
+
+사용법:
+  python data_profile.py                          # assets/data/locations.csv -> data_profile.json
+  python data_profile.py 파일.csv --out report.json
+  python data_profile.py --bench 1000000          # 합성 100만 행 파일로 속도 / 메모리 확인
+"""
+import csv
+import heapq
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+
+from addresses import PROVINCE_ALIASES
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_INPUT = os.path.join(ROOT_DIR, 'assets', 'data', 'locations.csv')
+DEFAULT_OUTPUT = os.path.join(ROOT_DIR, 'data_profile.json')
+
+MISSING_VALUES = frozenset(('', ' ', '정보없음', 'nan', 'None'))
+# 키별 정확한 집계를 보관하는 최대 키 수 (키당 약 200바이트)
+KEY_LIMIT = 50000
+TOP_N = 20
+# 분포를 끝까지 세는 열 (값 종류가 적은 열만, 작품명은 수백 개 수준)
+DISTRIBUTION_COLUMNS = ('media_type', 'place_type', 'title', 'michelin_tier', 'food_category')
+LAT_RANGE = (33.0, 39.0)
+LNG_RANGE = (124.0, 132.0)
+MAX_CONFLICT_COORDS = 5
+MAX_NAME_TITLES = 20
+HASH_MASK = 0xFFFFFFFFFFFFFFFF
+
+
+class DistinctCounter:
+    """HyperLogLog 고유 개수 추정 (2^precision 바이트 고정 메모리, 오차 약 1.04/sqrt(2^precision))"""
+
+    def __init__(self, precision=14):
+        self.precision = precision
+        self.size = 1 << precision
+        self.registers = bytearray(self.size)
+
+    def add(self, hashed):
+        """64비트 해시 하나 추가"""
+        index = hashed >> (64 - self.precision)
+        rest = (hashed << self.precision) & HASH_MASK
+        rank = min(64 - rest.bit_length() + 1, 64 - self.precision + 1)
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def estimate(self):
+        m = self.size
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if raw <= 2.5 * m and zeros:
+            return round(m * math.log(m / zeros))
+        return round(raw)
+
+
+class KeyTracker:
+    """키별 [개수, 첫 값] 을 limit 개까지 정확히 보관, 넘으면 그때부터 고유 키 수를 HyperLogLog 로 추정
+
+    키는 hash() 로 64비트 정수로 줄여 보관 (한 번의 실행 안에서만 비교하므로 해시 무작위화와 무관)
+    """
+
+    def __init__(self, limit=KEY_LIMIT):
+        self.limit = limit
+        self.entries = {}
+        self.sketch = None
+        self.rows = 0
+
+    @property
+    def overflow(self):
+        return self.sketch is not None
+
+    def add(self, key, sample):
+        """키 1회 추가 후 보관 중인 항목 (한도를 넘어 보관하지 못한 새 키는 None)"""
+        hashed = hash(key) & HASH_MASK
+        self.rows += 1
+        entry = self.entries.get(hashed)
+        if entry is not None:
+            entry[0] += 1
+            return entry
+        if len(self.entries) < self.limit:
+            entry = [1, sample]
+            self.entries[hashed] = entry
+            return entry
+        if self.sketch is None:
+            # 한도에 처음 닿으면 지금까지의 키로 추정기를 만들고 이후 키를 계속 추가
+            self.sketch = DistinctCounter()
+            for known in self.entries:
+                self.sketch.add(known)
+        self.sketch.add(hashed)
+        return None
+
+    def distinct(self):
+        return self.sketch.estimate() if self.overflow else len(self.entries)
+
+    def report(self, top=TOP_N, detail=None):
+        """detail 을 주면 항목의 세 번째 값 (집합) 크기를 top 항목에 그 이름으로 함께 기록"""
+        repeated = [entry for entry in self.entries.values() if entry[0] > 1]
+        distinct = self.distinct()
+        top_entries = []
+        for entry in heapq.nlargest(top, repeated, key=lambda e: e[0]):
+            item = {'count': entry[0], 'key': entry[1]}
+            if detail:
+                item[detail] = len(entry[2]) if len(entry) > 2 else 1
+            top_entries.append(item)
+        return {
+            'exact': not self.overflow,
+            'distinct': distinct,
+            'duplicate_keys': len(repeated) if not self.overflow else None,
+            'duplicate_rows': max(0, self.rows - distinct),
+            'top': top_entries,
+        }
+
+
+class Profile:
+    """행 (열 목록) 을 하나씩 받아 모든 집계를 갱신"""
+
+    def __init__(self, columns, key_limit=KEY_LIMIT):
+        self.columns = list(columns)
+        self.index = {column: i for i, column in enumerate(self.columns)}
+        self.rows = 0
+        self.malformed = 0
+        # 열별 누락 여부 조합 -> 행 수 (조합 종류는 많지 않으므로 행마다 열을 하나씩 세는 대신 조합을 셈)
+        self.missing_patterns = Counter()
+        self.distributions = {column: Counter() for column in DISTRIBUTION_COLUMNS if column in self.index}
+        self.media_place = Counter()
+        self.regions = Counter()
+        self.blackwhite_titles = Counter()
+        self.date_min = self.date_max = None
+        self.invalid_dates = 0
+        self.with_coords = 0
+        self.out_of_range = 0
+        self.lat_min = self.lng_min = math.inf
+        self.lat_max = self.lng_max = -math.inf
+        self.exact_rows = KeyTracker(key_limit)
+        self.name_address_title = KeyTracker(key_limit)
+        self.place_names = KeyTracker(key_limit)
+        self.address_coords = KeyTracker(key_limit)
+
+        # 없는 열은 행 끝에 붙이는 빈 값 자리를 가리킴
+        blank = len(self.columns)
+        (self._no, self._media_type, self._place_type, self._title, self._place_name, self._address,
+         self._latitude, self._longitude, self._last_updated) = (self.index.get(name, blank) for name in (
+            'no', 'media_type', 'place_type', 'title', 'place_name', 'address', 'latitude', 'longitude',
+            'last_updated'))
+        self._distribution_positions = [(self.index[c], counter) for c, counter in self.distributions.items()]
+        self._is_missing = MISSING_VALUES.__contains__
+
+    def add(self, row):
+        self.rows += 1
+        width = len(self.columns)
+        if len(row) != width:
+            self.malformed += 1
+            row = (row + [''] * width)[:width]
+
+        self.missing_patterns[tuple(map(self._is_missing, row))] += 1
+        row.append('')
+        for position, counter in self._distribution_positions:
+            counter[row[position].strip()] += 1
+
+        media_type = row[self._media_type].strip()
+        title = row[self._title].strip()
+        self.media_place[(media_type, row[self._place_type].strip())] += 1
+        if media_type == 'blackwhite':
+            self.blackwhite_titles[title] += 1
+
+        address = row[self._address].strip()
+        if address and address not in MISSING_VALUES:
+            first = address.split(None, 1)[0]
+            self.regions[PROVINCE_ALIASES.get(first, first)] += 1
+
+        self._add_date(row[self._last_updated].strip())
+        coords = self._add_coords(row[self._latitude], row[self._longitude])
+
+        name = row[self._place_name].strip()
+        no = self._no
+        self.exact_rows.add(tuple(row[:no] + row[no + 1:width]), f"{name} | {title} | {address}")
+        self.name_address_title.add((name, address, title), f"{name} | {address} | {title}")
+        if name:
+            # 장소명별로 등장한 작품 (최대 MAX_NAME_TITLES 개) - "N개 작품에 등장" 집계용
+            entry = self.place_names.add(name, name)
+            if entry is not None:
+                if len(entry) == 2:
+                    entry.append(set())
+                if len(entry[2]) < MAX_NAME_TITLES:
+                    entry[2].add(title)
+        if address and coords:
+            entry = self.address_coords.add(address, address)
+            if entry is not None:
+                if len(entry) == 2:
+                    entry.append(set())
+                if len(entry[2]) < MAX_CONFLICT_COORDS:
+                    entry[2].add(coords)
+
+    def missing_counts(self):
+        counts = [0] * len(self.columns)
+        for pattern, rows in self.missing_patterns.items():
+            for i, missing in enumerate(pattern):
+                if missing:
+                    counts[i] += rows
+        return dict(zip(self.columns, counts))
+
+    def _add_date(self, value):
+        if not value:
+            return
+        # YYYY-MM-DD 만 유효한 날짜로 봄 (문자열 비교로 범위 계산)
+        if len(value) != 10 or value[4] != '-' or value[7] != '-' or not (value[:4] + value[5:7] + value[8:]).isdigit():
+            self.invalid_dates += 1
+            return
+        if self.date_min is None or value < self.date_min:
+            self.date_min = value
+        if self.date_max is None or value > self.date_max:
+            self.date_max = value
+
+    def _add_coords(self, lat, lng):
+        try:
+            lat, lng = float(lat), float(lng)
+        except (TypeError, ValueError):
+            return None
+        if math.isnan(lat) or math.isnan(lng) or not (lat and lng):
+            return None
+        self.with_coords += 1
+        if lat < self.lat_min:
+            self.lat_min = lat
+        if lat > self.lat_max:
+            self.lat_max = lat
+        if lng < self.lng_min:
+            self.lng_min = lng
+        if lng > self.lng_max:
+            self.lng_max = lng
+        if not (LAT_RANGE[0] <= lat <= LAT_RANGE[1] and LNG_RANGE[0] <= lng <= LNG_RANGE[1]):
+            self.out_of_range += 1
+        return round(lat, 6), round(lng, 6)
+
+    def _coordinate_conflicts(self, top=TOP_N):
+        conflicts = [(entry[0], entry[1], entry[2]) for entry in self.address_coords.entries.values()
+                     if len(entry) > 2 and len(entry[2]) > 1]
+        return {
+            'exact': not self.address_coords.overflow,
+            'addresses': len(conflicts),
+            'rows': sum(count for count, _, _ in conflicts),
+            'top': [{'address': address, 'rows': count, 'coords': sorted(coords)}
+                    for count, address, coords in heapq.nlargest(top, conflicts, key=lambda c: c[0])],
+        }
+
+    def report(self):
+        total = self.rows or 1
+        missing = self.missing_counts()
+
+        def distribution(counter, top=None):
+            items = counter.most_common(top)
+            return {'distinct': len(counter), 'counts': dict(items)}
+
+        return {
+            # data_structure.json 과 같은 키
+            'total_records': self.rows,
+            'columns': self.columns,
+            'media_types': sorted(self.distributions.get('media_type', {})),
+            'place_types': sorted(self.distributions.get('place_type', {})),
+            'date_range': {'start': self.date_min, 'end': self.date_max, 'invalid': self.invalid_dates},
+            'coordinate_coverage': {
+                'total': self.rows,
+                'with_coords': self.with_coords,
+                'coverage_percent': self.with_coords / total * 100,
+                'latitude_range': [self.lat_min, self.lat_max] if self.with_coords else None,
+                'longitude_range': [self.lng_min, self.lng_max] if self.with_coords else None,
+                'out_of_korea': self.out_of_range,
+            },
+            # 추가 집계
+            'malformed_rows': self.malformed,
+            'missing': {column: {'count': count, 'percent': count / total * 100}
+                        for column, count in missing.items()},
+            'distributions': {column: distribution(counter, None if column != 'title' else TOP_N * 5)
+                              for column, counter in self.distributions.items()},
+            'media_place': distribution(Counter({f"{m} + {p}": n for (m, p), n in self.media_place.items()}), TOP_N),
+            'regions': distribution(self.regions),
+            'blackwhite_titles': sorted(self.blackwhite_titles),
+            'duplicates': {
+                'exact_rows': self.exact_rows.report(),
+                'name_address_title': self.name_address_title.report(),
+                'place_name': self.place_names.report(detail='titles'),
+            },
+            'coordinate_conflicts': self._coordinate_conflicts(),
+        }
+
+
+def profile_file(path, key_limit=KEY_LIMIT):
+    """CSV 를 한 번 읽어 (보고서 dict, 초) 반환"""
+    started = time.perf_counter()
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.reader(f)
+        profile = Profile(next(reader, []), key_limit)
+        add = profile.add
+        for row in reader:
+            add(row)
+    elapsed = time.perf_counter() - started
+    report = profile.report()
+    report['source'] = os.path.relpath(path, ROOT_DIR) if path.startswith(ROOT_DIR) else path
+    report['generated'] = time.strftime('%Y-%m-%d %H:%M:%S')
+    report['seconds'] = round(elapsed, 3)
+    return report, elapsed
+
+
+def print_summary(report):
+    rows = report['total_records']
+    coverage = report['coordinate_coverage']
+    print(f"[Profile] {rows:,}행, {len(report['columns'])}열 ({report['seconds']:.2f}초, "
+          f"{rows / max(report['seconds'], 1e-9):,.0f}행/초), 열 수가 다른 행 {report['malformed_rows']}")
+    print(f"  좌표 커버리지 {coverage['coverage_percent']:.2f}% (국내 범위 밖 {coverage['out_of_korea']}), "
+          f"날짜 {report['date_range']['start']} ~ {report['date_range']['end']}")
+    missing = sorted(report['missing'].items(), key=lambda item: -item[1]['count'])[:5]
+    print("  누락률 상위: " + ', '.join(f"{column} {value['percent']:.1f}%" for column, value in missing))
+    for name, duplicate in report['duplicates'].items():
+        estimated = '' if duplicate['exact'] else ' (추정)'
+        print(f"  중복 {name}: 고유 {duplicate['distinct']:,}, 중복 행 {duplicate['duplicate_rows']:,}{estimated}")
+    conflicts = report['coordinate_conflicts']
+    print(f"  같은 주소 좌표 충돌: {conflicts['addresses']}개 주소 ({conflicts['rows']}행)")
+
+
+def write_synthetic(path, rows, source=DEFAULT_INPUT, seed=0):
+    """source 행을 섞고 좌표 / 번호를 바꿔 rows 행짜리 합성 파일 작성 (한 줄씩 쓰므로 메모리 일정)"""
+    with open(source, 'r', encoding='utf-8-sig', newline='') as f:
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames
+        samples = list(reader)
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator='\n')
+        writer.writeheader()
+        for i in range(rows):
+            row = dict(rng.choice(samples))
+            row['no'] = str(i + 1)
+            if rng.random() < 0.5:
+                row['place_name'] = f"{row['place_name']} {i}"
+                try:
+                    row['latitude'] = f"{float(row['latitude']) + rng.uniform(-0.01, 0.01):.6f}"
+                    row['longitude'] = f"{float(row['longitude']) + rng.uniform(-0.01, 0.01):.6f}"
+                except ValueError:
+                    pass
+            writer.writerow(row)
+
+
+def _peak_memory_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+
+def benchmark(rows):
+    path = os.path.join(tempfile.gettempdir(), f"locations_synthetic_{rows}.csv")
+    print(f"[Profile] 합성 파일 작성: {path} ({rows:,}행)")
+    write_synthetic(path, rows)
+    before = _peak_memory_mb()
+    report, _ = profile_file(path)
+    print_summary(report)
+    after = _peak_memory_mb()
+    if after is not None:
+        print(f"  최대 메모리 {after:.0f}MB (합성 파일 작성까지 {before:.0f}MB)")
+    os.remove(path)
+
+
+def main(argv):
+    path, out = DEFAULT_INPUT, DEFAULT_OUTPUT
+    args = iter(argv)
+    for arg in args:
+        if arg == '--bench':
+            benchmark(int(next(args, 1000000)))
+            return
+        if arg == '--out':
+            out = next(args)
+        else:
+            path = arg
+
+    report, _ = profile_file(path)
+    print_summary(report)
+    with open(out, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"  저장: {out}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -20,6 +20,8 @@ from typing import List, Dict, Optional
 from urllib.parse import urlencode
 import dotenv
 
+from quota import KeyScheduler, QuotaExhausted, configured_keys, wait_for_reset
+
 # Windows 콘솔 인코딩 설정
 if sys.platform == 'win32':
     import io
@@ -30,12 +32,15 @@ if sys.platform == 'win32':
 dotenv.load_dotenv()
 
 # 설정
-TOUR_API_KEY = os.getenv('TOUR_API_KEY') or os.getenv('DATA_GO_KR_API_KEY')
+# TOUR_API_KEY, TOUR_API_KEY_2, ... 여러 키를 번갈아 사용 (키별 일일 사용량은 quota.py 장부에 기록)
+TOUR_API_KEYS = configured_keys('tour') or ([os.getenv('DATA_GO_KR_API_KEY')] if os.getenv('DATA_GO_KR_API_KEY') else [])
+TOUR_API_KEY = TOUR_API_KEYS[0] if TOUR_API_KEYS else None
 CSV_FILE = 'assets/data/locations.csv'
 OUTPUT_DIR = 'assets/images/downloaded'
 METADATA_FILE = 'assets/images/image_metadata.json'
 MAX_IMAGES_PER_LOCATION = 5
-DAILY_LIMIT = 1000  # 일일 트래픽 제한
+DAILY_LIMIT = 1000  # 키당 일일 트래픽 제한
+TOUR_QUOTA = KeyScheduler('tour', TOUR_API_KEYS, DAILY_LIMIT)
 REQUEST_DELAY = 0.1  # API 요청 간 지연 (초)
 
 # 서버 설정 (선택사항)
@@ -57,7 +62,7 @@ def search_tour_api_images(keyword: str, max_results: int = 5) -> List[str]:
     try:
         url = 'http://apis.data.go.kr/B551011/PhotoGalleryService1/gallerySearchList1'
         params = {
-            'serviceKey': TOUR_API_KEY,
+            'serviceKey': None,
             'numOfRows': max_results,
             'pageNo': 1,
             'MobileOS': 'ETC',
@@ -67,10 +72,16 @@ def search_tour_api_images(keyword: str, max_results: int = 5) -> List[str]:
             '_type': 'json',
         }
         
-        response = requests.get(url, params=params, timeout=10)
-        # 429 Too Many Requests = 일일 트래픽 한도 도달
-        if response.status_code == 429:
-            raise Exception('DAILY_LIMIT_REACHED')
+        # 오늘 한도가 남은 키로 요청, 429 Too Many Requests = 해당 키의 일일 트래픽 한도 도달 -> 다음 키
+        while True:
+            try:
+                params['serviceKey'] = TOUR_QUOTA.acquire()
+            except QuotaExhausted:
+                raise Exception('DAILY_LIMIT_REACHED')
+            response = requests.get(url, params=params, timeout=10)
+            if response.status_code != 429:
+                break
+            TOUR_QUOTA.exhaust(params['serviceKey'])
         response.raise_for_status()
         
         data = response.json()
@@ -240,6 +251,7 @@ def process_locations():
     locations_processed = 0
     images_downloaded = 0
     api_calls = 0
+    quota_reached = False
     
     with open(CSV_FILE, 'r', encoding='utf-8') as f:
         reader = csv.DictReader(f)
@@ -247,7 +259,11 @@ def process_locations():
     
     print(f"[정보] 총 {len(locations)}개 장소 처리 시작...")
     print(f"[정보] TourAPI: {'사용' if TOUR_API_KEY else '미설정'}, Wikimedia: 사용 (실제 장소 이미지)")
-    print(f"[정보] 일일 트래픽 제한(TourAPI): {DAILY_LIMIT}회")
+    print(f"[정보] 일일 트래픽 제한(TourAPI): 키당 {DAILY_LIMIT}회, {TOUR_QUOTA.summary()}")
+    if TOUR_API_KEYS:
+        left = sum(1 for i, row in enumerate(locations, 1)
+                   if not metadata.get(row.get('no', str(i)), {}).get('processed', False))
+        print(f"[정보] 남은 장소 {left}개 -> 약 {TOUR_QUOTA.days_needed(left)}일 소요 (오늘 포함)")
     print(f"[정보] API 요청 간 지연: {REQUEST_DELAY}초\n")
     
     for idx, row in enumerate(locations, 1):
@@ -264,10 +280,11 @@ def process_locations():
             print(f"[스킵] [{idx}/{len(locations)}] {location_name} - 이미 처리됨")
             continue
         
-        # 일일 트래픽 제한 체크
-        if api_calls >= DAILY_LIMIT:
-            print(f"\n[경고] 일일 트래픽 제한 도달! ({api_calls}/{DAILY_LIMIT})")
+        # 일일 트래픽 제한 체크 (모든 키 합산, 이전 실행에서 쓴 호출 포함)
+        if TOUR_API_KEYS and TOUR_QUOTA.remaining_total() <= 0:
+            print(f"\n[경고] 일일 트래픽 제한 도달! (이번 실행 {api_calls}회, {TOUR_QUOTA.summary()})")
             print("[안내] 내일 다시 실행하거나 API 키를 추가로 발급받으세요.")
+            quota_reached = True
             break
         
         # 검색 키워드 조합 (개선: 콘텐츠 제목 제거, 장소명 + 지역명만 사용)
@@ -320,7 +337,7 @@ def process_locations():
                 with open(METADATA_FILE, 'w', encoding='utf-8') as f:
                     json.dump(metadata, f, ensure_ascii=False, indent=2)
                 print(f"[안내] 내일 다시 'python scripts/download_images.py' 실행 시 이어서 진행됩니다.")
-                return
+                return True
             raise
         time.sleep(REQUEST_DELAY)  # API 요청 간 지연
         
@@ -395,10 +412,13 @@ def process_locations():
     print(f"   다운로드된 이미지: {images_downloaded}개")
     print(f"   API 호출 횟수: {api_calls}회")
     print(f"   메타데이터: {METADATA_FILE}")
+    return quota_reached
 
 
 if __name__ == '__main__':
     if not TOUR_API_KEY:
         print("[안내] TourAPI 키가 없습니다. Wikimedia Commons만 사용합니다.")
         print("   실제 장소 이미지 확보를 위해 .env에 TOUR_API_KEY 권장.")
-    process_locations()
+    # --wait-for-quota: 한도에 도달하면 다음 날 한도 초기화까지 기다렸다가 자동으로 이어서 진행
+    while process_locations() and '--wait-for-quota' in sys.argv:
+        wait_for_reset()
@@ -1,10 +1,13 @@
 import csv
-import requests
-import time
 import os
 from dotenv import load_dotenv
 from io import StringIO
 
+from coords import tm128_to_wgs84
+from geocode_batch import batch_geocode
+from match_scoring import best_match, describe
+from naver_client import NaverAPIError, QuotaExhausted, get_client
+
 # .env 파일 로드
 load_dotenv()
 
@@ -16,89 +19,37 @@ NAVER_MAP_CLIENT_SECRET = os.getenv('NAVER_MAP_CLIENT_SECRET') or NAVER_SEARCH_C
 
 def search_place(query):
     """Naver Local Search API를 사용하여 장소 정보 검색"""
-    url = "https://openapi.naver.com/v1/search/local.json"
-    
-    headers = {
-        "X-Naver-Client-Id": NAVER_SEARCH_CLIENT_ID,
-        "X-Naver-Client-Secret": NAVER_SEARCH_CLIENT_SECRET
-    }
-    
-    params = {
-        "query": query,
-        "display": 5  # 상위 5개 결과 가져오기
-    }
-    
     try:
-        response = requests.get(url, headers=headers, params=params)
-        
-        if response.status_code != 200:
-            print(f"  [X] Search API 오류 ({response.status_code})")
-            return None
-        
-        data = response.json()
-        
-        if data.get('items'):
-            return data['items']
-        else:
-            return None
-            
-    except Exception as e:
+        # 상위 5개 결과 가져오기
+        items = get_client().search_local(query, display=5)
+    except QuotaExhausted:
+        raise
+    except NaverAPIError as e:
         print(f"  [X] 검색 예외 발생: {str(e)}")
         return None
 
+    return items or None
+
 def geocode_address(address):
     """Naver Maps Geocoding API를 사용하여 주소를 위도/경도로 변환"""
-    url = "https://maps.apigw.ntruss.com/map-geocode/v2/geocode"
-    
-    headers = {
-        "x-ncp-apigw-api-key-id": NAVER_MAP_CLIENT_ID,
-        "x-ncp-apigw-api-key": NAVER_MAP_CLIENT_SECRET,
-        "Accept": "application/json"
-    }
-    
-    params = {
-        "query": address
-    }
-    
     try:
-        response = requests.get(url, headers=headers, params=params)
-        
-        if response.status_code != 200:
-            return '', '', False
-        
-        data = response.json()
-        
-        if data.get('status') == 'OK' and data.get('addresses'):
-            result = data['addresses'][0]
-            lat = result.get('y', '')
-            lng = result.get('x', '')
-            return lat, lng, True
-        else:
-            return '', '', False
-            
-    except Exception as e:
+        result = get_client().geocode(address)
+    except QuotaExhausted:
+        raise
+    except NaverAPIError:
         return '', '', False
 
+    if result:
+        return result.get('y', ''), result.get('x', ''), True
+    return '', '', False
+
 def convert_katech_to_wgs84(mapx, mapy):
-    """KATECH/TM128 좌표를 WGS84로 변환"""
-    try:
-        from pyproj import Proj, Transformer
-        
-        # KATECH (TM128) 좌표계
-        proj_katech = Proj('+proj=tmerc +lat_0=38 +lon_0=128 +k=0.9999 +x_0=400000 +y_0=600000 +ellps=bessel +units=m +no_defs +towgs84=-115.80,474.99,674.11,1.16,-2.31,-1.63,6.43')
-        # WGS84 좌표계
-        proj_wgs84 = Proj(proj='latlong', datum='WGS84')
-        
-        transformer = Transformer.from_proj(proj_katech, proj_wgs84)
-        
-        mx = float(mapx)
-        my = float(mapy)
-        
-        lon, lat = transformer.transform(mx, my)
-        return str(lat), str(lon)
-    except Exception as e:
-        print(f"  [!] 좌표 변환 실패: {str(e)}")
+    """KATECH/TM128 좌표를 WGS84로 변환 (coords.py 의 한 번만 만든 Transformer 사용)"""
+    lat, lng = tm128_to_wgs84(mapx, mapy)
+    if lat is None:
+        print(f"  [!] 좌표 변환 실패: ({mapx}, {mapy})")
         return '', ''
+    return str(lat), str(lng)
 
 def clean_html_tags(text):
     """HTML 태그 제거"""
@@ -106,8 +57,8 @@ def clean_html_tags(text):
         return ''
     return text.replace('<b>', '').replace('</b>', '').strip()
 
-def enhance_address(place_name, partial_address, phone):
-    """레스토랑 정보를 검색하여 완전한 주소와 좌표 반환"""
+def enhance_address(place_name, partial_address, phone, geocode=True):
+    """레스토랑 정보를 검색하여 완전한 주소와 좌표 반환 (geocode=False 면 좌표 없이 주소만)"""
     
     # 검색 쿼리 생성
     if partial_address and partial_address.strip():
@@ -127,14 +78,18 @@ def enhance_address(place_name, partial_address, phone):
         print(f"  [!] 검색 결과 없음")
         return None, None, None, None
     
-    # 첫 번째 결과 사용 (가장 관련성 높은 결과)
-    best_match = items[0]
+    # 상위 5개 결과 중 상호명 / 지역 / 카테고리가 가장 잘 맞는 결과 사용 (낮은 신뢰도는 검토 목록으로)
+    match = best_match(items, place_name, partial_address, 'restaurant')
+    if not match:
+        print(f"  [!] 일치하는 검색 결과 없음")
+        return None, None, None, None
+    print(f"  매칭: {describe(match)}")
     
     # 정보 추출
-    title = clean_html_tags(best_match.get('title', ''))
-    address = clean_html_tags(best_match.get('address', ''))
-    road_address = clean_html_tags(best_match.get('roadAddress', ''))
-    telephone = best_match.get('telephone', '')
+    title = clean_html_tags(match.item.get('title', ''))
+    address = clean_html_tags(match.item.get('address', ''))
+    road_address = clean_html_tags(match.item.get('roadAddress', ''))
+    telephone = match.item.get('telephone', '')
     
     # 도로명 주소 우선, 없으면 지번 주소
     final_address = road_address if road_address else address
@@ -146,6 +101,8 @@ def enhance_address(place_name, partial_address, phone):
     lat, lng = '', ''
     if final_address:
         print(f"  [OK] 검색 성공: {final_address}")
+        if not geocode:
+            return final_address, '', '', final_phone
         lat, lng, success = geocode_address(final_address)
         if success:
             print(f"      좌표: ({lat}, {lng})")
@@ -206,6 +163,10 @@ def main():
     success_count = 0
     fail_count = 0
     skip_count = 0
+    quota_count = 0
+    
+    # 1단계: 장소 검색으로 주소 / 전화번호 보완 (좌표는 2단계에서 주소 단위로 일괄 조회)
+    geocode_targets = []
     
     for idx, row in enumerate(rows):
         # CSV 구조: no,media_type,title,place_name,place_type,description,opening_hours,break_time,closed_days,address,latitude,longitude,phone,last_updated,michelin_tier
@@ -226,38 +187,50 @@ def main():
             skip_count += 1
             continue
         
-        # 주소 보완 시도
-        enhanced_address, lat, lng, enhanced_phone = enhance_address(place_name, address, phone)
+        # 주소 보완 시도 (일일 한도를 다 쓰면 남은 행은 그대로 두고 저장 후 다음 실행에서 처리)
+        try:
+            enhanced_address, _, _, enhanced_phone = enhance_address(place_name, address, phone, geocode=False)
+        except QuotaExhausted as e:
+            quota_count = len(rows) - idx
+            print(f"  [STOP] {e} - 남은 {quota_count}개는 다음 실행에서 처리")
+            break
         
-        if enhanced_address or (lat and lng):
+        if enhanced_address:
             # 행 길이 확인 및 확장
             while len(row) < 15:
                 row.append('')
             
             # 주소 업데이트 (더 완전한 주소가 있으면)
-            if enhanced_address and (not address or len(enhanced_address) > len(address)):
+            if not address or len(enhanced_address) > len(address):
                 row[10] = enhanced_address
                 print(f"  [UPDATE] 주소: {enhanced_address}")
             
-            # 좌표 업데이트
-            if lat and lng:
-                row[11] = lat
-                row[12] = lng
-                success_count += 1
-                print(f"  [UPDATE] 좌표: ({lat}, {lng})")
-            else:
-                fail_count += 1
-            
             # 전화번호 업데이트 (기존에 없었으면)
             if enhanced_phone and not phone:
                 row[13] = enhanced_phone
                 print(f"  [UPDATE] 전화번호: {enhanced_phone}")
+            
+            geocode_targets.append((idx, enhanced_address))
         else:
             fail_count += 1
             print(f"  [FAIL] 정보를 찾을 수 없습니다.")
-        
-        # API 요청 제한 방지
-        time.sleep(0.15)
+    
+    # 2단계: 찾은 주소를 주소 단위로 일괄 Geocoding (같은 주소는 한 번만 조회)
+    print(f"\n[좌표 조회]")
+    quota_left = set()
+    coords = batch_geocode([address for _, address in geocode_targets],
+                           [rows[idx][3] for idx, _ in geocode_targets], quota_left=quota_left)
+    for i, ((idx, address), coord) in enumerate(zip(geocode_targets, coords)):
+        row = rows[idx]
+        if i in quota_left:
+            quota_count += 1
+        elif coord:
+            row[11], row[12] = coord
+            success_count += 1
+            print(f"  [UPDATE] {row[3]} 좌표: ({coord[0]}, {coord[1]})")
+        else:
+            fail_count += 1
+            print(f"  [!] {row[3]} Geocoding 실패: {address}")
     
     # 결과 저장
     with open(output_file, 'w', encoding='utf-8', newline='') as f:
@@ -274,6 +247,8 @@ def main():
     print(f"  - 성공: {success_count}개")
     print(f"  - 실패: {fail_count}개")
     print(f"  - 스킵: {skip_count}개 (이미 좌표 있음)")
+    if quota_count:
+        print(f"  - 일일 한도 소진으로 남음: {quota_count}개 (다음 실행에서 처리)")
     print(f"  - 출력 파일: {output_file}")
     
     if fail_count > 0:
@@ -3,10 +3,12 @@
 """
 import os
 import csv
-import time
-import requests
 from dotenv import load_dotenv
 
+from coords import item_to_wgs84
+from match_scoring import best_match, describe
+from naver_client import NaverAPIError, QuotaExhausted, get_client
+
 load_dotenv()
 
 NAVER_CLIENT_ID = os.getenv('NAVER_SEARCH_CLIENT_ID')
@@ -16,55 +18,36 @@ NAVER_MAP_CLIENT_SECRET = os.getenv('NAVER_MAP_CLIENT_SECRET')
 
 def search_naver_local(query):
     """네이버 지역 검색 API로 장소 정보 검색"""
-    url = "https://openapi.naver.com/v1/search/local.json"
-    headers = {
-        "X-Naver-Client-Id": NAVER_CLIENT_ID,
-        "X-Naver-Client-Secret": NAVER_CLIENT_SECRET
-    }
-    params = {
-        "query": query,
-        "display": 5,
-        "start": 1,
-        "sort": "random"
-    }
-    
     try:
-        response = requests.get(url, headers=headers, params=params)
-        if response.status_code == 200:
-            return response.json()
+        return {'items': get_client().search_local(query, display=5, start=1, sort="random")}
+    except QuotaExhausted:
+        raise
+    except NaverAPIError as e:
+        if e.status:
+            print(f"  [!] API 오류: {e.status}")
         else:
-            print(f"  [!] API 오류: {response.status_code}")
-            return None
-    except Exception as e:
-        print(f"  [!] 요청 실패: {e}")
+            print(f"  [!] 요청 실패: {e}")
         return None
 
 def geocode_address(address):
     """네이버 지오코딩 API로 주소를 좌표로 변환"""
-    url = "https://naveropenapi.apigw.ntruss.com/map-geocode/v2/geocode"
-    headers = {
-        "x-ncp-apigw-api-key-id": NAVER_MAP_CLIENT_ID,
-        "x-ncp-apigw-api-key": NAVER_MAP_CLIENT_SECRET
-    }
-    params = {"query": address}
-    
     try:
-        response = requests.get(url, headers=headers, params=params)
-        if response.status_code == 200:
-            data = response.json()
-            if data.get('addresses') and len(data['addresses']) > 0:
-                addr = data['addresses'][0]
-                return {
-                    'latitude': addr.get('y'),
-                    'longitude': addr.get('x'),
-                    'roadAddress': addr.get('roadAddress', ''),
-                    'jibunAddress': addr.get('jibunAddress', '')
-                }
-        return None
-    except Exception as e:
+        addr = get_client().geocode(address)
+    except QuotaExhausted:
+        raise
+    except NaverAPIError as e:
         print(f"  [!] 지오코딩 실패: {e}")
         return None
 
+    if addr:
+        return {
+            'latitude': addr.get('y'),
+            'longitude': addr.get('x'),
+            'roadAddress': addr.get('roadAddress', ''),
+            'jibunAddress': addr.get('jibunAddress', '')
+        }
+    return None
+
 def enhance_bakery_info(name, current_address):
     """빵집 정보 보완"""
     print(f"\n🔍 검색 중: {name}")
@@ -74,14 +57,18 @@ def enhance_bakery_info(name, current_address):
     search_query = f"{name} {region} 빵집" if region else f"{name} 빵집"
     
     result = search_naver_local(search_query)
-    time.sleep(0.1)  # API 호출 제한 방지
     
     if not result or not result.get('items'):
         print(f"  [X] 검색 결과 없음")
         return None
     
-    # 가장 관련성 높은 결과 선택
-    item = result['items'][0]
+    # 상호명 / 지역 / 카테고리가 가장 잘 맞는 결과 선택 (낮은 신뢰도는 검토 목록으로)
+    match = best_match(result['items'], name, current_address, 'bakery')
+    if not match:
+        print(f"  [X] 일치하는 검색 결과 없음")
+        return None
+    print(f"  ✓ 매칭: {describe(match)}")
+    item = match.item
     
     info = {
         'name': item.get('title', '').replace('<b>', '').replace('</b>', ''),
@@ -90,22 +77,15 @@ def enhance_bakery_info(name, current_address):
         'category': item.get('category', '')
     }
     
-    # 네이버 좌표를 WGS84로 변환
-    # mapx, mapy는 네이버 좌표계 (KATEC)
-    # 간단한 변환: mapx/mapy를 10^7로 나누면 대략적인 경도/위도
-    mapx = item.get('mapx', '')
-    mapy = item.get('mapy', '')
-    
-    if mapx and mapy:
-        try:
-            # 네이버 좌표를 WGS84로 변환
-            longitude = float(mapx) / 10000000
-            latitude = float(mapy) / 10000000
-            info['latitude'] = latitude
-            info['longitude'] = longitude
-            print(f"  ✓ 좌표: ({latitude}, {longitude})")
-        except (ValueError, TypeError) as e:
-            print(f"  [!] 좌표 변환 실패: {e}")
+    # 네이버 좌표 (mapx, mapy = WGS84 x 1e7, 예전 응답은 KATEC) 를 WGS84로 변환
+    latitude, longitude = item_to_wgs84(item)
+    
+    if latitude is not None:
+        info['latitude'] = latitude
+        info['longitude'] = longitude
+        print(f"  ✓ 좌표: ({latitude}, {longitude})")
+    elif item.get('mapx') or item.get('mapy'):
+        print(f"  [!] 좌표 변환 실패: {item.get('mapx')}, {item.get('mapy')}")
     
     print(f"  ✓ 주소: {info.get('address', '없음')}")
     print(f"  ✓ 전화: {info.get('phone', '없음')}")
@@ -130,6 +110,7 @@ def process_csv(input_file, output_file):
     
     rows = []
     updated_count = 0
+    quota_error = None
     
     with open(input_file, 'r', encoding='utf-8') as f:
         reader = csv.reader(f)
@@ -153,12 +134,20 @@ def process_csv(input_file, output_file):
             # 정보가 부족한 경우에만 API 호출
             needs_update = (address == "정보없음" or not lat.strip() or not lon.strip())
             
-            if needs_update:
+            if needs_update and quota_error:
+                # 일일 한도를 다 쓴 뒤의 행은 원본 그대로 저장 (다음 실행에서 보완)
+                print(f"[{idx}] {name} - 한도 소진, 다음 실행에서 보완")
+            elif needs_update:
                 print(f"\n[{idx}] {name} - 업데이트 필요")
                 print(f"    현재 주소: {address}")
                 print(f"    현재 좌표: ({lat}, {lon})")
                 
-                enhanced = enhance_bakery_info(name, address)
+                try:
+                    enhanced = enhance_bakery_info(name, address)
+                except QuotaExhausted as e:
+                    quota_error = e
+                    print(f"  [STOP] {e} - 남은 항목은 원본 그대로 저장")
+                    enhanced = None
                 
                 if enhanced:
                     # 주소 업데이트
@@ -185,7 +174,7 @@ def process_csv(input_file, output_file):
                     
                     updated_count += 1
                     print(f"    ✓ 업데이트 완료")
-                else:
+                elif not quota_error:
                     print(f"    - 정보 없음, 원본 유지")
             else:
                 print(f"[{idx}] {name} - 스킵 (정보 충분)")
@@ -200,6 +189,8 @@ def process_csv(input_file, output_file):
     
     print(f"\n{'='*60}")
     print(f"✓ 완료: {updated_count}개 항목 업데이트")
+    if quota_error:
+        print(f"[!] {quota_error} - 중간에 멈춤, 다시 실행하면 남은 항목을 보완")
     print(f"✓ 저장: {output_file}")
     print(f"{'='*60}\n")
     
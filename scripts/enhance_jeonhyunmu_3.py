@@ -1,11 +1,13 @@
 import csv
-import requests
-import time
 import os
 import re
 from dotenv import load_dotenv
 from io import StringIO
 
+from geocode_batch import geocode_one
+from match_scoring import best_match
+from naver_client import NaverAPIError, QuotaExhausted, get_client
+
 # .env 파일 로드
 load_dotenv()
 
@@ -17,54 +19,32 @@ NAVER_MAP_CLIENT_SECRET = os.getenv('NAVER_MAP_CLIENT_SECRET') or NAVER_SEARCH_C
 
 def search_place(query):
     """Naver Local Search API를 사용하여 장소 정보 검색"""
-    url = "https://openapi.naver.com/v1/search/local.json"
-    headers = {
-        "X-Naver-Client-Id": NAVER_SEARCH_CLIENT_ID,
-        "X-Naver-Client-Secret": NAVER_SEARCH_CLIENT_SECRET
-    }
-    params = {"query": query, "display": 3}
     try:
-        response = requests.get(url, headers=headers, params=params)
-        if response.status_code == 200:
-            return response.json().get('items', [])
-    except Exception:
-        pass
-    return []
+        return get_client().search_local(query, display=5)
+    except QuotaExhausted:
+        raise
+    except NaverAPIError:
+        return []
 
 def search_web(query):
     """Naver Web Search API를 사용하여 장소 정보 검색"""
-    url = "https://openapi.naver.com/v1/search/webkr.json"
-    headers = {
-        "X-Naver-Client-Id": NAVER_SEARCH_CLIENT_ID,
-        "X-Naver-Client-Secret": NAVER_SEARCH_CLIENT_SECRET
-    }
-    params = {"query": query, "display": 5}
     try:
-        response = requests.get(url, headers=headers, params=params)
-        if response.status_code == 200:
-            return response.json().get('items', [])
-    except Exception:
-        pass
-    return []
+        return get_client().search_web(query, display=5)
+    except QuotaExhausted:
+        raise
+    except NaverAPIError:
+        return []
 
-def geocode_address(address):
-    """Naver Maps Geocoding API를 사용하여 주소를 위도/경도로 변환"""
-    url = "https://maps.apigw.ntruss.com/map-geocode/v2/geocode"
-    headers = {
-        "x-ncp-apigw-api-key-id": NAVER_MAP_CLIENT_ID,
-        "x-ncp-apigw-api-key": NAVER_MAP_CLIENT_SECRET,
-        "Accept": "application/json"
-    }
-    params = {"query": address}
+def geocode_address(address, place_name=None):
+    """주소를 위도/경도로 변환 (오프라인 색인 우선, 없으면 Naver Maps Geocoding API)"""
     try:
-        response = requests.get(url, headers=headers, params=params)
-        if response.status_code == 200:
-            data = response.json()
-            if data.get('status') == 'OK' and data.get('addresses'):
-                result = data['addresses'][0]
-                return result.get('y', ''), result.get('x', ''), True
-    except Exception:
-        pass
+        coords = geocode_one(address, place_name)
+    except QuotaExhausted:
+        raise
+    except NaverAPIError:
+        return '', '', False
+    if coords:
+        return coords[0], coords[1], True
     return '', '', False
 
 def clean_html_tags(text):
@@ -106,8 +86,10 @@ def enhance_row(row):
     
     # 1. Local Search API
     local_items = search_place(query)
-    if local_items:
-        match = local_items[0]
+    # 상호명 / 지역 / 카테고리가 가장 잘 맞는 결과 (낮은 신뢰도는 검토 목록으로)
+    best = best_match(local_items, place_name, address, row[4])
+    if best:
+        match = best.item
         new_address = clean_html_tags(match.get('roadAddress', match.get('address', '')))
         new_phone = match.get('telephone', '')
         
@@ -147,7 +129,7 @@ def enhance_row(row):
     
     # 3. Geocoding (항상 최신 주소 기준)
     if address and address != '정보없음' and (not row[10] or not row[11]):
-        lat, lng, success = geocode_address(address)
+        lat, lng, success = geocode_address(address, place_name)
         if success:
             row[10] = lat
             row[11] = lng
@@ -166,12 +148,17 @@ def main():
     
     print(f"Supplementing missing info for {len(rows)} entries...")
     
+    # 일일 한도를 다 쓰면 남은 행은 그대로 저장 (다음 실행에서 보완)
     processed_rows = []
     for i, row in enumerate(rows):
         print(f"[{i+1}/{len(rows)}] {row[3]}")
-        processed_row = enhance_row(row)
+        try:
+            processed_row = enhance_row(row)
+        except QuotaExhausted as e:
+            print(f"  [STOP] {e} - remaining {len(rows) - i} rows saved unchanged")
+            processed_rows.extend(rows[i:])
+            break
         processed_rows.append(processed_row)
-        time.sleep(0.2)
 
     with open(output_file, 'w', encoding='utf-8', newline='') as f:
         writer = csv.writer(f)
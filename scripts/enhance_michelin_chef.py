@@ -1,10 +1,11 @@
 import csv
 import os
-import requests
 import re
-import time
 from dotenv import load_dotenv
 
+from naver_client import NaverAPIError, QuotaExhausted, get_client
+from query_cascade import first_success
+
 load_dotenv()
 
 # API Keys
@@ -12,16 +13,12 @@ NAVER_CLIENT_ID = os.getenv('NAVER_SEARCH_CLIENT_ID')
 NAVER_CLIENT_SECRET = os.getenv('NAVER_SEARCH_CLIENT_SECRET')
 
 def search_web(query):
-    url = "https://openapi.naver.com/v1/search/webkr.json"
-    headers = {
-        "X-Naver-Client-Id": NAVER_CLIENT_ID,
-        "X-Naver-Client-Secret": NAVER_CLIENT_SECRET
-    }
-    params = {"query": query, "display": 5}
-    response = requests.get(url, headers=headers, params=params)
-    if response.status_code == 200:
-        return response.json().get('items', [])
-    return []
+    try:
+        return get_client().search_web(query, display=5)
+    except QuotaExhausted:
+        raise
+    except NaverAPIError:
+        return []
 
 def clean_html_tags(text):
     return re.sub(r'<[^>]*>', '', text)
@@ -66,6 +63,15 @@ def extract_chef_from_snippet(snippet, restaurant_name):
                 return found_name
     return None
 
+def find_chef(query, restaurant_name):
+    """웹 검색 스니펫에서 셰프 이름 추출 (없으면 None)"""
+    for item in search_web(query):
+        snippet = clean_html_tags(item.get('description', ''))
+        chef_name = extract_chef_from_snippet(snippet, restaurant_name)
+        if chef_name:
+            return chef_name
+    return None
+
 def main():
     csv_path = 'assets/data/locations.csv'
     output_path = 'assets/data/locations_michelin_enhanced.csv'
@@ -95,35 +101,23 @@ def main():
             if '레스토랑' in description or not description or description == '정보없음':
                 print(f"[{target_count}] Searching for chef of {place_name}...")
                 
-                query = f"{place_name} {address.split()[0] if address else ''} 셰프"
-                items = search_web(query)
-                
-                chef_name = None
-                for item in items:
-                    snippet = clean_html_tags(item.get('description', ''))
-                    chef_name = extract_chef_from_snippet(snippet, place_name)
-                    if chef_name:
-                        break
+                # 기본 검색어와 넓은 검색어 (오너셰프) 를 동시에 조회, 기본 검색어 결과 우선
+                queries = [
+                    f"{place_name} {address.split()[0] if address else ''} 셰프",
+                    f"{place_name} 오너셰프",
+                ]
+                # 일일 한도를 다 쓰면 여기까지 찾은 결과만 저장하고 종료 (남은 행은 다음 실행에서 검색)
+                try:
+                    hit = first_success(queries, lambda q: find_chef(q, place_name))
+                except QuotaExhausted as e:
+                    print(f"  [STOP] {e} - saving progress, run again for the rest")
+                    break
                 
-                if chef_name:
-                    print(f"  --> Found Chef: {chef_name}")
+                if hit:
+                    rank, _, chef_name = hit
+                    print(f"  --> Found Chef{' (Alt Search)' if rank else ''}: {chef_name}")
                     row[5] = f"{chef_name}" # Store name in description col (index 5)
                     enhanced_count += 1
-                else:
-                    # Try a broader search if not found
-                    query_alt = f"{place_name} 오너셰프"
-                    items_alt = search_web(query_alt)
-                    for item in items_alt:
-                        snippet = clean_html_tags(item.get('description', ''))
-                        chef_name = extract_chef_from_snippet(snippet, place_name)
-                        if chef_name:
-                            print(f"  --> Found Chef (Alt Search): {chef_name}")
-                            row[5] = f"{chef_name}"
-                            enhanced_count += 1
-                            break
-                
-                # Sleep to respect API limits if needed (Naver is quite generous but let's be safe)
-                time.sleep(0.2)
 
     print(f"Finished. Target: {target_count}, Enhanced: {enhanced_count}")
     
@@ -1,10 +1,11 @@
 import csv
 import os
-import requests
 import json
-import time
 from dotenv import load_dotenv
 
+from match_scoring import best_match
+from naver_client import NaverAPIError, QuotaExhausted, get_client
+
 # .env 파일 로드
 load_dotenv()
 
@@ -14,49 +15,40 @@ CLIENT_SECRET = os.getenv('NAVER_SEARCH_CLIENT_SECRET')
 INPUT_FILE = r'd:\00_projects\02_TasteMap\assets\data\locations.csv'
 OUTPUT_FILE = r'd:\00_projects\02_TasteMap\assets\data\locations_enriched.csv'
 
-def get_naver_info(name, address):
-    url = "https://openapi.naver.com/v1/search/local.json"
-    headers = {
-        "X-Naver-Client-Id": CLIENT_ID,
-        "X-Naver-Client-Secret": CLIENT_SECRET
-    }
-    
+def get_naver_info(name, address, place_type=None):
     # 상호명과 주소 일부를 조합하여 검색 정확도 향상
     # 주소에서 '시/도'와 '구/군' 정도만 사용
     addr_parts = address.split()
     query_addr = " ".join(addr_parts[:2]) if len(addr_parts) >= 2 else address
     query = f"{name} {query_addr}"
     
-    params = {
-        "query": query,
-        "display": 1,
-        "sort": "random"
-    }
-    
     try:
-        response = requests.get(url, headers=headers, params=params)
-        if response.status_code == 200:
-            data = response.json()
-            if data['items']:
-                item = data['items'][0]
-                category = item.get('category', '')
-                
-                # 카테고리에서 정보 추출 (예: "한식>순두부" -> category: "한식", menu: "순두부")
-                food_category = ""
-                representative_menu = ""
-                
-                if '>' in category:
-                    parts = category.split('>')
-                    food_category = parts[0].strip()
-                    representative_menu = parts[1].strip()
-                else:
-                    food_category = category.strip()
-                
-                return food_category, representative_menu
+        items = get_client().search_local(query, display=5, sort="random")
+        # 상위 5개 중 상호명 / 지역 / 카테고리가 가장 잘 맞는 결과 (낮은 신뢰도는 검토 목록으로)
+        match = best_match(items, name, address, place_type)
+        if match:
+            item = match.item
+            category = item.get('category', '')
+            
+            # 카테고리에서 정보 추출 (예: "한식>순두부" -> category: "한식", menu: "순두부")
+            food_category = ""
+            representative_menu = ""
+            
+            if '>' in category:
+                parts = category.split('>')
+                food_category = parts[0].strip()
+                representative_menu = parts[1].strip()
+            else:
+                food_category = category.strip()
+            
+            return food_category, representative_menu
+    except QuotaExhausted:
+        raise
+    except NaverAPIError as e:
+        if e.status:
+            print(f"Error: {e.status} for {query}")
         else:
-            print(f"Error: {response.status_code} for {query}")
-    except Exception as e:
-        print(f"Exception for {query}: {e}")
+            print(f"Exception for {query}: {e}")
     
     return "", ""
 
@@ -98,12 +90,16 @@ def main():
                 
                 print(f"[{i+1}/{total}] Searching for {name}...")
                 
-                cat, menu = get_naver_info(name, address)
+                # 일일 한도를 다 쓰면 여기까지 저장된 결과로 종료 (다음 실행에서 이 행부터 이어서 진행)
+                try:
+                    cat, menu = get_naver_info(name, address, row.get('place_type'))
+                except QuotaExhausted as e:
+                    print(f"{e} - stopped at item {i+1}, run again to resume.")
+                    return
                 row['food_category'] = cat
                 row['representative_menu'] = menu
                 
                 writer.writerow(row)
-                time.sleep(0.1)
                 
                 # 100개마다 저장 상황 출력
                 if (i + 1) % 100 == 0:
@@ -0,0 +1,355 @@
+"""
+locations.csv 같은 장소 찾기 (블로킹 + 퍼지 매칭)
+'목마식당' / '목마식당 본점' 처럼 상호명 표기와 주소 표기가 조금씩 다른 행을 같은 장소로 묶음
+모든 행 쌍을 비교하면 O(n²) 이므로 후보 쌍을 다음 블록 안에서만 만든 뒤 점수를 매김
+
+  - 상호명 + 주소가 정규화 후 완전히 같은 행 (여러 방송에 나온 같은 가게) 은 대표 행 하나만 비교
+  - 블록 키: (geohash 칸, 정규화 상호명 2글자 조각)
+    좌표가 있으면 자기 칸과 주변 8칸, 좌표가 없으면 시/도 + 시/군/구 를 칸 대신 사용
+  - 쌍 점수: 상호명 유사도 + 거리 + 주소 일치 (match_scoring 과 같은 기준)
+  - 묶음: 점수가 SAME_ENTITY 이상인 쌍을 높은 점수부터 합치고 (Kruskal),
+    묶음의 신뢰도는 묶음을 이은 가장 약한 연결의 점수
+
+행 수가 늘어도 블록 크기는 지역 / 이름 조각 밀도에만 좌우되므로 거의 선형으로 증가
+
+사용법:
+  python entity_resolution.py                                   # assets/data/locations.csv
+  python entity_resolution.py 파일.csv --out clusters.csv --threshold 0.85
+"""
+import csv
+import math
+import os
+import re
+import sys
+import time
+from collections import defaultdict, namedtuple
+
+from addresses import normalize_address, normalize_name, region_tokens
+from match_scoring import name_similarity, region_agreement, NEUTRAL
+from offline_geocoder import parse_coords, read_rows
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_INPUT = os.path.join(ROOT_DIR, 'assets', 'data', 'locations.csv')
+
+# geohash 6자리 칸: 약 1.2km x 0.6km (주변 8칸까지 보므로 칸 경계에 걸린 같은 장소도 비교)
+GEOHASH_PRECISION = 6
+GEOHASH_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+
+# 이름 조각 길이 (한글 2글자 조각이면 '목마식당' / '목마식당본점' 이 '목마', '마식', '식당' 을 공유)
+NGRAM = 2
+# 이보다 큰 블록 (예: 번화가 칸의 '식당') 은 변별력이 없으므로 건너뜀 (다른 조각으로 다시 만남)
+MAX_BLOCK_SIZE = 200
+
+SAME_ENTITY = 0.8
+HIGH_CONFIDENCE = 0.9
+
+# 쌍 점수 가중치 (합 1.0)
+WEIGHTS = {'name': 0.6, 'distance': 0.25, 'address': 0.15}
+# 이 거리 안이면 거리 점수 1.0, FAR_METERS 이상이면 0.0 (사이는 선형)
+NEAR_METERS = 30
+FAR_METERS = 300
+# 상호명이 이보다 다르면 위치가 같아도 다른 장소 (같은 건물의 다른 가게)
+MIN_NAME_SIMILARITY = 0.5
+
+# 지점명 ('목마식당 강남점', '8호점', '(홍대점)') - 본점은 지점 표기 없는 이름과 같은 장소로 봄
+BRANCH_PATTERN = re.compile(r'(?:\s|\()(\S+?)점\)?\s*$')
+
+Record = namedtuple('Record', ['index', 'row', 'name', 'coords', 'region'])
+Cluster = namedtuple('Cluster', ['members', 'confidence'])
+
+
+# ---------------------------------------------------------------------------
+# geohash
+# ---------------------------------------------------------------------------
+
+def geohash(lat, lng, precision=GEOHASH_PRECISION):
+    """(lat, lng) -> geohash 문자열"""
+    lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bits, bit_count, even = [], 0, 0, True
+    while len(chars) < precision:
+        rng, value = (lng_range, lng) if even else (lat_range, lat)
+        mid = (rng[0] + rng[1]) / 2
+        bits <<= 1
+        if value >= mid:
+            bits |= 1
+            rng[0] = mid
+        else:
+            rng[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(GEOHASH_BASE32[bits])
+            bits, bit_count = 0, 0
+    return ''.join(chars)
+
+
+def cell_size(precision=GEOHASH_PRECISION):
+    """geohash 칸 크기 (위도 높이, 경도 폭) 도 단위"""
+    lng_bits = (5 * precision + 1) // 2
+    lat_bits = 5 * precision // 2
+    return 180.0 / 2 ** lat_bits, 360.0 / 2 ** lng_bits
+
+
+def neighbor_cells(lat, lng, precision=GEOHASH_PRECISION):
+    """(lat, lng) 가 속한 칸과 주변 8칸"""
+    height, width = cell_size(precision)
+    return {geohash(lat + dy * height, lng + dx * width, precision)
+            for dy in (-1, 0, 1) for dx in (-1, 0, 1)}
+
+
+def distance_meters(a, b):
+    """두 (lat, lng) 사이 거리 (m, 하버사인)"""
+    lat1, lng1, lat2, lng2 = map(math.radians, (a[0], a[1], b[0], b[1]))
+    h = (math.sin((lat2 - lat1) / 2) ** 2
+         + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2)
+    return 2 * 6371000 * math.asin(math.sqrt(h))
+
+
+# ---------------------------------------------------------------------------
+# 블로킹
+# ---------------------------------------------------------------------------
+
+def name_grams(name, n=NGRAM):
+    """정규화 상호명의 n 글자 조각 집합 (이름이 n 글자보다 짧으면 이름 전체)"""
+    if len(name) <= n:
+        return {name} if name else set()
+    return {name[i:i + n] for i in range(len(name) - n + 1)}
+
+
+def branch_name(name):
+    """상호명 끝의 지점명 ('강남', '8호'), 없거나 본점이면 None"""
+    match = BRANCH_PATTERN.search(str(name or '').strip())
+    if not match or match.group(1) in ('본', '직영'):
+        return None
+    return match.group(1)
+
+
+def to_record(index, row):
+    name = normalize_name(row.get('place_name'))
+    coords = parse_coords(row.get('latitude'), row.get('longitude'))
+    region = ' '.join(region_tokens(row.get('address')))
+    return Record(index, row, name, coords, region)
+
+
+def candidate_pairs(records, max_block_size=MAX_BLOCK_SIZE):
+    """같은 블록을 공유하는 (i, j) 쌍 집합과 블로킹 통계
+
+    좌표가 있는 행은 geohash 칸과 지역 키 양쪽에 색인하고 주변 칸에서 후보를 찾고,
+    좌표가 없는 행은 지역 키에서 후보를 찾음 (좌표 없는 행도 좌표 있는 행과 비교되도록)
+    """
+    index = defaultdict(list)
+    lookups = []
+    for record in records:
+        grams = name_grams(record.name)
+        region_key = 'r:' + record.region if record.region else None
+        if record.coords:
+            cell = geohash(*record.coords)
+            keys = [cell] + ([region_key] if region_key else [])
+            search = neighbor_cells(*record.coords)
+        else:
+            keys = [region_key] if region_key else []
+            search = keys
+        for key in keys:
+            for gram in grams:
+                index[(key, gram)].append(record.index)
+        lookups.append((record.index, [(key, gram) for key in search for gram in grams]))
+
+    oversized = {block for block, members in index.items() if len(members) > max_block_size}
+    pairs = set()
+    for i, blocks in lookups:
+        for block in blocks:
+            if block in oversized:
+                continue
+            for j in index.get(block, ()):
+                if j != i:
+                    pairs.add((i, j) if i < j else (j, i))
+
+    stats = {'blocks': len(index), 'oversized': len(oversized),
+             'largest': max((len(m) for b, m in index.items() if b not in oversized), default=0)}
+    return pairs, stats
+
+
+# ---------------------------------------------------------------------------
+# 쌍 점수 / 묶음
+# ---------------------------------------------------------------------------
+
+def distance_score(a, b):
+    """좌표 거리 점수 0~1 (어느 한쪽이라도 좌표가 없으면 None)"""
+    if not a or not b:
+        return None
+    meters = distance_meters(a, b)
+    if meters <= NEAR_METERS:
+        return 1.0
+    if meters >= FAR_METERS:
+        return 0.0
+    return 1 - (meters - NEAR_METERS) / (FAR_METERS - NEAR_METERS)
+
+
+def score_pair(a, b):
+    """두 Record 의 (점수, 기준별 점수)"""
+    # 지점명이 서로 다르면 같은 상호의 다른 지점
+    branches = branch_name(a.row.get('place_name')), branch_name(b.row.get('place_name'))
+    if all(branches) and branches[0] != branches[1]:
+        return 0.0, {'name': 0.0, 'address': 0.0, 'distance': 0.0}
+
+    details = {
+        'name': name_similarity(a.row.get('place_name'), b.row.get('place_name')),
+        'address': max(region_agreement(a.row.get('address'), b.row.get('address')),
+                       region_agreement(b.row.get('address'), a.row.get('address'))),
+    }
+    distance = distance_score(a.coords, b.coords)
+    # 좌표가 없으면 거리 대신 주소 일치도로 판단
+    details['distance'] = distance if distance is not None else (details['address'] or NEUTRAL)
+    if details['name'] < MIN_NAME_SIMILARITY:
+        return details['name'] * WEIGHTS['name'], details
+    return sum(WEIGHTS[k] * v for k, v in details.items()), details
+
+
+class UnionFind:
+    """원소 묶기 (경로 압축 + 크기 기준 합치기)
+
+    labels 를 주면 (원소별 지점명 등, 없으면 None) 서로 다른 라벨을 가진 묶음은 합치지 않음
+    (쌍마다 비교하는 것만으로는 7호점 - 본 상호 - 8호점 처럼 라벨 없는 원소를 거쳐 이어지는 것을 막지 못함)
+    """
+
+    def __init__(self, n=0, labels=None):
+        self.parent = list(range(n))
+        self.size = [1] * n
+        self.labels = list(labels) if labels is not None else [None] * n
+
+    def add(self, label=None):
+        self.parent.append(len(self.parent))
+        self.size.append(1)
+        self.labels.append(label)
+        return len(self.parent) - 1
+
+    def find(self, x):
+        root = x
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[x] != root:
+            self.parent[x], x = root, self.parent[x]
+        return root
+
+    def union(self, a, b):
+        """a, b 의 묶음을 합치고 새 대표 반환 (이미 같은 묶음이거나 라벨이 다르면 None)"""
+        a, b = self.find(a), self.find(b)
+        if a == b or self.conflicts(a, b):
+            return None
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        self.labels[a] = self.labels[a] or self.labels[b]
+        return a
+
+    def conflicts(self, a, b):
+        """두 묶음이 서로 다른 라벨을 가졌는지"""
+        a, b = self.labels[self.find(a)], self.labels[self.find(b)]
+        return bool(a and b and a != b)
+
+
+def resolve(rows, threshold=SAME_ENTITY, max_block_size=MAX_BLOCK_SIZE):
+    """행 목록 -> (2개 이상 묶인 Cluster 목록, 통계)
+
+    Cluster.members 는 행 번호 (rows 의 인덱스) 목록, confidence 는 묶음을 이은 가장 약한 연결 점수
+    """
+    started = time.perf_counter()
+    records = [to_record(i, row) for i, row in enumerate(rows)]
+
+    # 정규화 상호명 + 주소가 같은 행은 점수 1.0 으로 바로 묶고 대표 행만 블로킹
+    # (같은 가게가 수십 번 나와도 묶음 안 쌍 비교가 제곱으로 늘지 않도록)
+    matches = []
+    representatives = {}
+    for record in records:
+        address = normalize_address(record.row.get('address'))
+        if not record.name or not (address or record.coords):
+            representatives[('', record.index)] = record
+            continue
+        key = (record.name, address or record.coords)
+        if key in representatives:
+            matches.append((1.0, representatives[key].index, record.index))
+        else:
+            representatives[key] = record
+    pairs, stats = candidate_pairs(list(representatives.values()), max_block_size)
+
+    for i, j in pairs:
+        score, _ = score_pair(records[i], records[j])
+        if score >= threshold:
+            matches.append((score, i, j))
+
+    # 높은 점수부터 합쳐 묶음마다 최대 신장 트리를 만들고, 트리에서 가장 약한 연결을 신뢰도로 사용
+    matches.sort(reverse=True)
+    # 서로 다른 지점명 (7호점 / 8호점) 은 다른 행을 거쳐서도 한 묶음이 되지 않도록
+    groups = UnionFind(len(records), [branch_name(record.row.get('place_name')) for record in records])
+    weakest = {}
+    for score, i, j in matches:
+        ri, rj = groups.find(i), groups.find(j)
+        root = groups.union(ri, rj)
+        if root is not None:
+            weakest[root] = min(score, weakest.get(ri, 1.0), weakest.get(rj, 1.0))
+
+    members = defaultdict(list)
+    for i in range(len(records)):
+        members[groups.find(i)].append(i)
+    clusters = [Cluster(m, round(weakest[root], 3)) for root, m in members.items() if len(m) > 1]
+    clusters.sort(key=lambda c: (-len(c.members), -c.confidence))
+
+    stats.update({
+        'rows': len(records),
+        'distinct': len(representatives),
+        'pairs': len(pairs),
+        'naive_pairs': len(records) * (len(records) - 1) // 2,
+        'matches': len(matches),
+        'clusters': len(clusters),
+        'seconds': time.perf_counter() - started,
+    })
+    return clusters, stats
+
+
+def write_clusters(path, rows, clusters):
+    """묶음을 행 단위 CSV 로 저장 (cluster, confidence, 원본 열 일부)"""
+    columns = ['no', 'title', 'place_name', 'address', 'latitude', 'longitude']
+    with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+        writer = csv.writer(f)
+        writer.writerow(['cluster', 'confidence'] + columns)
+        for number, cluster in enumerate(clusters, 1):
+            for i in cluster.members:
+                writer.writerow([number, cluster.confidence] + [rows[i].get(c, '') for c in columns])
+
+
+def print_summary(rows, clusters, stats, limit=10):
+    print(f"[Entity Resolution] {stats['rows']}행 (서로 다른 상호명+주소 {stats['distinct']}개), 블록 {stats['blocks']}개 "
+          f"(최대 {stats['largest']}행, 건너뛴 큰 블록 {stats['oversized']}개)")
+    print(f"  비교한 쌍: {stats['pairs']:,} / 전체 {stats['naive_pairs']:,} "
+          f"({stats['pairs'] / max(stats['naive_pairs'], 1):.3%}), {stats['seconds']:.2f}초")
+    duplicated = sum(len(c.members) for c in clusters)
+    high = sum(1 for c in clusters if c.confidence >= HIGH_CONFIDENCE)
+    print(f"  같은 장소 묶음: {stats['clusters']}개 ({duplicated}행), 높은 신뢰도 {high}개")
+    for cluster in clusters[:limit]:
+        names = ', '.join(f"{rows[i].get('place_name')}[{rows[i].get('title')}]" for i in cluster.members[:4])
+        more = f" 외 {len(cluster.members) - 4}" if len(cluster.members) > 4 else ''
+        print(f"    ({cluster.confidence:.2f}) {names}{more}")
+
+
+def main(argv):
+    path, out, threshold = DEFAULT_INPUT, None, SAME_ENTITY
+    args = iter(argv)
+    for arg in args:
+        if arg == '--out':
+            out = next(args)
+        elif arg == '--threshold':
+            threshold = float(next(args))
+        else:
+            path = arg
+
+    rows = read_rows(path)
+    clusters, stats = resolve(rows, threshold)
+    print_summary(rows, clusters, stats)
+    if out:
+        write_clusters(out, rows, clusters)
+        print(f"  저장: {out}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
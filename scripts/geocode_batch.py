@@ -0,0 +1,97 @@
+"""
+주소 단위 일괄 지오코딩
+행마다 지오코딩하지 않고 주소를 정규화하여 중복을 모은 뒤 고유 주소만 동시에 한 번씩 지오코딩하고
+결과를 같은 주소의 모든 행에 다시 나눠 줌 (여러 방송에 나온 같은 식당의 좌표도 자동으로 일치)
+고유 주소는 먼저 오프라인 색인 (offline_geocoder.py) 에서 찾고 없을 때만 Naver Geocoding API 호출
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from addresses import normalize_address
+from naver_client import NaverAPIError, get_client
+from offline_geocoder import get_offline_geocoder
+from quota import QuotaExhausted
+
+DEFAULT_WORKERS = 8
+
+
+def group_addresses(addresses):
+    """정규화 주소 -> 입력 인덱스 목록 (빈 주소는 제외)"""
+    groups = {}
+    for idx, address in enumerate(addresses):
+        key = normalize_address(address)
+        if key:
+            groups.setdefault(key, []).append(idx)
+    return groups
+
+
+def geocode_one(address, place_name=None, client=None, offline=True):
+    """주소 하나를 (lat, lng) 문자열 쌍으로 (오프라인 색인 우선), 실패하면 None"""
+    if offline:
+        local = get_offline_geocoder().lookup(address, place_name)
+        if local:
+            return str(local[0]), str(local[1])
+
+    result = (client or get_client()).geocode(address)
+    return (result.get('y', ''), result.get('x', '')) if result else None
+
+
+def batch_geocode(addresses, names=None, workers=DEFAULT_WORKERS, client=None, offline=True, verbose=True,
+                  quota_left=None):
+    """주소 리스트를 일괄 지오코딩하여 입력 순서대로 (lat, lng) 또는 None 리스트 반환
+
+    같은 정규화 주소는 처음 나온 원본 주소 (와 상호명) 로 한 번만 조회
+    quota_left (set) 를 주면 일일 한도 소진으로 조회하지 못한 입력 인덱스를 넣음 (실패가 아니라 다음 실행 대상)
+    """
+    client = client or get_client()
+    groups = group_addresses(addresses)
+    resolved = {}
+
+    # 1. 오프라인 색인
+    pending = []
+    if offline:
+        geocoder = get_offline_geocoder()
+        for key, indexes in groups.items():
+            first = indexes[0]
+            local = geocoder.lookup(addresses[first], names[first] if names else None)
+            if local:
+                resolved[key] = (str(local[0]), str(local[1]))
+            else:
+                pending.append(key)
+    else:
+        pending = list(groups)
+
+    # 2. 나머지는 API 로 동시 조회 (일일 한도를 다 쓰면 남은 주소는 다음 실행으로)
+    quota_keys = []
+
+    def geocode(key):
+        query = addresses[groups[key][0]]
+        try:
+            result = client.geocode(query)
+        except QuotaExhausted:
+            quota_keys.append(key)
+            return key, None
+        except NaverAPIError as e:
+            print(f"  [X] Geocoding 오류: {query} - {e}")
+            return key, None
+        if not result:
+            return key, None
+        return key, (result.get('y', ''), result.get('x', ''))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        resolved.update(executor.map(geocode, pending))
+
+    results = [None] * len(addresses)
+    for key, indexes in groups.items():
+        for idx in indexes:
+            results[idx] = resolved[key]
+
+    if verbose:
+        found = sum(1 for coords in resolved.values() if coords)
+        print(f"[Batch geocoding] {len(addresses)}개 행 -> 고유 주소 {len(groups)}개 "
+              f"(중복 {sum(len(v) for v in groups.values()) - len(groups)}개 절약), "
+              f"오프라인 {len(groups) - len(pending)}개 / API {len(pending)}개, 성공 {found}/{len(groups)}")
+    if quota_left is not None:
+        quota_left.update(idx for key in quota_keys for idx in groups[key])
+    if quota_keys:
+        print(f"[Batch geocoding] 일일 한도 소진: 고유 주소 {len(quota_keys)}개는 다음 실행에서 처리")
+    return results
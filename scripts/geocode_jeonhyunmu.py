@@ -1,9 +1,10 @@
 import csv
-import requests
-import time
 import os
 from dotenv import load_dotenv
 
+from geocode_batch import batch_geocode
+from naver_client import NaverAPIError, QuotaExhausted, get_client
+
 # .env 파일 로드
 load_dotenv()
 
@@ -13,46 +14,26 @@ NAVER_CLIENT_SECRET = os.getenv('NAVER_MAP_CLIENT_SECRET') or os.getenv('NAVER_S
 
 def geocode_address(address):
     """Naver Cloud Platform Geocoding API를 사용하여 주소를 위도/경도로 변환"""
-    # NCP Geocoding API 엔드포인트 (공식 문서 기준)
-    url = "https://maps.apigw.ntruss.com/map-geocode/v2/geocode"
-    
-    headers = {
-        "x-ncp-apigw-api-key-id": NAVER_CLIENT_ID,
-        "x-ncp-apigw-api-key": NAVER_CLIENT_SECRET,
-        "Accept": "application/json"
-    }
-    
-    params = {
-        "query": address
-    }
-    
     try:
-        response = requests.get(url, headers=headers, params=params)
-        
+        result = get_client().geocode(address)
+    except QuotaExhausted:
+        raise
+    except NaverAPIError as e:
         # 상세 오류 정보 출력
-        if response.status_code != 200:
-            print(f"  [X] API 오류 ({response.status_code}): {address}")
-            print(f"     응답: {response.text[:200]}")
-            return '', '', False
-        
-        data = response.json()
-        
-        # 응답 구조 확인
-        if data.get('status') == 'OK' and data.get('addresses'):
-            # 첫 번째 결과 사용
-            result = data['addresses'][0]
-            lat = result.get('y', '')
-            lng = result.get('x', '')
-            return lat, lng, True
+        if e.status:
+            print(f"  [X] API 오류 ({e.status}): {address}")
+            print(f"     응답: {str(e)[:200]}")
         else:
-            print(f"  [!] Geocoding 실패: {address}")
-            print(f"     응답 상태: {data.get('status')}")
-            return '', '', False
-            
-    except Exception as e:
-        print(f"  [X] 예외 발생: {address}")
-        print(f"     오류: {str(e)}")
+            print(f"  [X] 예외 발생: {address}")
+            print(f"     오류: {str(e)}")
         return '', '', False
+    
+    if result:
+        # 첫 번째 결과 사용
+        return result.get('y', ''), result.get('x', ''), True
+    
+    print(f"  [!] Geocoding 실패: {address}")
+    return '', '', False
 
 def main():
     input_file = 'd:/00_projects/02_TasteMap/doc/data/전현무계획.csv'
@@ -101,6 +82,12 @@ def main():
     fail_count = 0
     skip_count = 0
     
+    # 좌표가 없는 행의 주소만 모아 주소 단위로 일괄 Geocoding (같은 주소는 한 번만 조회)
+    # 한도 소진으로 남은 행은 실패로 세지 않고 다음 실행에서 조회
+    pending = ['' if len(row) > 12 and row[11] and row[12] else (row[10] if len(row) > 10 else '') for row in rows]
+    quota_left = set()
+    coords = batch_geocode(pending, [row[3] if len(row) > 3 else '' for row in rows], quota_left=quota_left)
+    
     for idx, row in enumerate(rows):
         # CSV 구조: no,media_type,title,place_name,place_type,description,opening_hours,break_time,closed_days,address,latitude,longitude,phone,last_updated,michelin_tier
         # 인덱스:     0   1          2     3          4           5            6             7          8           9       10        11         12    13            14
@@ -124,10 +111,8 @@ def main():
             skip_count += 1
             continue
         
-        # Geocoding
-        lat, lng, success = geocode_address(address)
-        
-        if success:
+        if coords[idx]:
+            lat, lng = coords[idx]
             # 행 길이 확인 및 확장
             while len(row) < 13:
                 row.append('')
@@ -135,11 +120,11 @@ def main():
             row[12] = lng  # 경도
             success_count += 1
             print(f"  [OK] 좌표: ({lat}, {lng})")
+        elif idx in quota_left:
+            print(f"  [WAIT] 일일 한도 소진 - 다음 실행에서 조회")
         else:
+            print(f"  [!] Geocoding 실패: {address}")
             fail_count += 1
-        
-        # API 요청 제한 방지 (초당 5회)
-        time.sleep(0.2)
 
     
     # 결과 저장
@@ -157,6 +142,8 @@ def main():
     print(f"  - 성공: {success_count}개")
     print(f"  - 실패: {fail_count}개")
     print(f"  - 스킵: {skip_count}개 (이미 좌표 있음 또는 주소 없음)")
+    if quota_left:
+        print(f"  - 일일 한도 소진으로 남음: {len(quota_left)}개 (다음 실행에서 조회)")
     print(f"  - 출력 파일: {output_file}")
     
     if fail_count > 0:
@@ -1,9 +1,10 @@
 import csv
-import requests
-import time
 import os
 from dotenv import load_dotenv
 
+from geocode_batch import batch_geocode
+from naver_client import NaverAPIError, QuotaExhausted, get_client
+
 # .env 파일 로드
 load_dotenv()
 
@@ -13,46 +14,26 @@ NAVER_CLIENT_SECRET = os.getenv('NAVER_MAP_CLIENT_SECRET') or os.getenv('NAVER_S
 
 def geocode_address(address):
     """Naver Cloud Platform Geocoding API를 사용하여 주소를 위도/경도로 변환"""
-    # NCP Geocoding API 엔드포인트 (공식 문서 기준)
-    url = "https://maps.apigw.ntruss.com/map-geocode/v2/geocode"
-    
-    headers = {
-        "x-ncp-apigw-api-key-id": NAVER_CLIENT_ID,
-        "x-ncp-apigw-api-key": NAVER_CLIENT_SECRET,
-        "Accept": "application/json"
-    }
-    
-    params = {
-        "query": address
-    }
-    
     try:
-        response = requests.get(url, headers=headers, params=params)
-        
+        result = get_client().geocode(address)
+    except QuotaExhausted:
+        raise
+    except NaverAPIError as e:
         # 상세 오류 정보 출력
-        if response.status_code != 200:
-            print(f"  [X] API 오류 ({response.status_code}): {address}")
-            print(f"     응답: {response.text[:200]}")
-            return '0.0', '0.0', False
-        
-        data = response.json()
-        
-        # 응답 구조 확인
-        if data.get('status') == 'OK' and data.get('addresses'):
-            # 첫 번째 결과 사용
-            result = data['addresses'][0]
-            lat = result.get('y', '0.0')
-            lng = result.get('x', '0.0')
-            return lat, lng, True
+        if e.status:
+            print(f"  [X] API 오류 ({e.status}): {address}")
+            print(f"     응답: {str(e)[:200]}")
         else:
-            print(f"  [!] Geocoding 실패: {address}")
-            print(f"     응답 상태: {data.get('status')}")
-            return '0.0', '0.0', False
-            
-    except Exception as e:
-        print(f"  [X] 예외 발생: {address}")
-        print(f"     오류: {str(e)}")
+            print(f"  [X] 예외 발생: {address}")
+            print(f"     오류: {str(e)}")
         return '0.0', '0.0', False
+    
+    if result:
+        # 첫 번째 결과 사용
+        return result.get('y', '0.0'), result.get('x', '0.0'), True
+    
+    print(f"  [!] Geocoding 실패: {address}")
+    return '0.0', '0.0', False
 
 def main():
     input_file = 'd:/00_projects/01_ScreenMap_Backup/doc/michelin_converted.csv'
@@ -81,6 +62,10 @@ def main():
     success_count = 0
     fail_count = 0
     
+    # 같은 주소는 한 번만 조회하도록 주소 단위로 일괄 Geocoding (한도 소진으로 남은 행은 실패로 세지 않음)
+    quota_left = set()
+    coords = batch_geocode([row[9] for row in rows], [row[3] for row in rows], quota_left=quota_left)
+    
     for idx, row in enumerate(rows):
         restaurant_name = row[3]
         address = row[9]
@@ -88,19 +73,17 @@ def main():
         print(f"\n[{idx+1}/{len(rows)}] {restaurant_name}")
         print(f"  주소: {address}")
         
-        # Geocoding
-        lat, lng, success = geocode_address(address)
-        
-        if success:
+        if coords[idx]:
+            lat, lng = coords[idx]
             row[10] = lat  # 위도
             row[11] = lng  # 경도
             success_count += 1
             print(f"  [OK] 좌표: ({lat}, {lng})")
+        elif idx in quota_left:
+            print(f"  [WAIT] 일일 한도 소진 - 다음 실행에서 조회")
         else:
+            print(f"  [!] Geocoding 실패: {address}")
             fail_count += 1
-        
-        # API 요청 제한 방지 (초당 5회)
-        time.sleep(0.2)
     
     # 결과 저장
     with open(output_file, 'w', encoding='utf-8', newline='') as f:
@@ -111,6 +94,8 @@ def main():
     print(f"\n[완료] Geocoding 완료!")
     print(f"  - 성공: {success_count}개")
     print(f"  - 실패: {fail_count}개")
+    if quota_left:
+        print(f"  - 일일 한도 소진으로 남음: {len(quota_left)}개 (다음 실행에서 조회)")
     print(f"  - 출력 파일: {output_file}")
     
     if fail_count > 0:
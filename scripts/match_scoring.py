@@ -0,0 +1,168 @@
+"""
+네이버 지역 검색 결과 후보 점수화
+items[0] 을 그대로 쓰지 않고 display=5 결과 전체를 다음 기준으로 점수를 매겨 가장 맞는 후보 선택
+
+  - 상호명 유사도   (정규화 후 일치 / 포함 / 글자 배열 유사도)
+  - 지역 일치      (이미 알고 있는 주소의 시/도, 시/군/구, 도로명+번호 와 후보 주소 비교)
+  - 카테고리 적합도 (place_type 에 어울리는 네이버 category 인지)
+
+점수가 HIGH_CONFIDENCE 이상이면 확실한 매칭, LOW_CONFIDENCE 미만이면 버림 (None),
+그 사이는 사용하되 confident=False 로 표시하여 두 번째 검색 대신 검토 대상으로 남김
+알고 있는 주소와 지역이 맞지 않으면 (지역 점수 MIN_CONFIDENT_REGION 미만) 점수와 관계없이 검토 대상
+(실행이 끝나면 검토가 필요한 매칭 목록을 출력)
+"""
+import atexit
+import threading
+from collections import namedtuple
+from difflib import SequenceMatcher
+
+from addresses import normalize_address, normalize_name, road_key
+
+HIGH_CONFIDENCE = 0.75
+LOW_CONFIDENCE = 0.5
+# 확실한 매칭으로 보려면 필요한 지역 점수 (시/군/구 일치 수준, 주소를 모를 때의 NEUTRAL 은 통과)
+MIN_CONFIDENT_REGION = 0.5
+
+# 기준별 가중치 (합 1.0)
+WEIGHTS = {'name': 0.6, 'region': 0.25, 'category': 0.15}
+
+# 지역 비교 시 주소 앞 단어별 가중치 (시/도, 시/군/구, 읍/면/동/도로명) - 시/군/구 불일치를 가장 크게 반영
+REGION_TOKEN_WEIGHTS = (0.3, 0.5, 0.2)
+
+# 기준 정보가 없을 때 (주소 / place_type 미상) 주는 중립 점수
+NEUTRAL = 0.5
+
+# place_type -> 어울리는 네이버 category 키워드 ('한식>국밥', '카페,디저트', '숙박>호텔' 등)
+PLACE_TYPE_CATEGORIES = {
+    'restaurant': ('음식점', '한식', '중식', '일식', '양식', '분식', '술집', '요리', '고기', '해물', '생선',
+                   '국밥', '치킨', '뷔페', '음식', '주점', '이탈리아', '프랑스', '아시아', '전통식품', '카페', '베이커리'),
+    'bakery': ('베이커리', '제과', '빵', '카페', '디저트', '도넛', '케이크'),
+    'cafe': ('카페', '디저트', '커피', '찻집', '베이커리', '제과', '빵'),
+    'stay': ('숙박', '호텔', '모텔', '펜션', '리조트', '게스트하우스', '캠핑', '한옥'),
+    'station': ('교통', '운수', '역', '터미널', '공항', '항구'),
+    'store': ('쇼핑', '유통', '시장', '상점', '마트', '편의점', '백화점'),
+    'shop': ('쇼핑', '유통', '시장', '상점', '마트', '편의점', '백화점'),
+    'cvs': ('편의점', '쇼핑', '유통'),
+    'playground': ('여행', '명소', '공원', '관광', '문화', '레저', '체육', '테마파크', '해수욕장', '박물관',
+                   '전시', '공연', '사찰', '교육', '학교', '시설', '건물'),
+}
+
+Match = namedtuple('Match', ['item', 'score', 'confident', 'details'])
+
+
+def _clean(text):
+    return (text or '').replace('<b>', '').replace('</b>', '')
+
+
+def name_similarity(a, b):
+    """상호명 유사도 0~1 (정규화 후 일치 1.0, 한쪽이 다른 쪽을 포함하면 0.85 이상, 그 외 글자 배열 유사도)"""
+    a, b = normalize_name(_clean(a)), normalize_name(_clean(b))
+    if not a or not b:
+        return 0.0
+    if a == b:
+        return 1.0
+    if a in b or b in a:
+        return 0.85 + 0.15 * min(len(a), len(b)) / max(len(a), len(b))
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def _region_core(token):
+    """'마포구' -> '마포', '강릉시' -> '강릉' (짧은 표기와도 비교되도록 행정 단위 접미사 제거)"""
+    for suffix in ('특별자치도', '특별자치시', '특별시', '광역시', '시', '군', '구', '도'):
+        if token.endswith(suffix) and len(token) > len(suffix) + 1:
+            return token[:-len(suffix)]
+    return token
+
+
+def region_agreement(known_address, candidate_address):
+    """알고 있는 주소와 후보 주소의 지역 일치도 0~1 (알고 있는 주소가 없으면 NEUTRAL)"""
+    known = normalize_address(known_address)
+    if not known:
+        return NEUTRAL
+    candidate = normalize_address(candidate_address)
+    if not candidate:
+        return 0.0
+
+    known_road = road_key(known)
+    if known_road and known_road == road_key(candidate):
+        return 1.0
+
+    tokens = known.split()[:len(REGION_TOKEN_WEIGHTS)]
+    weights = REGION_TOKEN_WEIGHTS[:len(tokens)]
+    matched = sum(w for w, token in zip(weights, tokens) if _region_core(token) in candidate)
+    return matched / sum(weights)
+
+
+def category_plausibility(category, place_type):
+    """place_type 에 어울리는 category 면 1.0, 아니면 0.0 (place_type / category 를 모르면 NEUTRAL)"""
+    keywords = PLACE_TYPE_CATEGORIES.get((place_type or '').strip())
+    if not keywords or not category:
+        return NEUTRAL
+    return 1.0 if any(keyword in category for keyword in keywords) else 0.0
+
+
+def score_candidate(item, name, address=None, place_type=None):
+    """검색 결과 하나의 (점수, 기준별 점수)"""
+    candidate_address = _clean(item.get('roadAddress')) or _clean(item.get('address'))
+    details = {
+        'name': name_similarity(name, item.get('title')),
+        'region': max(region_agreement(address, candidate_address),
+                      region_agreement(address, _clean(item.get('address')))),
+        'category': category_plausibility(item.get('category', ''), place_type),
+    }
+    # 상호명이 전혀 다르면 지역 / 카테고리가 맞아도 다른 가게
+    if details['name'] < 0.3:
+        return details['name'] * WEIGHTS['name'], details
+    return sum(WEIGHTS[k] * v for k, v in details.items()), details
+
+
+def rank_candidates(items, name, address=None, place_type=None):
+    """후보를 점수 높은 순으로 [Match, ...] (동점이면 네이버 순서 유지)"""
+    ranked = []
+    for item in items or []:
+        score, details = score_candidate(item, name, address, place_type)
+        # 다른 도시의 같은 상호 (상호명 0.6 + 카테고리 0.15 = 0.75) 가 확실한 매칭으로 넘어가지 않도록
+        confident = score >= HIGH_CONFIDENCE and details['region'] >= MIN_CONFIDENT_REGION
+        ranked.append(Match(item, round(score, 3), confident, details))
+    ranked.sort(key=lambda m: -m.score)
+    return ranked
+
+
+_review = []
+_review_lock = threading.Lock()
+
+
+def _report():
+    if _review:
+        print(f"\n[검토 필요] 낮은 신뢰도 매칭 {len(_review)}건")
+        for name, address, match in _review:
+            print(f"  {name} ({address or '주소 없음'}) -> {describe(match)}")
+
+
+def flag_for_review(name, address, match):
+    """낮은 신뢰도 매칭을 검토 목록에 추가 (종료 시 출력)"""
+    with _review_lock:
+        if not _review:
+            atexit.register(_report)
+        _review.append((name, address, match))
+
+
+def best_match(items, name, address=None, place_type=None, min_score=LOW_CONFIDENCE):
+    """가장 맞는 후보 Match, min_score 미만이면 None
+
+    confident=False 인 매칭은 검토 목록에 올림 (같은 행을 다른 검색어로 다시 찾는 대신)
+    """
+    ranked = rank_candidates(items, name, address, place_type)
+    if not ranked or ranked[0].score < min_score:
+        return None
+    if not ranked[0].confident:
+        flag_for_review(name, address, ranked[0])
+    return ranked[0]
+
+
+def describe(match):
+    """로그용 한 줄 요약"""
+    d = match.details
+    flag = '' if match.confident else ' [?] 낮은 신뢰도 - 검토 필요'
+    return (f"{_clean(match.item.get('title'))} (점수 {match.score:.2f}: 이름 {d['name']:.2f}, "
+            f"지역 {d['region']:.2f}, 카테고리 {d['category']:.2f}){flag}")
@@ -0,0 +1,131 @@
+"""
+네이버 API 응답 영구 캐시 (SQLite)
+(API, 정규화한 검색어, 파라미터) 를 키로 원본 JSON 응답을 저장하여
+재실행이나 여러 방송에 겹치는 식당은 API 를 다시 호출하지 않음
+
+- 결과 있음: DEFAULT_TTL 동안 유효
+- 결과 없음 (items / addresses 가 빈 응답): NEGATIVE_TTL 동안 유효 (없는 장소를 매번 재검색하지 않음)
+- 오류 응답은 저장하지 않음
+"""
+import atexit
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+
+CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.naver_cache.sqlite3')
+
+DEFAULT_TTL = 30 * 24 * 3600
+NEGATIVE_TTL = 7 * 24 * 3600
+
+
+def normalize_query(query):
+    """유니코드 정규화(NFC) + 공백 정리 + 소문자 (같은 검색어의 표기 차이를 하나의 키로)"""
+    return ' '.join(unicodedata.normalize('NFC', str(query)).split()).lower()
+
+
+def cache_key(api, params):
+    params = dict(params)
+    params['query'] = normalize_query(params.get('query', ''))
+    raw = json.dumps([api, sorted(params.items())], ensure_ascii=False, default=str)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest(), params['query']
+
+
+def is_negative(data):
+    """검색 결과 / 주소 결과가 비어 있는 응답인지"""
+    if 'addresses' in data:
+        return not data['addresses']
+    return not data.get('items')
+
+
+class ResponseCache:
+    """API 응답 캐시 (스레드 간 공유 가능)"""
+
+    def __init__(self, path=None, ttl=DEFAULT_TTL, negative_ttl=NEGATIVE_TTL):
+        self.path = path or CACHE_FILE
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, api TEXT, query TEXT, body TEXT,"
+            " negative INTEGER, created REAL)"
+        )
+        self._conn.commit()
+
+    def get(self, api, params):
+        """유효한 캐시 응답 (없거나 만료되면 None), 적중/미스 집계"""
+        key, _ = cache_key(api, params)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, negative, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row:
+                body, negative, created = row
+                ttl = self.negative_ttl if negative else self.ttl
+                if time.time() - created < ttl:
+                    self.hits += 1
+                    if negative:
+                        self.negative_hits += 1
+                    return json.loads(body)
+
+            self.misses += 1
+            return None
+
+    def put(self, api, params, data):
+        key, query = cache_key(api, params)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, api, query, body, negative, created) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, api, query, json.dumps(data, ensure_ascii=False), int(is_negative(data)), time.time()),
+            )
+            self._conn.commit()
+
+    def purge_expired(self):
+        """만료된 항목 삭제 후 삭제 개수 반환"""
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM responses WHERE (negative = 0 AND created < ?) OR (negative = 1 AND created < ?)",
+                (now - self.ttl, now - self.negative_ttl),
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def summary(self):
+        total = self.hits + self.misses
+        rate = self.hits / total * 100 if total else 0
+        return (f"API cache: {self.hits}/{total} hits ({rate:.0f}%), "
+                f"{self.hits} calls saved ({self.negative_hits} cached not-found)")
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def _report():
+    if _default_cache and (_default_cache.hits or _default_cache.misses):
+        print(f"\n{_default_cache.summary()}")
+
+
+def get_cache():
+    """모든 스크립트가 공유하는 기본 캐시 (종료 시 적중률 출력)"""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = ResponseCache()
+            atexit.register(_report)
+        return _default_cache
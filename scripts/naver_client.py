@@ -0,0 +1,312 @@
+"""
+네이버 API 공용 클라이언트 (지역 검색 / 웹 검색 / NCP Geocoding)
+requests.Session 커넥션 풀을 재사용하여 호출마다 TCP+TLS 연결을 새로 맺지 않음
+동기(NaverClient)와 asyncio(AsyncNaverClient, aiohttp 필요) 인터페이스를 같은 형태로 제공
+"""
+import asyncio
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from dotenv import load_dotenv
+
+import naver_cache
+import rate_limit
+import quota
+from quota import KeyScheduler, configured_keys
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# .env 파일 로드
+load_dotenv()
+
+LOCAL_SEARCH_URL = "https://openapi.naver.com/v1/search/local.json"
+WEB_SEARCH_URL = "https://openapi.naver.com/v1/search/webkr.json"
+GEOCODE_URL = "https://maps.apigw.ntruss.com/map-geocode/v2/geocode"
+
+# API 이름 -> (URL, 사용할 키 종류)
+APIS = {
+    'local': (LOCAL_SEARCH_URL, 'search'),
+    'web': (WEB_SEARCH_URL, 'search'),
+    'geocode': (GEOCODE_URL, 'map'),
+}
+
+# 429 응답 본문에 이 표시가 있으면 속도 제한이 아니라 일일 한도 초과 (해당 키는 오늘 더 쓰지 않음)
+QUOTA_ERROR_MARKERS = ('"010"', 'quota', 'query limit exceeded')
+
+DEFAULT_TIMEOUT = 10
+DEFAULT_POOL_SIZE = 10
+
+
+class NaverAPIError(Exception):
+    """HTTP 오류 응답 또는 네트워크 예외 (status 가 None 이면 네트워크 예외)"""
+
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+
+class QuotaExhausted(NaverAPIError, quota.QuotaExhausted):
+    """모든 키의 오늘 한도 소진 (NaverAPIError 로 잡는 기존 루프도 트레이스백 없이 처리)
+
+    요청을 보내기 전에 발생하므로 재시도해도 소용없음 (adaptive_concurrency.is_throttled 에서 제외)
+    """
+
+    def __init__(self, group):
+        Exception.__init__(self, f"{group} API 오늘 한도 소진 (모든 키)")
+        self.status = 429
+        self.group = group
+
+
+def default_credentials():
+    """.env 의 검색 / 지도 API 키 (지도 키가 없으면 검색 키 사용)"""
+    search_id = os.getenv('NAVER_SEARCH_CLIENT_ID')
+    search_secret = os.getenv('NAVER_SEARCH_CLIENT_SECRET')
+    return {
+        'search': (search_id, search_secret),
+        'map': (os.getenv('NAVER_MAP_CLIENT_ID') or search_id,
+                os.getenv('NAVER_MAP_CLIENT_SECRET') or search_secret),
+    }
+
+
+def clean_html_tags(text):
+    """검색 결과의 <b> 강조 태그 제거"""
+    if not text:
+        return ''
+    return text.replace('<b>', '').replace('</b>', '').strip()
+
+
+class _BaseClient:
+    """키 / 헤더 / 파라미터 구성 공통부"""
+
+    def __init__(self, search_id=None, search_secret=None, map_id=None, map_secret=None,
+                 pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT, rate_limited=True,
+                 cache=True, quota=True):
+        defaults = default_credentials()
+        explicit = {'search': search_id, 'map': map_id}
+        search_id = search_id or defaults['search'][0]
+        search_secret = search_secret or defaults['search'][1]
+        self.credentials = {
+            'search': (search_id, search_secret),
+            'map': (map_id or defaults['map'][0] or search_id,
+                    map_secret or defaults['map'][1] or search_secret),
+        }
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.rate_limited = rate_limited
+        # True: 공용 캐시 (naver_cache.py), False/None: 캐시 사용 안 함, ResponseCache: 지정 캐시
+        self.cache = naver_cache.get_cache() if cache is True else (cache or None)
+        # 키를 직접 주면 그 키만, 아니면 .env 의 번호 붙은 키 (quota.py) 까지 모두 사용
+        self.keyring = {
+            kind: self._keyring(kind, explicit[kind]) for kind in self.credentials
+        }
+        # 기본 키 없이 번호 붙은 키만 설정된 경우 첫 번째 키를 기본 키로
+        for kind, keys in self.keyring.items():
+            if not all(self.credentials[kind]) and all(keys[0]):
+                self.credentials[kind] = keys[0]
+        # True: 일일 한도 장부로 키 분배 (quota.py), False: 첫 번째 키만 한도 기록 없이 사용
+        self.schedulers = ({kind: KeyScheduler(kind, keys) for kind, keys in self.keyring.items()}
+                           if quota else None)
+        self.calls = 0
+        self._local = threading.local()
+
+    def _keyring(self, kind, explicit):
+        if explicit:
+            return [self.credentials[kind]]
+        # id / secret 중 하나라도 없는 키는 빼고 (빈 키로 나간 요청이 401 을 받으며 한도만 쓰지 않도록)
+        keys = [key for key in [self.credentials[kind]] + configured_keys(kind) if all(key)]
+        keys = list(dict.fromkeys(keys))
+        return keys or [self.credentials[kind]]
+
+    def thread_calls(self):
+        """현재 스레드에서 실제로 보낸 요청 수 (캐시 적중은 세지 않음, run_adaptive 의 network_calls 용)"""
+        return getattr(self._local, 'calls', 0)
+
+    def _count_call(self):
+        self.calls += 1
+        self._local.calls = self.thread_calls() + 1
+
+    def has_credentials(self, kind='search'):
+        client_id, client_secret = self.credentials[kind]
+        return bool(client_id and client_secret)
+
+    def _acquire_key(self, api):
+        """이번 호출에 쓸 (id, secret) (남은 한도가 가장 많은 키), 모든 키가 소진되면 QuotaExhausted"""
+        kind = APIS[api][1]
+        if self.schedulers:
+            try:
+                return self.schedulers[kind].acquire()
+            except quota.QuotaExhausted as e:
+                raise QuotaExhausted(e.group) from None
+        return self.credentials[kind]
+
+    def _check_quota_error(self, api, key, status, text):
+        """일일 한도 초과 응답이면 해당 키를 오늘 소진된 것으로 기록"""
+        if self.schedulers and status == 429 and any(m in text.lower() for m in QUOTA_ERROR_MARKERS):
+            self.schedulers[APIS[api][1]].exhaust(key)
+
+    def _bucket(self, api, client_id):
+        """(API, 키) 공용 토큰 버킷 (rate_limit.py), 제한 없이 쓰면 None"""
+        if not self.rate_limited:
+            return None
+        return rate_limit.get_bucket(api, client_id)
+
+    def _headers(self, api, key):
+        kind = APIS[api][1]
+        client_id, client_secret = key
+        if kind == 'search':
+            return {"X-Naver-Client-Id": client_id or '', "X-Naver-Client-Secret": client_secret or ''}
+        return {
+            "x-ncp-apigw-api-key-id": client_id or '',
+            "x-ncp-apigw-api-key": client_secret or '',
+            "Accept": "application/json",
+        }
+
+    @staticmethod
+    def _local_params(query, display, start, sort):
+        return {"query": query, "display": display, "start": start, "sort": sort}
+
+    @staticmethod
+    def _first_geocode(data):
+        if data.get('status') == 'OK' and data.get('addresses'):
+            return data['addresses'][0]
+        return None
+
+
+class NaverClient(_BaseClient):
+    """동기 클라이언트 (스레드 간 공유 가능, pool_size 는 동시 작업 스레드 수 이상으로)"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=len(APIS), pool_maxsize=self.pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.session.close()
+
+    def request(self, api, params):
+        """API 호출 후 JSON 반환 (캐시 우선, 200 이 아니거나 네트워크 오류면 NaverAPIError,
+        모든 키의 일일 한도를 다 썼으면 QuotaExhausted)
+        """
+        cached = self.cache.get(api, params) if self.cache else None
+        if cached is not None:
+            return cached
+
+        url = APIS[api][0]
+        key = self._acquire_key(api)
+        bucket = self._bucket(api, key[0])
+        if bucket:
+            bucket.acquire()
+        self._count_call()
+        try:
+            response = self.session.get(url, headers=self._headers(api, key), params=params, timeout=self.timeout)
+        except requests.RequestException as e:
+            raise NaverAPIError(str(e)) from e
+
+        if response.status_code != 200:
+            self._check_quota_error(api, key, response.status_code, response.text)
+            raise NaverAPIError(f"{api} API 오류 ({response.status_code}): {response.text[:200]}", response.status_code)
+
+        data = response.json()
+        if self.cache:
+            self.cache.put(api, params, data)
+        return data
+
+    def search_local(self, query, display=5, start=1, sort='random'):
+        """지역 검색 결과 items (없으면 빈 리스트)"""
+        return self.request('local', self._local_params(query, display, start, sort)).get('items', [])
+
+    def search_web(self, query, display=5):
+        """웹 문서 검색 결과 items (없으면 빈 리스트)"""
+        return self.request('web', {"query": query, "display": display}).get('items', [])
+
+    def geocode(self, address):
+        """주소의 첫 번째 Geocoding 결과 (x=경도, y=위도), 없으면 None"""
+        return self._first_geocode(self.request('geocode', {"query": address}))
+
+
+class AsyncNaverClient(_BaseClient):
+    """asyncio 클라이언트 (aiohttp 커넥션 풀 하나를 모든 코루틴이 공유)
+
+    async with AsyncNaverClient() as client:
+        items = await client.search_local("강남 맛집")
+    """
+
+    def __init__(self, *args, **kwargs):
+        if not AIOHTTP_AVAILABLE:
+            raise RuntimeError("aiohttp is not installed (pip install aiohttp)")
+        super().__init__(*args, **kwargs)
+        self.session = None
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(limit=self.pool_size)
+        self.session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=self.timeout))
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def close(self):
+        if self.session:
+            await self.session.close()
+            self.session = None
+
+    async def request(self, api, params):
+        cached = self.cache.get(api, params) if self.cache else None
+        if cached is not None:
+            return cached
+
+        url = APIS[api][0]
+        key = self._acquire_key(api)
+        bucket = self._bucket(api, key[0])
+        if bucket:
+            await bucket.acquire_async()
+        self._count_call()
+        try:
+            async with self.session.get(url, headers=self._headers(api, key), params=params) as response:
+                if response.status != 200:
+                    text = await response.text()
+                    self._check_quota_error(api, key, response.status, text)
+                    raise NaverAPIError(f"{api} API 오류 ({response.status}): {text[:200]}", response.status)
+                data = await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise NaverAPIError(str(e) or type(e).__name__) from e
+
+        if self.cache:
+            self.cache.put(api, params, data)
+        return data
+
+    async def search_local(self, query, display=5, start=1, sort='random'):
+        data = await self.request('local', self._local_params(query, display, start, sort))
+        return data.get('items', [])
+
+    async def search_web(self, query, display=5):
+        data = await self.request('web', {"query": query, "display": display})
+        return data.get('items', [])
+
+    async def geocode(self, address):
+        return self._first_geocode(await self.request('geocode', {"query": address}))
+
+
+_default_client = None
+
+
+def get_client():
+    """.env 키를 쓰는 프로세스 공용 동기 클라이언트"""
+    global _default_client
+    if _default_client is None:
+        _default_client = NaverClient()
+    return _default_client
@@ -0,0 +1,189 @@
+"""
+기존 데이터로 만든 오프라인 지오코더
+assets/data/locations.csv 와 과거 촬영지 데이터 (data_structure.json 이 설명하는 15k 행 CSV) 의
+좌표를 다음 키로 색인하여 새 데이터셋의 대부분을 API 호출 없이 로컬에서 바로 해결
+
+  1. 정규화 주소           (서울 마포구 연남로 25)
+  2. 시/군/구 + 도로명 + 건물번호 (('서울', '마포구'), 연남로, 25) - 읍/면/동 표기 차이 흡수
+  3. 상호명 + 시/군/구      (옛날초당순두부, ('강원', '강릉시')) - 번지 없는 부분 주소일 때만
+
+색인에 없으면 None 을 반환하고 호출하는 쪽에서 Naver Geocoding API 를 사용
+
+사용법:
+  python offline_geocoder.py "서울특별시 마포구 연남로 25 2층"   # 조회 테스트
+  python offline_geocoder.py --check                           # 기존 데이터 자체 적중률 확인
+"""
+import csv
+import os
+import sys
+import time
+
+from addresses import is_partial_address, normalize_address, normalize_name, region_tokens, road_key
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 먼저 나온 소스의 좌표가 우선 (최신 데이터 -> 과거 데이터 순)
+DEFAULT_SOURCES = [
+    os.path.join(ROOT_DIR, 'assets', 'data', 'locations.csv'),
+    os.path.join(ROOT_DIR, 'doc', '한국문화정보원_미디어콘텐츠 영상 촬영지 데이터_20221125.csv'),
+]
+
+# 한글 헤더 -> 영문 헤더
+HEADER_ALIASES = {'장소명': 'place_name', '주소': 'address', '위도': 'latitude', '경도': 'longitude'}
+
+# 대한민국 좌표 범위 (범위를 벗어난 좌표는 색인하지 않음)
+LAT_RANGE = (33.0, 39.0)
+LNG_RANGE = (124.0, 132.0)
+
+# 도로명 / 상호명 키에 이보다 멀리 떨어진 좌표가 함께 들어오면 모호한 키로 보고 사용하지 않음 (도 단위, 약 200m)
+AMBIGUOUS_DISTANCE = 0.002
+
+
+def read_rows(path):
+    """UTF-8 (BOM 포함) 또는 CP949 CSV 를 영문 헤더 dict 로 읽기"""
+    for encoding in ('utf-8-sig', 'cp949'):
+        try:
+            with open(path, 'r', encoding=encoding) as f:
+                reader = csv.DictReader(f)
+                return [{HEADER_ALIASES.get(k, k): v for k, v in row.items()} for row in reader]
+        except UnicodeDecodeError:
+            continue
+    raise ValueError(f"지원하지 않는 인코딩: {path}")
+
+
+def parse_coords(lat, lng):
+    """유효한 (lat, lng) 실수 쌍 또는 None"""
+    try:
+        lat, lng = float(lat), float(lng)
+    except (TypeError, ValueError):
+        return None
+    if LAT_RANGE[0] <= lat <= LAT_RANGE[1] and LNG_RANGE[0] <= lng <= LNG_RANGE[1]:
+        return lat, lng
+    return None
+
+
+class OfflineGeocoder:
+    """주소 / 도로명 / 상호명 키 -> (lat, lng) 색인"""
+
+    def __init__(self):
+        self.by_address = {}
+        self.by_road = {}
+        self.by_name = {}
+        self.hits = {'address': 0, 'road': 0, 'name': 0}
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.by_address)
+
+    @staticmethod
+    def _road_key(address):
+        road = road_key(address)
+        return (region_tokens(address), road) if road else None
+
+    @staticmethod
+    def _name_key(place_name, address):
+        name = normalize_name(place_name)
+        region = region_tokens(address)
+        return (name, region) if name and len(region) == 2 else None
+
+    @staticmethod
+    def _add_unique(index, key, coords):
+        """같은 키에 멀리 떨어진 좌표가 들어오면 None 으로 표시하여 조회에서 제외"""
+        existing = index.get(key, coords)
+        if existing is not None and (abs(existing[0] - coords[0]) > AMBIGUOUS_DISTANCE
+                                     or abs(existing[1] - coords[1]) > AMBIGUOUS_DISTANCE):
+            existing = None
+        index[key] = existing
+
+    def add(self, place_name, address, lat, lng):
+        """좌표 하나를 색인 (주소 키는 먼저 들어온 좌표 유지), 색인했으면 True"""
+        coords = parse_coords(lat, lng)
+        key = normalize_address(address)
+        if not coords or not key:
+            return False
+
+        self.by_address.setdefault(key, coords)
+        road = self._road_key(address)
+        if road:
+            self._add_unique(self.by_road, road, coords)
+        name = self._name_key(place_name, address)
+        if name:
+            self._add_unique(self.by_name, name, coords)
+        return True
+
+    def add_rows(self, rows):
+        return sum(1 for row in rows if self.add(row.get('place_name'), row.get('address'),
+                                                  row.get('latitude'), row.get('longitude')))
+
+    @classmethod
+    def build(cls, sources=None, verbose=True):
+        """CSV 소스들로 색인 생성 (없는 파일은 건너뜀)"""
+        geocoder = cls()
+        start = time.time()
+        for path in sources or DEFAULT_SOURCES:
+            if not os.path.exists(path):
+                if verbose:
+                    print(f"[Offline geocoder] 소스 없음: {path}")
+                continue
+            added = geocoder.add_rows(read_rows(path))
+            if verbose:
+                print(f"[Offline geocoder] {os.path.basename(path)}: {added}개 좌표")
+        if verbose:
+            print(f"[Offline geocoder] 주소 {len(geocoder.by_address)}개, 도로명 {len(geocoder.by_road)}개, "
+                  f"상호명 {len(geocoder.by_name)}개 ({time.time() - start:.2f}초)")
+        return geocoder
+
+    def lookup(self, address=None, place_name=None):
+        """(lat, lng, 매칭 방식) 또는 None"""
+        candidates = []
+        key = normalize_address(address)
+        if key:
+            candidates.append(('address', self.by_address, key))
+            candidates.append(('road', self.by_road, self._road_key(address)))
+            # 번지까지 있는 주소가 색인에 없으면 이전한 가게일 수 있으므로 상호명 키는 부분 주소에만 사용
+            if place_name and is_partial_address(address):
+                candidates.append(('name', self.by_name, self._name_key(place_name, address)))
+
+        for method, index, lookup_key in candidates:
+            coords = index.get(lookup_key) if lookup_key else None
+            if coords:
+                self.hits[method] += 1
+                return coords[0], coords[1], method
+
+        self.misses += 1
+        return None
+
+    def summary(self):
+        total = sum(self.hits.values()) + self.misses
+        hit = sum(self.hits.values())
+        rate = hit / total * 100 if total else 0
+        detail = ', '.join(f"{k} {v}" for k, v in self.hits.items())
+        return f"Offline geocoder: {hit}/{total} resolved locally ({rate:.0f}%; {detail})"
+
+
+_default_geocoder = None
+
+
+def get_offline_geocoder():
+    """기본 소스로 만든 프로세스 공용 색인 (처음 호출 시 생성)"""
+    global _default_geocoder
+    if _default_geocoder is None:
+        _default_geocoder = OfflineGeocoder.build()
+    return _default_geocoder
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--check':
+        # 과거 데이터로만 색인을 만들고 최신 locations.csv 를 얼마나 로컬에서 해결하는지 확인
+        geocoder = OfflineGeocoder.build(DEFAULT_SOURCES[1:])
+        rows = read_rows(DEFAULT_SOURCES[0])
+        start = time.perf_counter()
+        for row in rows:
+            geocoder.lookup(row.get('address'), row.get('place_name'))
+        elapsed = time.perf_counter() - start
+        print(geocoder.summary())
+        print(f"{len(rows)}개 조회, 건당 {elapsed / max(len(rows), 1) * 1e6:.1f}µs")
+    else:
+        geocoder = get_offline_geocoder()
+        for address in sys.argv[1:]:
+            print(f"{address} -> {geocoder.lookup(address)}")
@@ -0,0 +1,279 @@
+"""
+장소 고유 ID (place_id)
+no 열은 행 번호라 재색인 (reindex_*.py, filter_restaurants.py) 때마다 바뀌므로,
+같은 실제 장소의 행들을 묶어 내용에서 만든 고정 ID 를 붙이고 등록부에 저장하여 다시 실행해도 ID 가 바뀌지 않게 함
+
+행을 같은 장소로 묶는 연결 (union-find):
+  - 같은 정규화 주소 (번지까지 있는 주소만) + 상호명 일치 / 포함 (SAME_PLACE_NAME_SIMILARITY 이상)
+  - 좌표 COORD_RADIUS m 안 + 상호명 일치 / 포함 (주소 표기가 달라도)
+  - 같은 전화번호 + 같은 시/군/구 + 상호명 유사 (대표번호 15xx / 16xx / 18xx 제외)
+  - 지점명이 다른 행 (7호점 / 8호점, 강남점 / 역삼점) 은 어느 연결로도 한 장소가 되지 않음
+    (같은 건물의 일호선 1층 / 팔호선 2층 처럼 비슷한 이름의 다른 가게가 합쳐지지 않도록)
+
+ID 배정 (doc/data/place_registry.csv):
+  - 등록부에는 행 내용 키 (정규화 상호명 + 주소) 와 전화번호 키 -> place_id 를 저장
+  - 묶음의 행 중 하나라도 등록된 키가 있으면 그 ID 를 그대로 사용
+  - 처음 보는 묶음은 대표 내용 키의 해시로 새 ID (P + 10자리) 를 만듦
+  - 예전에 다른 ID 였던 두 묶음이 합쳐지면 먼저 등록된 ID 를 남기고 나머지는 alias 로 기록
+
+사용법:
+  python place_ids.py              # locations.csv 에 place_id 열 추가 / 갱신 + 등록부 저장
+  python place_ids.py --dry-run    # 저장하지 않고 결과만 출력
+"""
+import csv
+import hashlib
+import os
+import re
+import sys
+import time
+from collections import defaultdict
+
+from addresses import is_partial_address, normalize_address, normalize_name, region_tokens
+from entity_resolution import UnionFind, branch_name
+from match_scoring import name_similarity
+from spatial_index import pairs_within
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LOCATIONS_FILE = os.path.join(ROOT_DIR, 'assets', 'data', 'locations.csv')
+REGISTRY_FILE = os.path.join(ROOT_DIR, 'doc', 'data', 'place_registry.csv')
+
+COORD_RADIUS = 10  # m
+# 같은 주소 / 좌표의 행을 같은 장소로 볼 상호명 유사도 (정규화 후 일치 또는 한쪽이 다른 쪽을 포함)
+SAME_PLACE_NAME_SIMILARITY = 0.85
+# 같은 전화번호의 행을 같은 장소로 볼 상호명 유사도
+MIN_NAME_SIMILARITY = 0.5
+# 여러 지점이 함께 쓰는 대표번호
+SHARED_PHONE_PREFIXES = ('15', '16', '18')
+ID_PREFIX = 'P'
+ID_LENGTH = 10
+
+
+def content_key(row):
+    """행 내용 키 (정규화 상호명 + 정규화 주소), 상호명이 없으면 None"""
+    name = normalize_name(row.get('place_name'))
+    if not name:
+        return None
+    return f"row:{name}|{normalize_address(row.get('address'))}"
+
+
+def phone_key(row):
+    """장소를 구분할 수 있는 전화번호 키 (숫자만), 없거나 대표번호면 None"""
+    digits = re.sub(r'\D', '', str(row.get('phone') or ''))
+    if len(digits) < 9 or digits.startswith(SHARED_PHONE_PREFIXES):
+        return None
+    return f"tel:{digits}"
+
+
+def link_rows(rows, coord_radius=COORD_RADIUS):
+    """같은 장소로 보이는 행을 묶은 UnionFind 와 연결 종류별 개수"""
+    groups = UnionFind(len(rows), [branch_name(row.get('place_name')) for row in rows])
+    counts = defaultdict(int)
+
+    def similar(i, j, threshold=SAME_PLACE_NAME_SIMILARITY):
+        return name_similarity(rows[i].get('place_name'), rows[j].get('place_name')) >= threshold
+
+    # 1. 같은 정규화 주소 (같은 건물의 다른 가게는 상호명으로 구분)
+    by_address = defaultdict(list)
+    for i, row in enumerate(rows):
+        address = normalize_address(row.get('address'))
+        if address and not is_partial_address(address):
+            by_address[address].append(i)
+    for members in by_address.values():
+        representatives = []
+        for i in members:
+            match = next((r for r in representatives if similar(r, i)), None)
+            if match is None:
+                representatives.append(i)
+            elif groups.union(match, i) is not None:
+                counts['address'] += 1
+
+    # 2. 거의 같은 좌표
+    lats = [row.get('latitude') for row in rows]
+    lngs = [row.get('longitude') for row in rows]
+    for i, j, _ in pairs_within(lats, lngs, coord_radius):
+        if similar(i, j) and groups.union(i, j) is not None:
+            counts['coords'] += 1
+
+    # 3. 같은 전화번호 (다른 지역의 같은 번호는 잘못 입력된 번호, 상호명이 다르면 같은 건물의 다른 가게로 보고 무시)
+    by_phone = defaultdict(list)
+    for i, row in enumerate(rows):
+        key = phone_key(row)
+        if key:
+            by_phone[key].append(i)
+    for members in by_phone.values():
+        representatives = []
+        for i in members:
+            region = region_tokens(rows[i].get('address'))
+            match = next((r for r in representatives
+                          if region_tokens(rows[r].get('address')) == region and similar(r, i, MIN_NAME_SIMILARITY)),
+                         None)
+            if match is None:
+                representatives.append(i)
+            elif groups.union(match, i) is not None:
+                counts['phone'] += 1
+
+    return groups, counts
+
+
+class PlaceRegistry:
+    """키 (행 내용 / 전화번호 / alias) -> place_id 등록부 (CSV)"""
+
+    FIELDS = ['key', 'place_id', 'registered']
+
+    def __init__(self, path=None):
+        self.path = path or REGISTRY_FILE
+        self.ids = {}
+        self.registered = {}
+        self.changed = []
+        if os.path.exists(self.path):
+            with open(self.path, 'r', encoding='utf-8-sig') as f:
+                for row in csv.DictReader(f):
+                    self.ids[row['key']] = row['place_id']
+                    self.registered[row['key']] = row['registered']
+
+    def resolve(self, place_id):
+        """합쳐진 ID 는 남은 ID 로"""
+        seen = set()
+        while f"alias:{place_id}" in self.ids and place_id not in seen:
+            seen.add(place_id)
+            place_id = self.ids[f"alias:{place_id}"]
+        return place_id
+
+    def lookup(self, key):
+        place_id = self.ids.get(key)
+        return self.resolve(place_id) if place_id else None
+
+    def first_registered(self, place_id):
+        """ID 가 처음 등록된 날짜 (합쳐질 때 먼저 등록된 ID 를 남기는 기준)"""
+        dates = [self.registered[k] for k, v in self.ids.items() if v == place_id and not k.startswith('alias:')]
+        return min(dates) if dates else '9999-99-99'
+
+    def known_ids(self):
+        return {v for k, v in self.ids.items() if not k.startswith('alias:')}
+
+    def set(self, key, place_id, day):
+        if self.ids.get(key) != place_id:
+            self.ids[key] = place_id
+            self.registered[key] = self.registered.get(key) or day
+            self.changed.append(key)
+
+    def save(self):
+        with open(self.path, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(self.FIELDS)
+            for key in sorted(self.ids):
+                writer.writerow([key, self.ids[key], self.registered[key]])
+        self.changed = []
+
+    def flush(self):
+        """바뀐 키만 파일 끝에 추가 (읽을 때 뒤의 줄이 우선, save() 가 다시 정렬 / 정리)"""
+        if not os.path.exists(self.path):
+            self.save()
+            return
+        with open(self.path, 'a', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            for key in dict.fromkeys(self.changed):
+                writer.writerow([key, self.ids[key], self.registered[key]])
+        self.changed = []
+
+
+def new_id(seed, taken):
+    """내용 키에서 만든 새 ID (이미 쓰인 ID 와 겹치면 길이를 늘림)"""
+    digest = hashlib.sha1(seed.encode('utf-8')).hexdigest()
+    length = ID_LENGTH
+    while f"{ID_PREFIX}{digest[:length]}" in taken:
+        length += 1
+    return f"{ID_PREFIX}{digest[:length]}"
+
+
+def assign_place_ids(rows, registry=None, coord_radius=COORD_RADIUS):
+    """행마다 place_id 목록과 통계 (registry 는 새 키 / ID 로 갱신됨, 저장은 호출하는 쪽에서)"""
+    registry = registry or PlaceRegistry()
+    day = time.strftime('%Y-%m-%d')
+    groups, counts = link_rows(rows, coord_radius)
+
+    clusters = defaultdict(list)
+    for i in range(len(rows)):
+        clusters[groups.find(i)].append(i)
+
+    keys = [[k for k in (content_key(row), phone_key(row)) if k] for row in rows]
+    taken = registry.known_ids()
+    assigned = {}  # 이번 실행에서 묶음에 배정된 ID -> 묶음 대표
+    place_ids = [None] * len(rows)
+    stats = defaultdict(int)
+
+    # 행 순서대로 처리하여 묶음이 나뉜 경우에도 매번 같은 묶음이 기존 ID 를 가져감
+    for root, members in sorted(clusters.items(), key=lambda item: item[1][0]):
+        found = []
+        for i in members:
+            for key in keys[i]:
+                place_id = registry.lookup(key)
+                if place_id and place_id not in found and place_id not in assigned:
+                    found.append(place_id)
+
+        if found:
+            found.sort(key=lambda pid: (registry.first_registered(pid), pid))
+            place_id = found[0]
+            for merged in found[1:]:
+                registry.set(f"alias:{merged}", place_id, day)
+                stats['merged'] += 1
+            stats['existing'] += 1
+        else:
+            seeds = sorted(key for i in members for key in keys[i] if key.startswith('row:'))
+            place_id = new_id(seeds[0] if seeds else f"row-{members[0]}", taken | set(assigned))
+            stats['new'] += 1
+
+        assigned[place_id] = root
+        for i in members:
+            place_ids[i] = place_id
+            for key in keys[i]:
+                # 이번 실행에서 다른 묶음이 이미 가져간 키 (같은 번호 / 같은 내용의 다른 장소) 는 그쪽을 유지
+                current = registry.lookup(key)
+                if current not in (None, place_id) and assigned.get(current) not in (None, root):
+                    continue
+                registry.set(key, place_id, day)
+
+    stats.update(counts)
+    stats['rows'] = len(rows)
+    stats['places'] = len(clusters)
+    return place_ids, dict(stats)
+
+
+def main(argv):
+    dry_run = '--dry-run' in argv
+    started = time.perf_counter()
+
+    with open(LOCATIONS_FILE, 'r', encoding='utf-8-sig') as f:
+        reader = csv.DictReader(f)
+        fieldnames = list(reader.fieldnames)
+        rows = list(reader)
+
+    registry = PlaceRegistry()
+    before = {i: row.get('place_id') for i, row in enumerate(rows)}
+    place_ids, stats = assign_place_ids(rows, registry)
+    changed = sum(1 for i, place_id in enumerate(place_ids) if before[i] and before[i] != place_id)
+
+    print(f"[Place ID] {stats['rows']}행 -> 장소 {stats['places']}개 "
+          f"(기존 ID {stats.get('existing', 0)}, 새 ID {stats.get('new', 0)}, 합쳐진 ID {stats.get('merged', 0)})")
+    print(f"  연결: 주소 {stats.get('address', 0)}, 좌표 {stats.get('coords', 0)}, 전화번호 {stats.get('phone', 0)}"
+          f" / 기존 place_id 와 달라진 행 {changed}개, {time.perf_counter() - started:.2f}초")
+
+    if dry_run:
+        return
+
+    # 앱은 열 위치로 읽으므로 새 열은 맨 뒤에 추가
+    if 'place_id' not in fieldnames:
+        fieldnames.append('place_id')
+    for row, place_id in zip(rows, place_ids):
+        row['place_id'] = place_id
+
+    with open(LOCATIONS_FILE, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(rows)
+    registry.save()
+    print(f"  저장: {LOCATIONS_FILE}, {REGISTRY_FILE}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,69 @@
+"""
+검색어 변형 동시 조회 (우선순위가 가장 높은 성공 결과 채택)
+'이름 지역', '이름 지역 빵집', ... 처럼 여러 검색어를 순서대로 하나씩 시도하는 대신
+한꺼번에 요청하고 (요청 속도는 naver_client 의 공용 토큰 버킷이 조절)
+우선순위 순서대로 결과를 확인하여 성공한 첫 결과를 반환, 아직 시작하지 않은 나머지 요청은 취소
+
+행당 최악 지연 시간: 모든 시도의 합 -> 대략 한 번의 왕복 시간
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from quota import QuotaExhausted
+
+# 모든 호출이 공유하는 작업 풀 (바깥에서 여러 행을 동시에 처리해도 동시 요청 수는 이 크기로 제한)
+DEFAULT_WORKERS = 16
+_executor = None
+
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=DEFAULT_WORKERS, thread_name_prefix='cascade')
+    return _executor
+
+
+def first_success(queries, search, accept=bool, executor=None):
+    """queries 를 동시에 search(query) 로 조회하여 accept(결과) 가 참인 가장 앞 순위의
+    (순위, 검색어, 결과) 반환, 모두 실패하면 None
+
+    search 에서 발생한 예외는 해당 검색어의 실패로 처리 (QuotaExhausted 는 그대로 발생, 호출하는 쪽이 저장 후 종료)
+    """
+    executor = executor or get_executor()
+    futures = [executor.submit(search, query) for query in queries]
+
+    try:
+        # 앞 순위부터 기다리므로 뒤 순위가 먼저 성공해도 앞 순위 결과가 나올 때까지 확정하지 않음
+        for rank, future in enumerate(futures):
+            try:
+                result = future.result()
+            except QuotaExhausted:
+                raise
+            except Exception:
+                continue
+            if accept(result):
+                return rank, queries[rank], result
+        return None
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+async def first_success_async(queries, search, accept=bool):
+    """first_success 의 asyncio 버전 (search 는 코루틴 함수), 채택 후 남은 작업은 취소"""
+    tasks = [asyncio.ensure_future(search(query)) for query in queries]
+
+    try:
+        for rank, task in enumerate(tasks):
+            try:
+                result = await task
+            except (asyncio.CancelledError, QuotaExhausted):
+                raise
+            except Exception:
+                continue
+            if accept(result):
+                return rank, queries[rank], result
+        return None
+    finally:
+        for task in tasks:
+            task.cancel()
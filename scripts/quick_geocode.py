@@ -1,47 +1,32 @@
-import requests
 import os
 from dotenv import load_dotenv
 
+from geocode_batch import geocode_one
+from naver_client import NaverAPIError, QuotaExhausted
+
 load_dotenv()
 
 NAVER_MAP_CLIENT_ID = os.getenv('NAVER_MAP_CLIENT_ID') or os.getenv('NAVER_SEARCH_CLIENT_ID')
 NAVER_MAP_CLIENT_SECRET = os.getenv('NAVER_MAP_CLIENT_SECRET') or os.getenv('NAVER_SEARCH_CLIENT_SECRET')
 
-def geocode_address(address):
-    """Naver Maps Geocoding API를 사용하여 주소를 위도/경도로 변환"""
-    url = "https://maps.apigw.ntruss.com/map-geocode/v2/geocode"
-    
-    headers = {
-        "x-ncp-apigw-api-key-id": NAVER_MAP_CLIENT_ID,
-        "x-ncp-apigw-api-key": NAVER_MAP_CLIENT_SECRET,
-        "Accept": "application/json"
-    }
-    
-    params = {
-        "query": address
-    }
-    
+def geocode_address(address, place_name=None):
+    """주소를 위도/경도로 변환 (오프라인 색인 우선, 없으면 Naver Maps Geocoding API)"""
     try:
-        response = requests.get(url, headers=headers, params=params)
-        
-        if response.status_code != 200:
-            print(f"  [X] API 오류 ({response.status_code})")
-            return None, None
-        
-        data = response.json()
-        
-        if data.get('status') == 'OK' and data.get('addresses'):
-            result = data['addresses'][0]
-            lat = result.get('y', '')
-            lng = result.get('x', '')
-            return lat, lng
+        coords = geocode_one(address, place_name)
+    except QuotaExhausted:
+        raise
+    except NaverAPIError as e:
+        if e.status:
+            print(f"  [X] API 오류 ({e.status})")
         else:
-            print(f"  [!] Geocoding 실패")
-            return None, None
-            
-    except Exception as e:
-        print(f"  [X] 예외 발생: {str(e)}")
+            print(f"  [X] 예외 발생: {str(e)}")
         return None, None
+    
+    if coords:
+        return coords
+    
+    print(f"  [!] Geocoding 실패")
+    return None, None
 
 # 3개 주소 geocoding
 addresses = {
@@ -57,7 +42,11 @@ print("=" * 60)
 for name, address in addresses.items():
     print(f"\n[{name}]")
     print(f"  주소: {address}")
-    lat, lng = geocode_address(address)
+    try:
+        lat, lng = geocode_address(address, name)
+    except QuotaExhausted as e:
+        print(f"  [STOP] {e} - 남은 주소는 다음 실행에서 조회")
+        break
     if lat and lng:
         print(f"  ✅ 좌표: ({lat}, {lng})")
     else:
@@ -0,0 +1,232 @@
+"""
+API 키별 일일 호출 한도 장부 (SQLite) + 여러 키 분배
+프로세스를 다시 시작해도 오늘 쓴 호출 수가 유지되고, 설정된 여러 키 중 남은 한도가 가장 많은 키부터 사용
+모든 키의 오늘 한도를 다 쓰면 QuotaExhausted 를 발생시키고 (호출하는 쪽은 진행 상황을 저장하고 종료),
+다음 날 (한국 시간 자정에 초기화) 다시 실행하면 응답 캐시 / 처리 기록 덕분에 남은 작업부터 이어서 진행
+
+한도 묶음 (group):
+  search - 네이버 검색 API (지역 / 웹 검색 합산, 애플리케이션당 일 25,000회)
+  map    - NCP Geocoding
+  tour   - 한국관광공사 TourAPI (키당 일 1,000회)
+기본값은 DAILY_QUOTAS, 환경 변수 QUOTA_<GROUP> 로 변경 (예: QUOTA_SEARCH=20000)
+
+키 설정 (.env): 기본 이름 뒤에 _1, _2, ... 를 붙여 여러 개 (예: TOUR_API_KEY, TOUR_API_KEY_2)
+장부에는 키 원문 대신 해시만 저장
+
+사용법:
+  python quota.py                  # 오늘 키별 사용량
+  python quota.py search 15000     # 남은 15,000건 처리에 며칠 걸리는지
+"""
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+LEDGER_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.quota_ledger.sqlite3')
+
+# 한도 묶음 -> 키당 일일 호출 수
+DAILY_QUOTAS = {
+    'search': 25000,
+    'map': 100000,  # 월 300만 건 무료 기준
+    'tour': 1000,
+}
+
+# 한도 묶음 -> 키 환경 변수 이름 (map 키가 없으면 search 키 사용)
+KEY_ENV = {
+    'search': ('NAVER_SEARCH_CLIENT_ID', 'NAVER_SEARCH_CLIENT_SECRET'),
+    'map': ('NAVER_MAP_CLIENT_ID', 'NAVER_MAP_CLIENT_SECRET'),
+    'tour': ('TOUR_API_KEY',),
+}
+
+# 한도 초기화 기준 시간대 (KST)
+RESET_UTC_OFFSET = 9 * 3600
+MAX_NUMBERED_KEYS = 20
+
+
+class QuotaExhausted(Exception):
+    """모든 키의 오늘 한도 소진"""
+
+    def __init__(self, group):
+        super().__init__(f"{group} API 오늘 한도 소진 (모든 키)")
+        self.group = group
+
+
+def today():
+    """한도 기준 날짜 (KST)"""
+    return time.strftime('%Y-%m-%d', time.gmtime(time.time() + RESET_UTC_OFFSET))
+
+
+def seconds_until_reset():
+    now = time.time() + RESET_UTC_OFFSET
+    return 86400 - now % 86400
+
+
+def daily_quota(group):
+    value = os.getenv(f"QUOTA_{group.upper()}")
+    return int(value) if value else DAILY_QUOTAS.get(group, 1000)
+
+
+def key_id(key):
+    """장부에 저장할 키 식별자 (원문 대신 해시 앞부분)"""
+    return hashlib.sha1(str(key).encode('utf-8')).hexdigest()[:12]
+
+
+def env_keys(*names):
+    """환경 변수 이름들 (예: ID, SECRET) 의 기본값과 _1 ~ _20 번호 붙은 값 중 모두 설정된 조합 목록
+
+    env_keys('TOUR_API_KEY') -> ['key', 'key2', ...]
+    env_keys('NAVER_SEARCH_CLIENT_ID', 'NAVER_SEARCH_CLIENT_SECRET') -> [(id, secret), ...]
+    """
+    keys = []
+    for suffix in [''] + [f"_{i}" for i in range(1, MAX_NUMBERED_KEYS + 1)]:
+        values = tuple(os.getenv(name + suffix) for name in names)
+        if all(values):
+            key = values if len(names) > 1 else values[0]
+            if key not in keys:
+                keys.append(key)
+    return keys
+
+
+class QuotaLedger:
+    """(한도 묶음, 키, 날짜) -> 사용 횟수 장부 (스레드 / 프로세스 간 공유 가능)"""
+
+    def __init__(self, path=None):
+        self.path = path or LEDGER_FILE
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS usage ("
+            " grp TEXT, key_id TEXT, day TEXT, used INTEGER, exhausted INTEGER DEFAULT 0,"
+            " PRIMARY KEY (grp, key_id, day))"
+        )
+        self._conn.commit()
+
+    def used(self, group, key, day=None):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT used, exhausted FROM usage WHERE grp = ? AND key_id = ? AND day = ?",
+                (group, key_id(key), day or today()),
+            ).fetchone()
+        return (row[0], bool(row[1])) if row else (0, False)
+
+    def try_consume(self, group, key, limit, n=1):
+        """한도 안이면 n 회 사용으로 기록하고 True, 넘으면 False (원자적)"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO usage (grp, key_id, day, used) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT (grp, key_id, day) DO UPDATE SET used = used + excluded.used"
+                " WHERE exhausted = 0 AND used + excluded.used <= ?",
+                (group, key_id(key), today(), n, limit),
+            )
+            self._conn.commit()
+            return cursor.rowcount > 0
+
+    def mark_exhausted(self, group, key):
+        """서버가 한도 초과를 알려 온 키는 오늘 더 사용하지 않음"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO usage (grp, key_id, day, used, exhausted) VALUES (?, ?, ?, 0, 1)"
+                " ON CONFLICT (grp, key_id, day) DO UPDATE SET exhausted = 1",
+                (group, key_id(key), today()),
+            )
+            self._conn.commit()
+
+    def report(self, day=None):
+        """[(한도 묶음, 키 식별자, 사용 횟수, 소진 여부)]"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT grp, key_id, used, exhausted FROM usage WHERE day = ? ORDER BY grp, key_id",
+                (day or today(),),
+            ).fetchall()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class KeyScheduler:
+    """한 한도 묶음의 여러 키 중 오늘 남은 한도가 가장 많은 키를 골라 호출 1회를 기록"""
+
+    def __init__(self, group, keys, limit=None, ledger=None):
+        self.group = group
+        self.keys = list(keys)
+        self.limit = limit or daily_quota(group)
+        self.ledger = ledger or get_ledger()
+
+    def remaining(self, key):
+        used, exhausted = self.ledger.used(self.group, key)
+        return 0 if exhausted else max(0, self.limit - used)
+
+    def remaining_total(self):
+        return sum(self.remaining(key) for key in self.keys)
+
+    def acquire(self):
+        """이번 호출에 쓸 키 반환, 모든 키가 소진됐으면 QuotaExhausted"""
+        for key in sorted(self.keys, key=self.remaining, reverse=True):
+            if self.ledger.try_consume(self.group, key, self.limit):
+                return key
+        raise QuotaExhausted(self.group)
+
+    def exhaust(self, key):
+        self.ledger.mark_exhausted(self.group, key)
+
+    def days_needed(self, calls):
+        """calls 건을 처리하는 데 걸리는 날 수 (오늘 포함)"""
+        left_today = self.remaining_total()
+        if calls <= left_today:
+            return 1
+        per_day = self.limit * max(len(self.keys), 1)
+        return 1 + -(-(calls - left_today) // per_day)
+
+    def summary(self):
+        return (f"{self.group} quota: {self.remaining_total()}/{self.limit * len(self.keys)} left today "
+                f"across {len(self.keys)} key(s), resets in {seconds_until_reset() / 3600:.1f}h")
+
+
+def wait_for_reset(verbose=True):
+    """다음 한도 초기화 (KST 자정) 까지 대기 (여러 날에 걸친 대량 작업을 자동으로 이어갈 때)"""
+    delay = seconds_until_reset() + 60
+    if verbose:
+        print(f"[Quota] 한도 초기화까지 {delay / 3600:.1f}시간 대기...")
+    time.sleep(delay)
+
+
+_default_ledger = None
+_default_lock = threading.Lock()
+
+
+def get_ledger():
+    """모든 스크립트가 공유하는 기본 장부"""
+    global _default_ledger
+    with _default_lock:
+        if _default_ledger is None:
+            _default_ledger = QuotaLedger()
+        return _default_ledger
+
+
+def configured_keys(group):
+    """.env 에 설정된 한도 묶음의 키 목록"""
+    keys = env_keys(*KEY_ENV[group])
+    if not keys and group == 'map':
+        keys = env_keys(*KEY_ENV['search'])
+    return keys
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 2:
+        group, calls = sys.argv[1], int(sys.argv[2])
+        scheduler = KeyScheduler(group, configured_keys(group))
+        print(scheduler.summary())
+        print(f"{calls}건 처리에 {scheduler.days_needed(calls)}일 소요 (오늘 포함)")
+    else:
+        print(f"[Quota] {today()} (초기화까지 {seconds_until_reset() / 3600:.1f}시간)")
+        for group, kid, used, exhausted in get_ledger().report():
+            status = ' (소진)' if exhausted else ''
+            print(f"  {group} {kid}: {used}/{daily_quota(group)}{status}")
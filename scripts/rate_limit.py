@@ -0,0 +1,108 @@
+"""
+API / 키별 토큰 버킷 요청 속도 제한
+호출마다 고정 sleep 을 넣는 대신 여러 스레드 / 코루틴이 같은 버킷에서 토큰을 받아가므로
+전체 처리량이 허용 속도(초당 요청 수)에 맞춰지고 버스트는 burst 개까지만 허용
+
+설정: 기본값은 DEFAULT_LIMITS, 환경 변수 NAVER_RATE_<API> = "초당요청수[/버스트]" 로 변경
+  예) NAVER_RATE_GEOCODE=5/5
+"""
+import asyncio
+import os
+import threading
+import time
+
+# API 이름 -> (초당 요청 수, 버스트)
+DEFAULT_LIMITS = {
+    'local': (10, 10),
+    'web': (10, 10),
+    'geocode': (10, 10),
+}
+
+
+class TokenBucket:
+    """초당 rate 개씩 토큰이 차고 최대 burst 개까지 쌓이는 버킷 (스레드 안전)
+
+    reserve() 는 잠금 안에서 토큰을 미리 차감하고 기다릴 시간만 계산하므로
+    실제 대기는 잠금 밖에서 이루어지고 대기 순서대로 시간이 배정됨
+    """
+
+    def __init__(self, rate, burst=None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(burst or max(1, rate))
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.acquired = 0
+        self.waited = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, n=1):
+        """토큰 n 개를 예약하고 사용 가능해질 때까지 기다려야 할 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= n
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            self.acquired += n
+            self.waited += wait
+            return wait
+
+    def acquire(self, n=1):
+        """토큰을 받을 때까지 블로킹"""
+        wait = self.reserve(n)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, n=1):
+        """토큰을 받을 때까지 이벤트 루프를 막지 않고 대기"""
+        wait = self.reserve(n)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+def _env_limit(api):
+    value = os.getenv(f"NAVER_RATE_{api.upper()}")
+    if not value:
+        return None
+    rate, _, burst = value.partition('/')
+    return float(rate), float(burst) if burst else None
+
+
+_limits = {}
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+
+def configure(api, rate, burst=None, key=None):
+    """API 의 속도 제한 변경 (key 를 주면 해당 키에만 적용)"""
+    with _buckets_lock:
+        _limits[(api, key)] = (rate, burst)
+        for bucket_key in [k for k in _buckets if k[0] == api and (key is None or k[1] == key)]:
+            del _buckets[bucket_key]
+
+
+def get_bucket(api, key=None):
+    """(API, 키) 버킷 반환 (같은 키는 프로세스 전체에서 하나의 버킷을 공유)"""
+    with _buckets_lock:
+        bucket = _buckets.get((api, key))
+        if bucket is None:
+            rate, burst = (_limits.get((api, key)) or _limits.get((api, None))
+                           or _env_limit(api) or DEFAULT_LIMITS.get(api, (10, 10)))
+            bucket = _buckets[(api, key)] = TokenBucket(rate, burst)
+        return bucket
+
+
+def summary():
+    """버킷별 요청 수 / 누적 대기 시간"""
+    with _buckets_lock:
+        items = list(_buckets.items())
+    lines = []
+    for (api, key), bucket in items:
+        if bucket.acquired:
+            label = f"{api} ({key[:6]}...)" if key else api
+            lines.append(f"{label}: {bucket.acquired} requests @ {bucket.rate:g}/s, waited {bucket.waited:.1f}s")
+    return lines
@@ -3,10 +3,13 @@
 """
 import os
 import csv
-import time
-import requests
 from dotenv import load_dotenv
 
+from coords import item_to_wgs84
+from match_scoring import LOW_CONFIDENCE, best_match, describe, rank_candidates
+from naver_client import NaverAPIError, QuotaExhausted, get_client
+from query_cascade import first_success
+
 load_dotenv()
 
 NAVER_CLIENT_ID = os.getenv('NAVER_SEARCH_CLIENT_ID')
@@ -14,29 +17,17 @@ NAVER_CLIENT_SECRET = os.getenv('NAVER_SEARCH_CLIENT_SECRET')
 
 def search_naver_local(query):
     """네이버 지역 검색 API"""
-    url = "https://openapi.naver.com/v1/search/local.json"
-    headers = {
-        "X-Naver-Client-Id": NAVER_CLIENT_ID,
-        "X-Naver-Client-Secret": NAVER_CLIENT_SECRET
-    }
-    params = {
-        "query": query,
-        "display": 5,
-        "start": 1,
-        "sort": "random"
-    }
-    
     try:
-        response = requests.get(url, headers=headers, params=params)
-        if response.status_code == 200:
-            return response.json()
-        return None
-    except Exception as e:
-        print(f"  [!] 요청 실패: {e}")
+        return {'items': get_client().search_local(query, display=5, start=1, sort="random")}
+    except QuotaExhausted:
+        raise
+    except NaverAPIError as e:
+        if e.status is None:
+            print(f"  [!] 요청 실패: {e}")
         return None
 
 def search_with_variations(name, region):
-    """다양한 검색어로 시도"""
+    """다양한 검색어로 동시에 시도하여 우선순위가 가장 높은 성공 결과 사용"""
     search_queries = [
         f"{name} {region}",
         f"{name} {region} 빵집",
@@ -45,13 +36,19 @@ def search_with_variations(name, region):
         name
     ]
     
-    for query in search_queries:
-        print(f"  시도: {query}")
-        result = search_naver_local(query)
-        time.sleep(0.1)
-        
-        if result and result.get('items'):
-            return result['items'][0]
+    print(f"  시도: {' | '.join(search_queries)}")
+    # 결과가 있어도 상호명 / 지역이 맞는 후보가 없으면 다음 검색어 결과 사용
+    def accept(result):
+        ranked = rank_candidates(result and result.get('items'), name, region, 'bakery')
+        return ranked and ranked[0].score >= LOW_CONFIDENCE
+    
+    hit = first_success(search_queries, search_naver_local, accept=accept)
+    
+    if hit:
+        _, query, result = hit
+        match = best_match(result['items'], name, region, 'bakery')
+        print(f"  검색 성공: {query} -> {describe(match)}")
+        return match.item
     
     return None
 
@@ -66,6 +63,7 @@ def process_missing_items():
     
     rows = []
     updated_count = 0
+    quota_error = None
     
     with open(input_file, 'r', encoding='utf-8') as f:
         reader = csv.reader(f)
@@ -82,14 +80,20 @@ def process_missing_items():
             lat = row[10] if len(row) > 10 else ""
             lon = row[11] if len(row) > 11 else ""
             
-            # 좌표가 없는 항목만 재검색
-            if not lat.strip() or not lon.strip():
+            # 좌표가 없는 항목만 재검색 (일일 한도를 다 쓴 뒤의 행은 그대로 저장하고 다음 실행에서 처리)
+            if quota_error is None and (not lat.strip() or not lon.strip()):
                 print(f"\n[{idx}] {name} - 재검색")
                 
                 # 지역 정보 추출
                 region = address.split()[0] if address != "정보없음" else ""
                 
-                item = search_with_variations(name, region)
+                try:
+                    item = search_with_variations(name, region)
+                except QuotaExhausted as e:
+                    quota_error = e
+                    print(f"  [STOP] {e} - 남은 항목은 다음 실행에서 재검색")
+                    rows.append(row)
+                    continue
                 
                 if item:
                     # 주소 업데이트
@@ -99,32 +103,27 @@ def process_missing_items():
                         print(f"  ✓ 주소: {new_address}")
                     
                     # 좌표 추출
-                    mapx = item.get('mapx', '')
-                    mapy = item.get('mapy', '')
+                    latitude, longitude = item_to_wgs84(item)
                     
-                    if mapx and mapy:
-                        try:
-                            longitude = float(mapx) / 10000000
-                            latitude = float(mapy) / 10000000
-                            
-                            while len(row) <= 11:
+                    if latitude is not None:
+                        while len(row) <= 11:
+                            row.append('')
+                        row[10] = str(latitude)
+                        row[11] = str(longitude)
+                        print(f"  ✓ 좌표: ({latitude}, {longitude})")
+                        
+                        # 전화번호
+                        phone = item.get('telephone', '')
+                        if phone:
+                            while len(row) <= 12:
                                 row.append('')
-                            row[10] = str(latitude)
-                            row[11] = str(longitude)
-                            print(f"  ✓ 좌표: ({latitude}, {longitude})")
-                            
-                            # 전화번호
-                            phone = item.get('telephone', '')
-                            if phone:
-                                while len(row) <= 12:
-                                    row.append('')
-                                if not row[12] or row[12] == "정보없음":
-                                    row[12] = phone
-                                    print(f"  ✓ 전화: {phone}")
-                            
-                            updated_count += 1
-                        except (ValueError, TypeError) as e:
-                            print(f"  [!] 좌표 변환 실패: {e}")
+                            if not row[12] or row[12] == "정보없음":
+                                row[12] = phone
+                                print(f"  ✓ 전화: {phone}")
+                        
+                        updated_count += 1
+                    elif item.get('mapx') or item.get('mapy'):
+                        print(f"  [!] 좌표 변환 실패: {item.get('mapx')}, {item.get('mapy')}")
                 else:
                     print(f"  [X] 검색 실패 - 수동 입력 필요")
             
@@ -137,6 +136,8 @@ def process_missing_items():
     
     print(f"\n{'='*60}")
     print(f"✓ 추가 업데이트: {updated_count}개")
+    if quota_error:
+        print(f"[!] {quota_error} - 중간에 멈춤, 다시 실행하면 남은 항목을 재검색")
     print(f"✓ 저장: {output_file}")
     print(f"{'='*60}\n")
     
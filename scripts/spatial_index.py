@@ -0,0 +1,192 @@
+"""
+좌표 기준 근접 행 찾기 (공간 색인)
+주소 표기가 달라도 (도로명 / 지번, 서울 / 서울특별시) 좌표가 몇 미터 안인 행 쌍을 한 번에 찾음
+
+  - 위경도를 평면 미터 좌표로 투영 (대한민국 범위에서는 평균 위도 기준 등장방형 투영으로 충분)
+  - scipy 가 있으면 KD-tree (cKDTree.query_pairs), 없으면 반경 크기 격자를 numpy 로 정렬 / 이분 탐색하여
+    자기 칸 + 주변 칸의 후보 쌍을 한꺼번에 만들고 실제 거리 (하버사인) 로 걸러냄
+  - numpy 도 없으면 같은 격자를 dict 로 한 건씩 처리
+
+행마다 전체를 훑지 않으므로 15k 행 전체가 1초 안에 끝남
+
+사용법:
+  python spatial_index.py [파일.csv] [반경 m]    # 근접 + 상호명 유사 행 쌍 출력
+"""
+import math
+import os
+import sys
+import time
+from collections import defaultdict
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from scipy.spatial import cKDTree
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+from coords import to_float
+
+EARTH_RADIUS = 6371000.0
+DEFAULT_RADIUS = 30  # m
+
+# 격자 탐색: 자기 칸 + 오른쪽 / 위쪽 방향 이웃 (반대 방향은 상대 칸에서 찾으므로 쌍이 한 번만 나옴)
+FORWARD_NEIGHBORS = ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1))
+
+
+def project(lats, lngs):
+    """위경도 열 -> 평면 (x, y) 미터 배열 (평균 위도 기준 등장방형 투영)"""
+    lat0 = math.radians(float(np.nanmean(lats))) if len(lats) else 0.0
+    x = np.radians(lngs) * EARTH_RADIUS * math.cos(lat0)
+    y = np.radians(lats) * EARTH_RADIUS
+    return x, y
+
+
+def haversine(lat1, lng1, lat2, lng2):
+    """두 점 (배열 가능) 사이 거리 m"""
+    lat1, lng1, lat2, lng2 = (np.radians(v) for v in (lat1, lng1, lat2, lng2))
+    h = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(h))
+
+
+def _haversine_scalar(lat1, lng1, lat2, lng2):
+    lat1, lng1, lat2, lng2 = map(math.radians, (lat1, lng1, lat2, lng2))
+    h = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS * math.asin(math.sqrt(h))
+
+
+def _grid_candidates(x, y, cell):
+    """반경 크기 격자에서 같은 칸 / 이웃 칸 후보 쌍 (i 배열, j 배열)"""
+    ix = np.floor((x - x.min()) / cell).astype(np.int64)
+    iy = np.floor((y - y.min()) / cell).astype(np.int64)
+    width = int(iy.max()) + 3  # 이웃 칸 (iy ± 1) 이 다른 열과 겹치지 않도록
+    keys = ix * width + (iy + 1)
+
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    positions = np.arange(len(keys))
+    rank = np.empty_like(order)
+    rank[order] = positions
+
+    lefts, rights = [], []
+    for dx, dy in FORWARD_NEIGHBORS:
+        target = keys + dx * width + dy
+        start = np.searchsorted(sorted_keys, target, side='left')
+        end = np.searchsorted(sorted_keys, target, side='right')
+        if dx == 0 and dy == 0:
+            start = np.maximum(start, rank + 1)  # 같은 칸은 정렬 순서상 뒤에 있는 점만
+        counts = np.maximum(end - start, 0)
+        total = int(counts.sum())
+        if not total:
+            continue
+        # 점마다 [start, end) 범위를 펼쳐 (i, j) 쌍 만들기
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        lefts.append(np.repeat(positions, counts))
+        rights.append(order[np.repeat(start, counts) + offsets])
+
+    if not lefts:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    return np.concatenate(lefts), np.concatenate(rights)
+
+
+def _pairs_within_python(lats, lngs, radius):
+    """numpy 가 없을 때: dict 격자로 한 건씩"""
+    lat0 = math.radians(sum(lats) / len(lats)) if lats else 0.0
+    cell = radius
+    grid = defaultdict(list)
+    points = []
+    for i, (lat, lng) in enumerate(zip(lats, lngs)):
+        key = (int(math.floor(math.radians(lng) * EARTH_RADIUS * math.cos(lat0) / cell)),
+               int(math.floor(math.radians(lat) * EARTH_RADIUS / cell)))
+        grid[key].append(i)
+        points.append(key)
+
+    pairs = []
+    for i, (cx, cy) in enumerate(points):
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for j in grid.get((cx + dx, cy + dy), ()):
+                    if j <= i:
+                        continue
+                    meters = _haversine_scalar(lats[i], lngs[i], lats[j], lngs[j])
+                    if meters <= radius:
+                        pairs.append((i, j, meters))
+    return pairs
+
+
+def pairs_within(lats, lngs, radius=DEFAULT_RADIUS):
+    """좌표 열에서 서로 radius m 안에 있는 모든 (i, j, 거리) 쌍 목록 (i < j, 좌표가 없는 행은 제외)
+
+    i, j 는 입력 열의 위치
+    """
+    if not NUMPY_AVAILABLE:
+        valid = [k for k, (lat, lng) in enumerate(zip(lats, lngs))
+                 if math.isfinite(to_float(lat)) and math.isfinite(to_float(lng)) and to_float(lat) and to_float(lng)]
+        found = _pairs_within_python([to_float(lats[k]) for k in valid],
+                                     [to_float(lngs[k]) for k in valid], radius)
+        return [(valid[i], valid[j], meters) for i, j, meters in found]
+
+    lat_all = np.fromiter((to_float(v) for v in lats), dtype=float)
+    lng_all = np.fromiter((to_float(v) for v in lngs), dtype=float)
+    valid = np.flatnonzero(np.isfinite(lat_all) & np.isfinite(lng_all) & (lat_all != 0) & (lng_all != 0))
+    if len(valid) < 2:
+        return []
+    lat, lng = lat_all[valid], lng_all[valid]
+    x, y = project(lat, lng)
+
+    if SCIPY_AVAILABLE:
+        # 투영 오차를 감안해 조금 넓게 찾은 뒤 실제 거리로 다시 거름
+        found = cKDTree(np.column_stack([x, y])).query_pairs(radius * 1.05, output_type='ndarray')
+        i, j = found[:, 0], found[:, 1]
+    else:
+        i, j = _grid_candidates(x, y, radius * 1.05)
+
+    meters = haversine(lat[i], lng[i], lat[j], lng[j])
+    keep = meters <= radius
+    i, j, meters = valid[i[keep]], valid[j[keep]], meters[keep]
+    swap = i > j
+    i[swap], j[swap] = j[swap], i[swap]
+    order = np.lexsort((j, i))
+    return list(zip(i[order].tolist(), j[order].tolist(), meters[order].tolist()))
+
+
+def near_duplicates(rows, radius=DEFAULT_RADIUS, min_name_similarity=0.5):
+    """radius m 안에 있으면서 상호명이 비슷한 행 쌍 [(i, j, 거리, 상호명 유사도)] (유사도 높은 순)"""
+    from match_scoring import name_similarity
+
+    pairs = pairs_within([row.get('latitude') for row in rows], [row.get('longitude') for row in rows], radius)
+    similar = []
+    for i, j, meters in pairs:
+        similarity = name_similarity(rows[i].get('place_name'), rows[j].get('place_name'))
+        if similarity >= min_name_similarity:
+            similar.append((i, j, meters, similarity))
+    similar.sort(key=lambda p: (-p[3], p[2]))
+    return similar
+
+
+if __name__ == '__main__':
+    from addresses import normalize_address
+    from offline_geocoder import read_rows
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(root, 'assets', 'data', 'locations.csv')
+    radius = float(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_RADIUS
+
+    rows = read_rows(path)
+    start = time.perf_counter()
+    pairs = near_duplicates(rows, radius)
+    elapsed = time.perf_counter() - start
+    backend = 'KD-tree' if SCIPY_AVAILABLE else ('numpy grid' if NUMPY_AVAILABLE else 'python grid')
+    different = [p for p in pairs
+                 if normalize_address(rows[p[0]].get('address')) != normalize_address(rows[p[1]].get('address'))]
+    print(f"[Spatial] {len(rows)}행, 반경 {radius:g}m 안 상호명 유사 쌍 {len(pairs)}개 "
+          f"(주소 표기가 다른 쌍 {len(different)}개), {elapsed:.2f}초 ({backend})")
+    for i, j, meters, similarity in different[:20]:
+        print(f"  {meters:5.1f}m  {similarity:.2f}  {rows[i].get('place_name')} ({rows[i].get('address')})"
+              f"  <->  {rows[j].get('place_name')} ({rows[j].get('address')})")
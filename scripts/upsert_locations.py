@@ -0,0 +1,544 @@
+"""
+새 방송 데이터를 locations.csv 에 키 기준으로 병합 (upsert)
+키 = (place_id, title): 같은 장소가 같은 방송으로 이미 있으면 갱신, 없으면 추가
+
+  - 키 색인 (scripts/.locations_index.sqlite3): 키 -> 행 번호 (no) / 파일 내 바이트 위치,
+    place_id 판정용 주소 / 좌표 격자 / 전화번호 색인, 마지막 no
+  - 들어온 행의 place_id 는 place_ids.py 와 같은 기준 (등록부 내용 키, 같은 주소 + 상호명 일치 / 포함,
+    COORD_RADIUS m 안 + 상호명 일치 / 포함, 같은 전화번호 + 같은 시/군/구 + 상호명 유사, 지점명이 다르면 제외)
+    으로 색인에서 찾고, 없으면 새 ID
+  - 기존 행은 빈 값 / 정보없음이 아닌 들어온 값만 덮어쓰고, 달라진 것이 없으면 건드리지 않음 (재실행해도 그대로)
+    상호명 / 주소는 덮어쓰지 않음 (다른 가게 행을 바꾸지 않도록)
+  - 파일에 같은 키의 행이 여럿이면 어느 행인지 정할 수 없으므로 그 키로 들어온 행은 건너뛰고 보고함
+  - 거부하고 보고하는 행: 필드 수가 헤더와 다른 행 (열 밀림), 위도 / 경도가 숫자가 아니거나 한국 밖인 행,
+    좌표가 깨진 기존 행의 갱신, 다른 place_id 로 같은 작품 + 같은 시/군/구 + 비슷한 상호명 행이 이미 있는 새 행
+  - 새 행은 파일 끝에 추가, 바뀐 행은 길이가 같으면 그 자리에 덮어쓰고 다르면 그 행부터 뒤쪽만 다시 씀
+    (임시 사본에 쓰고 os.replace 로 바꿔 넣으므로 중간에 멈춰도 원본은 그대로)
+  - 다른 스크립트가 파일을 고쳐 크기 / 수정 시각이 색인과 다르면 한 번 전체를 읽어 색인을 다시 만듦
+
+그래서 평소 병합 시간은 전체 행 수가 아니라 들어온 행 수에 비례함
+
+사용법:
+  python upsert_locations.py <방송.csv> [--title 제목] [--require-coords] [--dry-run]
+  python upsert_locations.py --rebuild     # 색인만 다시 만들기
+"""
+import csv
+import io
+import math
+import os
+import shutil
+import sqlite3
+import sys
+import time
+from collections import defaultdict
+
+from addresses import is_partial_address, normalize_address, region_tokens
+from coords import to_float
+from data_profile import LAT_RANGE, LNG_RANGE, MISSING_VALUES
+from match_scoring import name_similarity
+from entity_resolution import branch_name
+from place_ids import (COORD_RADIUS, LOCATIONS_FILE, MIN_NAME_SIMILARITY, SAME_PLACE_NAME_SIMILARITY,
+                       PlaceRegistry, content_key, new_id, phone_key)
+from spatial_index import _haversine_scalar
+
+INDEX_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.locations_index.sqlite3')
+# 색인 구조가 바뀌면 올림 (다르면 표를 지우고 다시 만듦)
+SCHEMA_VERSION = 3
+
+# 좌표 격자 한 칸 (도) - 위도 / 경도 모두 COORD_RADIUS 보다 커야 주변 칸까지만 보면 됨
+CELL_DEGREES = 0.0002
+# 덮어쓰지 않는 열 (no 는 기존 번호 유지, place_id 는 판정 결과, 상호명 / 주소는 기존 행 기준)
+KEEP_FIELDS = ('no', 'place_id', 'place_name', 'address')
+# 같은 키 / 거부한 행 예시 출력 개수
+MAX_REPORT_SAMPLES = 10
+# merge_all_restaurants.py 등의 한글 헤더
+COLUMN_ALIASES = {
+    '연번': 'no', '미디어타입': 'media_type', '제목': 'title', '장소명': 'place_name', '장소타입': 'place_type',
+    '장소설명': 'description', '영업시간': 'opening_hours', '브레이크타임': 'break_time', '휴무일': 'closed_days',
+    '주소': 'address', '위도': 'latitude', '경도': 'longitude', '전화번호': 'phone', '최종작성일': 'last_updated',
+}
+
+
+def is_missing(value):
+    return value is None or str(value).strip() in MISSING_VALUES
+
+
+def _clean(value):
+    """새 행에 쓸 값 (nan / None 은 빈 값, 정보없음은 그대로)"""
+    value = '' if value is None else str(value).strip()
+    return '' if value in ('nan', 'None') else value
+
+
+def read_batch(path):
+    """병합할 CSV 를 영문 헤더 dict 목록으로 (헤더 앞의 설명 줄은 건너뜀, UTF-8 / CP949)
+
+    필드가 헤더보다 많은 행은 남는 값을 None 키에, 모자란 행은 빈 열을 None 값으로 남김 (misaligned 로 거부)
+    """
+    for encoding in ('utf-8-sig', 'cp949'):
+        try:
+            with open(path, 'r', encoding=encoding) as f:
+                lines = f.readlines()
+            break
+        except UnicodeDecodeError:
+            continue
+    else:
+        raise ValueError(f"지원하지 않는 인코딩: {path}")
+
+    start = next((i for i, line in enumerate(lines) if 'place_name' in line or '장소명' in line), 0)
+    reader = csv.DictReader(io.StringIO(''.join(lines[start:])))
+    return [{COLUMN_ALIASES.get(k.strip(), k.strip()) if k else None: v for k, v in row.items()} for row in reader]
+
+
+def misaligned(row):
+    """필드 수가 헤더와 다른 행인지 (csv.DictReader 의 남는 값 / 빈 열)"""
+    return None in row or any(v is None for v in row.values())
+
+
+def bad_coords(row):
+    """위도 / 경도가 있는데 숫자가 아니거나 한국 범위 밖인지 (둘 다 비어 있으면 False)"""
+    if is_missing(row.get('latitude')) and is_missing(row.get('longitude')):
+        return False
+    lat, lng = to_float(row.get('latitude')), to_float(row.get('longitude'))
+    return not (LAT_RANGE[0] <= lat <= LAT_RANGE[1] and LNG_RANGE[0] <= lng <= LNG_RANGE[1])
+
+
+def scan_records(f):
+    """바이너리 파일에서 CSV 레코드마다 (바이트 위치, 길이, 필드 목록), 따옴표 안 줄바꿈 포함"""
+    offset = f.tell()
+    pending = b''
+    for line in iter(f.readline, b''):
+        pending += line
+        if pending.count(b'"') % 2:
+            continue
+        text = pending.decode('utf-8')
+        if text.strip():
+            yield offset, len(pending), next(csv.reader(io.StringIO(text)))
+        offset += len(pending)
+        pending = b''
+
+
+def encode_row(fieldnames, row):
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator='\n').writerow([row.get(field, '') for field in fieldnames])
+    return buffer.getvalue().encode('utf-8')
+
+
+def _cell(lat, lng):
+    return math.floor(lat / CELL_DEGREES), math.floor(lng / CELL_DEGREES)
+
+
+def _coords(row):
+    lat, lng = to_float(row.get('latitude')), to_float(row.get('longitude'))
+    if math.isfinite(lat) and math.isfinite(lng) and lat and lng:
+        return lat, lng
+    return None
+
+
+class LocationIndex:
+    """locations.csv 키 색인 (SQLite)"""
+
+    def __init__(self, path=None, index_path=None):
+        self.path = os.path.abspath(path or LOCATIONS_FILE)
+        self.conn = sqlite3.connect(index_path or INDEX_FILE)
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            for table in ('meta', 'rows', 'addresses', 'cells', 'phones'):
+                self.conn.execute(f"DROP TABLE IF EXISTS {table}")
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        # rows 는 키가 겹치는 행도 모두 넣음 (겹치는 키는 ambiguous_keys 로 보고, 병합하지 않음)
+        self.conn.executescript(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);"
+            "CREATE TABLE IF NOT EXISTS rows ("
+            " place_id TEXT, title TEXT, no INTEGER, offset INTEGER, length INTEGER, name TEXT, region TEXT);"
+            "CREATE INDEX IF NOT EXISTS rows_key ON rows (place_id, title);"
+            "CREATE INDEX IF NOT EXISTS rows_title ON rows (title, region);"
+            "CREATE INDEX IF NOT EXISTS rows_offset ON rows (offset);"
+            "CREATE TABLE IF NOT EXISTS addresses (address TEXT, place_id TEXT, name TEXT);"
+            "CREATE INDEX IF NOT EXISTS addresses_address ON addresses (address);"
+            "CREATE TABLE IF NOT EXISTS cells (cx INTEGER, cy INTEGER, lat REAL, lng REAL, place_id TEXT, name TEXT);"
+            "CREATE INDEX IF NOT EXISTS cells_cell ON cells (cx, cy);"
+            "CREATE TABLE IF NOT EXISTS phones (phone TEXT, place_id TEXT, region TEXT, name TEXT);"
+            "CREATE INDEX IF NOT EXISTS phones_phone ON phones (phone);"
+        )
+        self.conn.commit()
+        self.fieldnames = None
+        self.max_no = 0
+
+    def _meta(self, key):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, **values):
+        self.conn.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                              [(k, str(v)) for k, v in values.items()])
+
+    def _file_state(self):
+        stat = os.stat(self.path)
+        return f"{self.path}|{stat.st_size}|{stat.st_mtime_ns}"
+
+    def is_current(self):
+        return self._meta('state') == self._file_state()
+
+    def load(self):
+        """색인이 파일과 맞으면 그대로, 아니면 다시 만듦 (다시 만들었으면 True)"""
+        rebuilt = False
+        if not self.is_current():
+            self.rebuild()
+            rebuilt = True
+        self.fieldnames = self._meta('header').split(',')
+        self.max_no = int(self._meta('max_no'))
+        return rebuilt
+
+    def rebuild(self):
+        """파일 전체를 한 번 읽어 색인 만들기"""
+        conn = self.conn
+        for table in ('meta', 'rows', 'addresses', 'cells', 'phones'):
+            conn.execute(f"DELETE FROM {table}")
+
+        max_no = 0
+        with open(self.path, 'rb') as f:
+            if f.read(3) != b'\xef\xbb\xbf':
+                f.seek(0)
+            fieldnames = next(csv.reader([f.readline().decode('utf-8')]))
+            if 'place_id' not in fieldnames:
+                raise ValueError("place_id 열이 없습니다. 먼저 place_ids.py 를 실행하세요.")
+            for offset, length, values in scan_records(f):
+                row = dict(zip(fieldnames, values))
+                no = row.get('no', '')
+                no = int(no) if no.isdigit() else None
+                if no:
+                    max_no = max(max_no, no)
+                if row.get('place_id'):
+                    self.add_row(row['place_id'], row, no, offset, length)
+                    self.add_place(row['place_id'], row)
+
+        self._set_meta(header=','.join(fieldnames), max_no=max_no, state=self._file_state())
+        conn.commit()
+
+    def add_row(self, place_id, row, no, offset, length):
+        self.conn.execute("INSERT INTO rows VALUES (?, ?, ?, ?, ?, ?, ?)",
+                          (place_id, row.get('title', '').strip(), no, offset, length,
+                           row.get('place_name') or '', ' '.join(region_tokens(row.get('address')))))
+
+    def add_place(self, place_id, row):
+        """place_id 판정용 주소 / 좌표 / 전화번호 색인에 행 추가"""
+        name = row.get('place_name') or ''
+        address = normalize_address(row.get('address'))
+        if address and not is_partial_address(address):
+            self.conn.execute("INSERT INTO addresses VALUES (?, ?, ?)", (address, place_id, name))
+        coords = _coords(row)
+        if coords:
+            self.conn.execute("INSERT INTO cells VALUES (?, ?, ?, ?, ?, ?)", (*_cell(*coords), *coords, place_id, name))
+        phone = phone_key(row)
+        if phone:
+            region = ' '.join(region_tokens(row.get('address')))
+            self.conn.execute("INSERT INTO phones VALUES (?, ?, ?, ?)", (phone, place_id, region, name))
+
+    def find_place(self, row, registry):
+        """기존 장소의 place_id (place_ids.link_rows 와 같은 연결 기준), 없으면 None"""
+        place_id = registry.lookup(content_key(row)) if content_key(row) else None
+        if place_id:
+            return place_id
+
+        branch = branch_name(row.get('place_name'))
+
+        def similar(name, threshold=SAME_PLACE_NAME_SIMILARITY):
+            other = branch_name(name)
+            if branch and other and branch != other:
+                return False
+            return name_similarity(row.get('place_name'), name) >= threshold
+
+        address = normalize_address(row.get('address'))
+        if address and not is_partial_address(address):
+            for place_id, name in self.conn.execute(
+                    "SELECT place_id, name FROM addresses WHERE address = ?", (address,)):
+                if similar(name):
+                    return registry.resolve(place_id)
+
+        coords = _coords(row)
+        if coords:
+            cx, cy = _cell(*coords)
+            for lat, lng, place_id, name in self.conn.execute(
+                    "SELECT lat, lng, place_id, name FROM cells WHERE cx BETWEEN ? AND ? AND cy BETWEEN ? AND ?",
+                    (cx - 1, cx + 1, cy - 1, cy + 1)):
+                if _haversine_scalar(coords[0], coords[1], lat, lng) <= COORD_RADIUS and similar(name):
+                    return registry.resolve(place_id)
+
+        phone = phone_key(row)
+        if phone:
+            region = ' '.join(region_tokens(row.get('address')))
+            for place_id, name in self.conn.execute(
+                    "SELECT place_id, name FROM phones WHERE phone = ? AND region = ?", (phone, region)):
+                if similar(name, MIN_NAME_SIMILARITY):
+                    return registry.resolve(place_id)
+        return None
+
+    def lookup(self, place_id, title):
+        """키에 해당하는 (no, 바이트 위치, 길이) 목록 (없으면 빈 목록, 둘 이상이면 모호한 키)"""
+        return self.conn.execute("SELECT no, offset, length FROM rows WHERE place_id = ? AND title = ? ORDER BY offset",
+                                 (place_id, title)).fetchall()
+
+    def same_title_rows(self, row, place_id):
+        """다른 place_id 로 같은 작품 + 같은 시/군/구 + 비슷한 상호명 (지점명이 다르면 제외) 인 기존 행의 no 목록"""
+        branch = branch_name(row.get('place_name'))
+        matches = []
+        for no, other, name in self.conn.execute(
+                "SELECT no, place_id, name FROM rows WHERE title = ? AND region = ? AND place_id != ?",
+                ((row.get('title') or '').strip(), ' '.join(region_tokens(row.get('address'))), place_id)):
+            if branch and branch_name(name) and branch != branch_name(name):
+                continue
+            if name_similarity(row.get('place_name'), name) >= SAME_PLACE_NAME_SIMILARITY:
+                matches.append(no)
+        return matches
+
+    def ambiguous_keys(self):
+        """행이 둘 이상인 키의 (place_id, title, 행 번호 목록)"""
+        return [(place_id, title, [int(no) for no in nos.split(',') if no])
+                for place_id, title, nos in self.conn.execute(
+                    "SELECT place_id, title, group_concat(no) FROM rows"
+                    " GROUP BY place_id, title HAVING count(*) > 1 ORDER BY min(offset)")]
+
+
+def merge_row(fieldnames, current, incoming):
+    """기존 행에 들어온 값 반영 (KEEP_FIELDS / 빈 값 / 정보없음 / 같은 좌표는 무시), 바뀌었으면 새 행 dict, 아니면 None"""
+    merged = dict(current)
+    changed = False
+    for field in fieldnames:
+        if field in KEEP_FIELDS or field not in incoming or is_missing(incoming[field]):
+            continue
+        value = str(incoming[field]).strip()
+        if field in ('latitude', 'longitude') and to_float(value) == to_float(current.get(field)):
+            continue
+        if value != current.get(field, ''):
+            merged[field] = value
+            changed = True
+    return merged if changed else None
+
+
+def upsert(batch, path=None, index_path=None, registry=None, title=None, require_coords=False, dry_run=False):
+    """batch (dict 목록) 를 locations.csv 에 병합, 통계 dict 반환 (dry_run 이면 파일 / 색인 / 등록부 그대로)"""
+    started = time.perf_counter()
+    index = LocationIndex(path, index_path)
+    stats = defaultdict(int)
+    stats['rebuilt'] = index.load()
+    stats['ambiguous_keys'] = len(index.ambiguous_keys())
+    fieldnames = index.fieldnames
+    registry = registry or PlaceRegistry()
+    taken = registry.known_ids()
+    day = time.strftime('%Y-%m-%d')
+
+    updates = {}   # 바이트 위치 -> (기존 길이, 새 바이트)
+    inserts = []   # (place_id, title, no, 새 바이트)
+    seen = set()
+    next_no = index.max_no
+
+    def accept(row, place_id, is_new):
+        """받아들인 행의 새 ID / 등록부 키 기록 (거부한 행은 등록부에 남기지 않음)"""
+        if is_new:
+            taken.add(place_id)
+            stats['new_places'] += 1
+        for key in (content_key(row), phone_key(row)):
+            if key and registry.lookup(key) in (None, place_id):
+                registry.set(key, place_id, day)
+
+    def reject(reason, row, detail=''):
+        stats['rejected'] += 1
+        if len(stats.setdefault('rejected_samples', [])) < MAX_REPORT_SAMPLES:
+            stats['rejected_samples'].append((reason, row.get('place_name'), row.get('title'), detail))
+
+    with open(index.path, 'rb') as f:
+        for incoming in batch:
+            if misaligned(incoming):
+                reject('필드 수가 헤더와 다름 (열 밀림)', incoming)
+                continue
+            incoming = dict(incoming)
+            if title:
+                incoming['title'] = title
+            row_title = (incoming.get('title') or '').strip()
+            if is_missing(incoming.get('place_name')) or not row_title:
+                stats['skipped'] += 1
+                continue
+            if bad_coords(incoming):
+                reject('좌표가 숫자가 아니거나 한국 밖', incoming,
+                       f"{incoming.get('latitude')}, {incoming.get('longitude')}")
+                continue
+            if require_coords and not _coords(incoming):
+                stats['skipped'] += 1
+                continue
+
+            place_id = registry.resolve(incoming['place_id']) if incoming.get('place_id') else None
+            place_id = place_id or index.find_place(incoming, registry)
+            is_new = not place_id
+            if is_new:
+                place_id = new_id(content_key(incoming), taken)
+
+            if (place_id, row_title) in seen:
+                stats['duplicates'] += 1
+                continue
+            seen.add((place_id, row_title))
+
+            found = index.lookup(place_id, row_title)
+            if len(found) > 1:
+                stats['ambiguous'] += 1
+                reject('같은 키의 행이 여럿', incoming, f"no {', '.join(str(no) for no, _, _ in found)}")
+                continue
+            if found:
+                no, offset, length = found[0]
+                f.seek(offset)
+                current = dict(zip(fieldnames, next(csv.reader(io.StringIO(f.read(length).decode('utf-8'))))))
+                if bad_coords(current):
+                    reject('기존 행의 좌표가 깨짐 (직접 고쳐야 함)', incoming, f"no {no}")
+                    continue
+                accept(incoming, place_id, is_new)
+                merged = merge_row(fieldnames, current, incoming)
+                if merged is None:
+                    stats['unchanged'] += 1
+                    continue
+                updates[offset] = (length, encode_row(fieldnames, merged))
+                stats['updated'] += 1
+            else:
+                existing = index.same_title_rows(incoming, place_id)
+                if existing:
+                    reject('같은 작품에 비슷한 상호명 행이 이미 있음', incoming, f"no {', '.join(map(str, existing))}")
+                    continue
+                accept(incoming, place_id, is_new)
+                next_no += 1
+                row = {field: _clean(incoming.get(field)) for field in fieldnames}
+                row['no'] = str(next_no)
+                row['place_id'] = place_id
+                inserts.append((row, next_no, encode_row(fieldnames, row)))
+                index.add_place(place_id, row)
+                stats['inserted'] += 1
+
+    if dry_run or not (updates or inserts):
+        index.conn.rollback()
+        stats['seconds'] = time.perf_counter() - started
+        return dict(stats)
+
+    # 쓰는 도중 중단되면 다음 실행에서 색인을 다시 만들도록 상태를 먼저 지움
+    index.conn.execute("DELETE FROM meta WHERE key = 'state'")
+    index.conn.commit()
+
+    # 임시 사본에 쓰고 끝나면 바꿔 넣음 (중간에 멈춰도 원본 locations.csv 는 그대로)
+    temp_path = index.path + '.tmp'
+    shutil.copyfile(index.path, temp_path)
+    try:
+        with open(temp_path, 'r+b') as f:
+            _write_updates(index, f, updates, stats)
+            f.seek(0, os.SEEK_END)
+            end = f.tell()
+            f.seek(end - 1)
+            if f.read(1) != b'\n':
+                f.write(b'\n')
+                end += 1
+            for row, no, data in inserts:
+                f.write(data)
+                index.add_row(row['place_id'], row, no, end, len(data))
+                end += len(data)
+        os.replace(temp_path, index.path)
+    except BaseException:
+        index.conn.rollback()
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    index._set_meta(max_no=next_no, state=index._file_state())
+    index.conn.commit()
+    registry.flush()
+    stats['seconds'] = time.perf_counter() - started
+    return dict(stats)
+
+
+def _write_updates(index, f, updates, stats):
+    """바뀐 행 쓰기: 길이가 같으면 그 자리, 다르면 가장 앞의 그런 행부터 파일 끝까지 다시 씀"""
+    resized = [offset for offset, (length, data) in updates.items() if len(data) != length]
+    start = min(resized) if resized else None
+
+    for offset, (length, data) in sorted(updates.items()):
+        if start is None or offset < start:
+            f.seek(offset)
+            f.write(data)
+            stats['in_place'] += 1
+
+    if start is None:
+        return
+    f.seek(start)
+    tail = f.read()
+    pieces, position = [], start
+    for offset, (length, data) in sorted(updates.items()):
+        if offset < start:
+            continue
+        pieces.append(tail[position - start:offset - start])
+        pieces.append(data)
+        position = offset + length
+    pieces.append(tail[position - start:])
+    f.seek(start)
+    f.write(b''.join(pieces))
+    f.truncate()
+    stats['rewritten_bytes'] = len(tail)
+
+    # 뒤쪽 행의 바이트 위치를 한 번에 이동 (각 행 앞에서 길이가 바뀐 만큼 누적)
+    resized = sorted((offset, len(data) - length, len(data)) for offset, (length, data) in updates.items()
+                     if offset >= start and len(data) != length)
+    moved, shift, k = [], 0, 0
+    for rowid, offset in index.conn.execute("SELECT rowid, offset FROM rows WHERE offset >= ? ORDER BY offset",
+                                            (start,)).fetchall():
+        while k < len(resized) and resized[k][0] < offset:
+            shift += resized[k][1]
+            k += 1
+        if k < len(resized) and resized[k][0] == offset:
+            index.conn.execute("UPDATE rows SET length = ? WHERE rowid = ?", (resized[k][2], rowid))
+        if shift:
+            moved.append((offset + shift, rowid))
+    index.conn.executemany("UPDATE rows SET offset = ? WHERE rowid = ?", moved)
+
+
+def print_stats(stats, label=''):
+    print(f"[Upsert] {label}추가 {stats.get('inserted', 0)}, 갱신 {stats.get('updated', 0)}, "
+          f"그대로 {stats.get('unchanged', 0)}, 건너뜀 {stats.get('skipped', 0)}, "
+          f"배치 내 중복 {stats.get('duplicates', 0)}, 거부 {stats.get('rejected', 0)} "
+          f"(새 장소 {stats.get('new_places', 0)}), {stats.get('seconds', 0):.2f}초")
+    for reason, name, row_title, detail in stats.get('rejected_samples', []):
+        print(f"  거부 ({reason}): {name} / {row_title}{' -> ' + detail if detail else ''}")
+    if stats.get('rejected', 0) > len(stats.get('rejected_samples', [])):
+        print(f"  ... 외 {stats['rejected'] - len(stats['rejected_samples'])}개")
+    if stats.get('rebuilt'):
+        print("  색인을 다시 만들었습니다 (다른 스크립트가 locations.csv 를 고쳤거나 첫 실행)")
+    if stats.get('ambiguous_keys'):
+        print(f"  파일에 같은 키의 행이 여럿인 키 {stats['ambiguous_keys']}개 (python upsert_locations.py --rebuild 로 목록 확인)")
+    if stats.get('rewritten_bytes'):
+        print(f"  길이가 바뀐 행 뒤쪽 {stats['rewritten_bytes']:,}바이트를 다시 씀")
+
+
+def print_ambiguous(index):
+    """파일 안에서 같은 (place_id, title) 키를 가진 행 보고 (이 키들로는 병합하지 않음)"""
+    keys = index.ambiguous_keys()
+    if not keys:
+        return
+    print(f"  같은 (place_id, title) 키의 행이 여럿인 키 {len(keys)}개 - 이 키로 들어온 행은 건너뜀")
+    for place_id, row_title, nos in keys[:MAX_REPORT_SAMPLES]:
+        print(f"    {place_id} / {row_title}: no {', '.join(map(str, nos))}")
+
+
+def main(argv):
+    if '--rebuild' in argv:
+        started = time.perf_counter()
+        index = LocationIndex()
+        index.rebuild()
+        print(f"[Upsert] 색인 다시 만듦: {INDEX_FILE} ({time.perf_counter() - started:.2f}초)")
+        print_ambiguous(index)
+        return
+
+    paths = [a for i, a in enumerate(argv) if not a.startswith('--') and (i == 0 or argv[i - 1] != '--title')]
+    if not paths:
+        print(__doc__)
+        return
+    title = argv[argv.index('--title') + 1] if '--title' in argv else None
+    dry_run = '--dry-run' in argv
+
+    for path in paths:
+        stats = upsert(read_batch(path), title=title, require_coords='--require-coords' in argv, dry_run=dry_run)
+        print_stats(stats, f"{os.path.basename(path)}{' (dry-run)' if dry_run else ''}: ")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])